@@ -6,35 +6,25 @@ byceps.announce.announce
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from datetime import datetime
-from http import HTTPStatus
-from typing import Any
-
-import httpx
 import structlog
 
 from byceps.services.core.events import BaseEvent
 from byceps.services.webhooks import webhook_service
 from byceps.services.webhooks.models import (
+    Announcement,
     AnnouncementRequest,
     OutgoingWebhook,
-    OutgoingWebhookFormat,
 )
 from byceps.util.jobqueue import enqueue, enqueue_at
 
+from . import delivery
 from .connections import get_signals, registry
-
-
-DEFAULT_WEBHOOK_TIMEOUT = 15
+from .delivery import assemble_announcement_request
 
 
 log = structlog.get_logger()
 
 
-class WebhookError(Exception):
-    pass
-
-
 def enable_announcements() -> None:
     for signal in get_signals():
         signal.connect(_receive_signal)
@@ -46,8 +36,8 @@ def _receive_signal(sender, *, event: BaseEvent | None = None) -> None:
 
     event_name = get_name_for_event(event)
     webhooks = _get_webhooks(event_name)
-    for webhook in webhooks:
-        enqueue(_handle_event, event, webhook)
+    if webhooks:
+        enqueue(_handle_event, event, webhooks)
 
 
 def get_event_names() -> set[str]:
@@ -71,26 +61,43 @@ def _get_webhooks(event_name: str) -> list[OutgoingWebhook]:
     return webhooks
 
 
-def _handle_event(event: BaseEvent, webhook: OutgoingWebhook) -> None:
-    announcement_request = build_announcement_request(event, webhook)
-    if announcement_request is None:
+def _handle_event(event: BaseEvent, webhooks: list[OutgoingWebhook]) -> None:
+    for webhook in webhooks:
+        try:
+            _handle_event_for_webhook(event, webhook)
+        except Exception as exc:
+            # Do not keep the other webhooks from being announced to.
+            log.error(
+                'Announcing event to webhook failed',
+                webhook_id=str(webhook.id),
+                exc_info=exc,
+            )
+
+
+def _handle_event_for_webhook(
+    event: BaseEvent, webhook: OutgoingWebhook
+) -> None:
+    announcement = _build_announcement(event, webhook)
+    if announcement is None:
         return
 
-    announce(announcement_request)
+    if announcement.announce_at is not None:
+        announce(
+            assemble_announcement_request(
+                webhook,
+                announcement.text,
+                announce_at=announcement.announce_at,
+            )
+        )
+    else:
+        # Send together with other announcements for the webhook.
+        delivery.submit(webhook, announcement.text)
 
 
 def build_announcement_request(
     event: BaseEvent, webhook: OutgoingWebhook
 ) -> AnnouncementRequest | None:
-    event_type = type(event)
-
-    handler = registry.get_handler_for_event_type(event_type)
-    if handler is None:
-        return None
-
-    event_name = get_name_for_event(event)
-
-    announcement = handler(event_name, event, webhook)
+    announcement = _build_announcement(event, webhook)
     if announcement is None:
         return None
 
@@ -99,92 +106,25 @@ def build_announcement_request(
     )
 
 
-def assemble_announcement_request(
-    webhook: OutgoingWebhook, text: str, *, announce_at: datetime | None = None
-) -> AnnouncementRequest:
-    data = _assemble_request_data(webhook, text)
-    expected_response_status_code = _EXPECTED_RESPONSE_STATUS_CODES.get(
-        webhook.format
-    )
-
-    return AnnouncementRequest(
-        webhook_id=webhook.id,
-        url=webhook.url,
-        data=data,
-        expected_response_status_code=expected_response_status_code,
-        announce_at=announce_at,
-    )
-
-
-def _assemble_request_data(
-    webhook: OutgoingWebhook, text: str
-) -> dict[str, Any]:
-    text_prefix = webhook.text_prefix
-    if text_prefix:
-        text = text_prefix + text
-
-    match webhook.format:
-        case OutgoingWebhookFormat.discord:
-            return {'content': text}
-
-        case OutgoingWebhookFormat.matrix_webhook:
-            key = webhook.extra_fields.get('key')
-            if not key:
-                log.warning('No API key specified with Matrix webhook.')
-
-            room_id = webhook.extra_fields.get('room_id')
-            if not room_id:
-                log.warning('No room ID specified with Matrix webhook.')
-
-            return {'key': key, 'room_id': room_id, 'body': text}
-
-        case OutgoingWebhookFormat.mattermost:
-            return {'text': text}
+def _build_announcement(
+    event: BaseEvent, webhook: OutgoingWebhook
+) -> Announcement | None:
+    event_type = type(event)
 
-        case OutgoingWebhookFormat.weitersager:
-            channel = webhook.extra_fields.get('channel')
-            if not channel:
-                log.warning('No channel specified with IRC webhook.')
+    handler = registry.get_handler_for_event_type(event_type)
+    if handler is None:
+        return None
 
-            return {'channel': channel, 'text': text}
+    event_name = get_name_for_event(event)
 
-        case _:
-            return {}
+    return handler(event_name, event, webhook)
 
 
 def announce(announcement_request: AnnouncementRequest) -> None:
     announce_at = announcement_request.announce_at
     if announce_at is not None:
         # Schedule job to announce later.
-        enqueue_at(announce_at, call_webhook, announcement_request)
+        enqueue_at(announce_at, delivery.deliver, [announcement_request])
     else:
         # Announce now.
-        call_webhook(announcement_request)
-
-
-def call_webhook(announcement_request: AnnouncementRequest) -> None:
-    """Send HTTP request to the webhook."""
-    response = httpx.post(
-        announcement_request.url,
-        json=announcement_request.data,
-        timeout=DEFAULT_WEBHOOK_TIMEOUT,
-    )
-
-    expected_response_code = announcement_request.expected_response_status_code
-    if expected_response_code is None:
-        return
-
-    actual_response_code = response.status_code
-    if actual_response_code != expected_response_code:
-        raise WebhookError(
-            f'Endpoint for webhook {announcement_request.webhook_id} '
-            f'returned unexpected status code {actual_response_code}'
-        )
-
-
-_EXPECTED_RESPONSE_STATUS_CODES = {
-    OutgoingWebhookFormat.discord: HTTPStatus.NO_CONTENT,
-    OutgoingWebhookFormat.matrix_webhook: HTTPStatus.OK,
-    OutgoingWebhookFormat.mattermost: HTTPStatus.OK,
-    OutgoingWebhookFormat.weitersager: HTTPStatus.ACCEPTED,
-}
+        delivery.deliver([announcement_request])
@@ -0,0 +1,434 @@
+"""
+byceps.announce.delivery
+~~~~~~~~~~~~~~~~~~~~~~~~
+
+Delivery of announcements to webhooks.
+
+Announcements to be made right away are not sent one by one. Instead,
+they are buffered per webhook (in Redis) for a short time and then sent
+together: as a single multi-line message if the webhook's format allows
+for it, otherwise as separate messages over the same HTTP connection.
+
+Rate limits signaled by an endpoint (HTTP status 429, with the delay
+from a `Retry-After` header, if present) and temporary failures are
+honored by pausing delivery to that webhook and retrying later, with
+exponential backoff.
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+from http import HTTPStatus
+import os
+from typing import Any
+
+import httpx
+import structlog
+
+from byceps.byceps_app import get_current_byceps_app
+from byceps.services.webhooks.models import (
+    AnnouncementRequest,
+    OutgoingWebhook,
+    OutgoingWebhookFormat,
+    WebhookID,
+)
+from byceps.util.jobqueue import enqueue_at
+
+
+DEFAULT_WEBHOOK_TIMEOUT = 15
+
+# How long to collect announcements before sending them together.
+COALESCING_DELAY = timedelta(seconds=2)
+
+# Drop buffered announcements if they have not been sent for this long
+# (e.g. because the job to send them got lost).
+BUFFER_TTL = timedelta(minutes=10)
+
+# How long after its scheduled time a job to send buffered announcements
+# may run late before it is assumed to be lost (and the next
+# announcement schedules another one).
+FLUSH_SCHEDULED_MARGIN = timedelta(seconds=30)
+
+MAX_DELIVERY_ATTEMPTS = 5
+BASE_RETRY_DELAY = timedelta(seconds=2)
+
+KEY_PREFIX = 'announce:webhooks'
+
+
+log = structlog.get_logger()
+
+
+class WebhookError(Exception):
+    pass
+
+
+# buffering
+
+
+def submit(webhook: OutgoingWebhook, text: str) -> None:
+    """Buffer the announcement text to be sent to the webhook shortly,
+    together with other announcements for that webhook.
+    """
+    if not get_current_byceps_app().byceps_config.jobs.asynchronous:
+        # Without workers, nobody would send buffered announcements.
+        call_webhook(assemble_announcement_request(webhook, text))
+        return
+
+    buffer_key = _get_buffer_key(webhook.id)
+
+    pipeline = get_current_byceps_app().redis_client.pipeline()
+    pipeline.rpush(buffer_key, text)
+    pipeline.expire(buffer_key, BUFFER_TTL)
+    pipeline.set(
+        _get_flush_scheduled_key(webhook.id),
+        1,
+        nx=True,
+        ex=COALESCING_DELAY + FLUSH_SCHEDULED_MARGIN,
+    )
+    _, _, flush_scheduled_now = pipeline.execute()
+
+    if flush_scheduled_now:
+        # Nobody has scheduled sending the buffered announcements yet
+        # (or the job that was scheduled is overdue and presumably lost).
+        send_at = datetime.utcnow() + COALESCING_DELAY
+        enqueue_at(send_at, flush_buffer, webhook)
+
+
+def flush_buffer(webhook: OutgoingWebhook) -> None:
+    """Send the announcements buffered for the webhook."""
+    texts = _pop_buffered_texts(webhook.id)
+    if not texts:
+        return
+
+    announcement_requests = build_batched_announcement_requests(webhook, texts)
+
+    deliver(announcement_requests)
+
+
+def _pop_buffered_texts(webhook_id: WebhookID) -> list[str]:
+    buffer_key = _get_buffer_key(webhook_id)
+
+    pipeline = get_current_byceps_app().redis_client.pipeline()
+    # Clear the marker first so that announcements submitted from now
+    # on schedule another job.
+    pipeline.delete(_get_flush_scheduled_key(webhook_id))
+    pipeline.lrange(buffer_key, 0, -1)
+    pipeline.delete(buffer_key)
+    _, texts, _ = pipeline.execute()
+
+    return [text.decode('utf-8') for text in texts]
+
+
+# request assembly
+
+
+def build_batched_announcement_requests(
+    webhook: OutgoingWebhook, texts: list[str]
+) -> list[AnnouncementRequest]:
+    """Combine the texts into as few requests as the webhook's format
+    allows for.
+    """
+    if webhook.format not in _MULTI_LINE_FORMATS:
+        return [assemble_announcement_request(webhook, text) for text in texts]
+
+    lines = [_prefix_text(webhook, text) for text in texts]
+    max_length = _MAX_TEXT_LENGTHS.get(webhook.format)
+
+    return [
+        _build_announcement_request(webhook, '\n'.join(chunk), None)
+        for chunk in _chunk_lines(lines, max_length)
+    ]
+
+
+def _chunk_lines(
+    lines: list[str], max_length: int | None
+) -> Iterator[list[str]]:
+    """Group consecutive lines so that each group, joined by line
+    breaks, does not exceed the maximum length.
+
+    A single line that exceeds the maximum length forms a group of its
+    own.
+    """
+    chunk: list[str] = []
+    chunk_length = 0
+
+    for line in lines:
+        joined_length = chunk_length + 1 + len(line) if chunk else len(line)
+
+        if chunk and (max_length is not None) and (joined_length > max_length):
+            yield chunk
+            chunk = []
+            joined_length = len(line)
+
+        chunk.append(line)
+        chunk_length = joined_length
+
+    if chunk:
+        yield chunk
+
+
+def assemble_announcement_request(
+    webhook: OutgoingWebhook, text: str, *, announce_at: datetime | None = None
+) -> AnnouncementRequest:
+    return _build_announcement_request(
+        webhook, _prefix_text(webhook, text), announce_at
+    )
+
+
+def _build_announcement_request(
+    webhook: OutgoingWebhook, text: str, announce_at: datetime | None
+) -> AnnouncementRequest:
+    data = _assemble_request_data(webhook, text)
+    expected_response_status_code = _EXPECTED_RESPONSE_STATUS_CODES.get(
+        webhook.format
+    )
+
+    return AnnouncementRequest(
+        webhook_id=webhook.id,
+        url=webhook.url,
+        data=data,
+        expected_response_status_code=expected_response_status_code,
+        announce_at=announce_at,
+    )
+
+
+def _prefix_text(webhook: OutgoingWebhook, text: str) -> str:
+    text_prefix = webhook.text_prefix
+    if text_prefix:
+        text = text_prefix + text
+
+    return text
+
+
+def _assemble_request_data(
+    webhook: OutgoingWebhook, text: str
+) -> dict[str, Any]:
+    match webhook.format:
+        case OutgoingWebhookFormat.discord:
+            return {'content': text}
+
+        case OutgoingWebhookFormat.matrix_webhook:
+            key = webhook.extra_fields.get('key')
+            if not key:
+                log.warning('No API key specified with Matrix webhook.')
+
+            room_id = webhook.extra_fields.get('room_id')
+            if not room_id:
+                log.warning('No room ID specified with Matrix webhook.')
+
+            return {'key': key, 'room_id': room_id, 'body': text}
+
+        case OutgoingWebhookFormat.mattermost:
+            return {'text': text}
+
+        case OutgoingWebhookFormat.weitersager:
+            channel = webhook.extra_fields.get('channel')
+            if not channel:
+                log.warning('No channel specified with IRC webhook.')
+
+            return {'channel': channel, 'text': text}
+
+        case _:
+            return {}
+
+
+# sending
+
+
+def deliver(
+    announcement_requests: list[AnnouncementRequest], attempt: int = 1
+) -> None:
+    """Send the requests (all to the same webhook) in order.
+
+    If the endpoint asks to slow down or is temporarily unavailable,
+    retry the remaining requests later.
+    """
+    if not announcement_requests:
+        return
+
+    webhook_id = announcement_requests[0].webhook_id
+
+    pause = _get_remaining_pause(webhook_id)
+    if pause is not None:
+        # Another delivery to this webhook has been told to wait.
+        _deliver_later(announcement_requests, attempt, pause)
+        return
+
+    for index, announcement_request in enumerate(announcement_requests):
+        retry_delay = _send(announcement_request, attempt)
+        if retry_delay is not None:
+            if attempt >= MAX_DELIVERY_ATTEMPTS:
+                raise WebhookError(
+                    f'Giving up on webhook {webhook_id} '
+                    f'after {attempt:d} attempts'
+                )
+
+            _pause_webhook(webhook_id, retry_delay)
+            _deliver_later(
+                announcement_requests[index:], attempt + 1, retry_delay
+            )
+            return
+
+
+def _deliver_later(
+    announcement_requests: list[AnnouncementRequest],
+    attempt: int,
+    delay: timedelta,
+) -> None:
+    deliver_at = datetime.utcnow() + delay
+    enqueue_at(deliver_at, deliver, announcement_requests, attempt)
+
+
+def _send(
+    announcement_request: AnnouncementRequest, attempt: int
+) -> timedelta | None:
+    """Send the request.
+
+    Return the delay after which to retry, or `None` if no retry is
+    necessary.
+    """
+    try:
+        response = _get_http_client().post(
+            announcement_request.url, json=announcement_request.data
+        )
+    except httpx.TransportError as exc:
+        log.warning(
+            'Calling webhook failed',
+            webhook_id=str(announcement_request.webhook_id),
+            exc_info=exc,
+        )
+        return _get_backoff_delay(attempt)
+
+    if response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+        log.info(
+            'Webhook endpoint is rate limiting',
+            webhook_id=str(announcement_request.webhook_id),
+        )
+        return _get_retry_after(response) or _get_backoff_delay(attempt)
+
+    if response.is_server_error:
+        return _get_backoff_delay(attempt)
+
+    _check_response_status(announcement_request, response)
+
+    return None
+
+
+def call_webhook(announcement_request: AnnouncementRequest) -> None:
+    """Send HTTP request to the webhook."""
+    response = _get_http_client().post(
+        announcement_request.url, json=announcement_request.data
+    )
+
+    _check_response_status(announcement_request, response)
+
+
+def _check_response_status(
+    announcement_request: AnnouncementRequest, response: httpx.Response
+) -> None:
+    expected_response_code = announcement_request.expected_response_status_code
+    if expected_response_code is None:
+        return
+
+    actual_response_code = response.status_code
+    if actual_response_code != expected_response_code:
+        raise WebhookError(
+            f'Endpoint for webhook {announcement_request.webhook_id} '
+            f'returned unexpected status code {actual_response_code}'
+        )
+
+
+def _get_retry_after(response: httpx.Response) -> timedelta | None:
+    value = response.headers.get('Retry-After')
+    if value is None:
+        return None
+
+    try:
+        return timedelta(seconds=float(value))
+    except ValueError:
+        # An HTTP date instead of a number of seconds is not supported.
+        return None
+
+
+def _get_backoff_delay(attempt: int) -> timedelta:
+    return BASE_RETRY_DELAY * 2 ** (attempt - 1)
+
+
+def _pause_webhook(webhook_id: WebhookID, delay: timedelta) -> None:
+    """Keep other deliveries to the webhook from sending for a while."""
+    get_current_byceps_app().redis_client.set(
+        _get_pause_key(webhook_id), 1, px=delay
+    )
+
+
+def _get_remaining_pause(webhook_id: WebhookID) -> timedelta | None:
+    milliseconds = get_current_byceps_app().redis_client.pttl(
+        _get_pause_key(webhook_id)
+    )
+    if milliseconds <= 0:
+        return None
+
+    return timedelta(milliseconds=milliseconds)
+
+
+class _HttpClientHolder:
+    """Create an HTTP client lazily per process, then reuse it so that
+    requests can share pooled connections.
+    """
+
+    def __init__(self) -> None:
+        self._client: httpx.Client | None = None
+        self._pid: int | None = None
+
+    def get(self) -> httpx.Client:
+        pid = os.getpid()
+        if self._client is None or self._pid != pid:
+            # Do not share connections with the parent of a forked
+            # process.
+            self._client = httpx.Client(timeout=DEFAULT_WEBHOOK_TIMEOUT)
+            self._pid = pid
+
+        return self._client
+
+
+_http_client_holder = _HttpClientHolder()
+
+
+def _get_http_client() -> httpx.Client:
+    return _http_client_holder.get()
+
+
+def _get_buffer_key(webhook_id: WebhookID) -> str:
+    return f'{KEY_PREFIX}:{webhook_id}:buffer'
+
+
+def _get_flush_scheduled_key(webhook_id: WebhookID) -> str:
+    return f'{KEY_PREFIX}:{webhook_id}:flush_scheduled'
+
+
+def _get_pause_key(webhook_id: WebhookID) -> str:
+    return f'{KEY_PREFIX}:{webhook_id}:paused'
+
+
+# IRC does not support multi-line messages.
+_MULTI_LINE_FORMATS = frozenset(
+    [
+        OutgoingWebhookFormat.discord,
+        OutgoingWebhookFormat.matrix_webhook,
+        OutgoingWebhookFormat.mattermost,
+    ]
+)
+
+_MAX_TEXT_LENGTHS = {
+    OutgoingWebhookFormat.discord: 2000,
+    OutgoingWebhookFormat.mattermost: 16383,
+}
+
+_EXPECTED_RESPONSE_STATUS_CODES = {
+    OutgoingWebhookFormat.discord: HTTPStatus.NO_CONTENT,
+    OutgoingWebhookFormat.matrix_webhook: HTTPStatus.OK,
+    OutgoingWebhookFormat.mattermost: HTTPStatus.OK,
+    OutgoingWebhookFormat.weitersager: HTTPStatus.ACCEPTED,
+}
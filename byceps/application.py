@@ -6,6 +6,7 @@ byceps.application
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+import atexit
 from datetime import timedelta
 from typing import Any
 
@@ -34,10 +35,18 @@ from byceps.config.models import (
 )
 from byceps.database import db
 from byceps.services.jobs.blueprints.admin.views import enable_rq_dashboard
+from byceps.services.shop.order import order_sequence_service
 from byceps.services.site.models import SiteID
 from byceps.util import templatefilters
 from byceps.util.authz import load_permissions
+from byceps.util.fragment_cache_invalidation import (
+    enable_fragment_cache_invalidation,
+)
 from byceps.util.l10n import get_current_user_locale
+from byceps.util.request_instrumentation import (
+    enable_request_instrumentation,
+    InstrumentedRedis,
+)
 from byceps.util.templating import create_site_template_loader
 
 from .byceps_app import BycepsApp, create_byceps_app
@@ -115,8 +124,16 @@ def _create_app(
     # Initialize database.
     db.init_app(app)
 
+    request_instrumentation_enabled = (
+        byceps_config.metrics.request_instrumentation_enabled
+        and (app_mode.is_admin() or app_mode.is_site())
+    )
+
     # Initialize Redis client.
-    app.redis_client = Redis.from_url(app.config['REDIS_URL'])
+    redis_class = (
+        InstrumentedRedis if request_instrumentation_enabled else Redis
+    )
+    app.redis_client = redis_class.from_url(app.config['REDIS_URL'])
 
     load_permissions()
 
@@ -127,6 +144,14 @@ def _create_app(
     )
     app.byceps_feature_states['metrics'] = metrics_enabled
 
+    # Enable before registering blueprints so that measuring starts
+    # before any other request preprocessing.
+    if request_instrumentation_enabled:
+        enable_request_instrumentation(app)
+    app.byceps_feature_states['request_instrumentation'] = (
+        request_instrumentation_enabled
+    )
+
     style_guide_enabled = byceps_config.development.style_guide_enabled and (
         app_mode.is_admin() or app_mode.is_site()
     )
@@ -147,6 +172,14 @@ def _create_app(
     _add_static_file_url_rules(app)
 
     enable_announcements()
+    enable_fragment_cache_invalidation()
+
+    shop_config = byceps_config.shop
+    if (
+        shop_config.order_number_block_size > 1
+        and shop_config.release_unused_order_numbers
+    ):
+        atexit.register(_release_unused_order_numbers, app)
 
     debug_toolbar_enabled = (
         byceps_config.development.toolbar_enabled
@@ -268,6 +301,14 @@ def _enable_rq_dashboard(app: BycepsApp) -> None:
     app.byceps_feature_states['rq_dashboard'] = True
 
 
+def _release_unused_order_numbers(app: BycepsApp) -> None:
+    with app.app_context():
+        released_count = order_sequence_service.release_unused_order_numbers()
+
+    if released_count:
+        log.info('Unused order numbers released', count=released_count)
+
+
 def _log_app_state(app: BycepsApp) -> None:
     event_kw = {'app_mode': app.byceps_app_mode.name}
 
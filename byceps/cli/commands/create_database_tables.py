@@ -17,6 +17,7 @@ from pathlib import Path
 
 import click
 from flask.cli import with_appcontext
+from sqlalchemy import text
 
 import byceps
 from byceps.database import db
@@ -31,12 +32,21 @@ def create_database_tables() -> None:
 
 def _create_database_tables() -> None:
     click.echo('Creating database tables ... ', nl=False)
-    _load_dbmodels()
+    create_database_extensions()
+    load_dbmodels()
     db.create_all()
     click.secho('done.', fg='green')
 
 
-def _load_dbmodels() -> None:
+def create_database_extensions() -> None:
+    """Create the PostgreSQL extensions some indexes depend on."""
+    # trigram indexes (for user search)
+    db.session.execute(text('CREATE EXTENSION IF NOT EXISTS pg_trgm'))
+    db.session.commit()
+
+
+def load_dbmodels() -> None:
+    """Import all database models so that their tables are known."""
     paths = _collect_dbmodel_paths()
     module_names = map(_get_module_name_for_path, paths)
     for module_name in module_names:
@@ -59,6 +59,7 @@ class BycepsConfig:
     metrics: MetricsConfig
     payment_gateways: PaymentGatewaysConfig | None
     redis: RedisConfig
+    shop: ShopConfig
     smtp: SmtpConfig
 
 
@@ -141,6 +142,7 @@ class JobsConfig:
 @dataclass(frozen=True, kw_only=True, slots=True)
 class MetricsConfig:
     enabled: bool
+    request_instrumentation_enabled: bool
 
 
 @dataclass(frozen=True, kw_only=True, slots=True)
@@ -162,6 +164,12 @@ class RedisConfig:
     url: str
 
 
+@dataclass(frozen=True, kw_only=True, slots=True)
+class ShopConfig:
+    order_number_block_size: int
+    release_unused_order_numbers: bool
+
+
 @dataclass(frozen=True, kw_only=True, slots=True)
 class SmtpConfig:
     host: str
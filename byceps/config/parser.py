@@ -32,6 +32,7 @@ from .models import (
     PaymentGatewaysConfig,
     PaypalConfig,
     RedisConfig,
+    ShopConfig,
     SiteWebAppConfig,
     SmtpConfig,
     StripeConfig,
@@ -94,6 +95,13 @@ def _validate_apps_config(
     return Ok(None)
 
 
+def _validate_shop_config(shop_config: ShopConfig) -> ParsingResult[None]:
+    if shop_config.order_number_block_size < 1:
+        return Err(['Order number block size must be at least 1'])
+
+    return Ok(None)
+
+
 _TOPLEVEL_FIELDS = [
     Field('locale', required=True),
     Field('propagate_exceptions', required=False, default=None),
@@ -219,11 +227,18 @@ _SECTION_DEFINITIONS = [
         name='metrics',
         fields=[
             Field('enabled', type_=ValueType.Boolean, required=True),
+            Field(
+                'request_instrumentation_enabled',
+                type_=ValueType.Boolean,
+                required=False,
+                default=False,
+            ),
         ],
         config_class=MetricsConfig,
         required=False,
         default=MetricsConfig(
             enabled=False,
+            request_instrumentation_enabled=False,
         ),
     ),
     Section(
@@ -277,6 +292,30 @@ _SECTION_DEFINITIONS = [
         config_class=RedisConfig,
         required=True,
     ),
+    Section(
+        name='shop',
+        fields=[
+            Field(
+                'order_number_block_size',
+                type_=ValueType.Integer,
+                required=False,
+                default=1,
+            ),
+            Field(
+                'release_unused_order_numbers',
+                type_=ValueType.Boolean,
+                required=False,
+                default=False,
+            ),
+        ],
+        config_class=ShopConfig,
+        required=False,
+        default=ShopConfig(
+            order_number_block_size=1,
+            release_unused_order_numbers=False,
+        ),
+        validator=_validate_shop_config,
+    ),
     Section(
         name='smtp',
         fields=[
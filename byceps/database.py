@@ -8,13 +8,20 @@ Database utilities.
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from collections.abc import Callable, Iterable
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+import binascii
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+import json
 from typing import Any
+from uuid import UUID
 
 from flask_sqlalchemy import SQLAlchemy
 from flask_sqlalchemy.pagination import Pagination
+from sqlalchemy import func, literal, select, tuple_
 from sqlalchemy.dialects.postgresql import insert, JSONB
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, InstrumentedAttribute
 from sqlalchemy.sql import Select
 from sqlalchemy.sql.dml import Insert
 from sqlalchemy.sql.schema import Table
@@ -39,22 +46,315 @@ def paginate(
     per_page: int,
     *,
     item_mapper: Mapper | None = None,
+    estimate_total: bool = False,
 ) -> Pagination:
-    """Return `per_page` items from page `page`."""
+    """Return `per_page` items from page `page`.
+
+    If `estimate_total` is true, the total number of items is estimated
+    by the query planner instead of being counted.
+    """
     pagination = db.paginate(
-        stmt, page=page, per_page=per_page, error_out=False
+        stmt,
+        page=page,
+        per_page=per_page,
+        error_out=False,
+        count=not estimate_total,
     )
 
+    if estimate_total:
+        pagination.total = estimate_count(stmt)
+
     if item_mapper is not None:
         pagination.items = [item_mapper(item) for item in pagination.items]
 
     return pagination
 
 
+def paginate_with_window_count(
+    stmt: Select,
+    page: int,
+    per_page: int,
+    *,
+    item_mapper: Mapper | None = None,
+) -> Pagination:
+    """Return `per_page` rows from page `page`.
+
+    The total number of rows is determined by a window function as part
+    of the same query instead of by a separate one (unless the page is
+    beyond the last one).
+
+    Unlike with `paginate`, the items are tuples of all the entities and
+    columns the statement selects.
+    """
+    page = max(page, 1)
+
+    rows = db.session.execute(
+        stmt.add_columns(func.count().over())
+        .limit(per_page)
+        .offset((page - 1) * per_page)
+    ).all()
+
+    if rows:
+        total = rows[0][-1]
+    elif page == 1:
+        total = 0
+    else:
+        total = count(stmt)
+
+    items = [tuple(row[:-1]) for row in rows]
+
+    if item_mapper is not None:
+        items = [item_mapper(item) for item in items]
+
+    return _PrefetchedPagination(
+        page=page,
+        per_page=per_page,
+        max_per_page=None,
+        error_out=False,
+        items=items,
+        total=total,
+    )
+
+
+class _PrefetchedPagination(Pagination):
+    """A pagination whose items and total have already been fetched."""
+
+    def _query_items(self) -> list[Any]:
+        return self._query_args['items']
+
+    def _query_count(self) -> int:
+        return self._query_args['total']
+
+
+@dataclass(kw_only=True)
+class KeysetPagination:
+    """A page of items, with cursors pointing to its neighbours."""
+
+    items: list[Any]
+    per_page: int
+    total: int | None
+    total_estimated: bool = False
+    prev_cursor: str | None
+    next_cursor: str | None
+
+    @property
+    def has_prev(self) -> bool:
+        return self.prev_cursor is not None
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    def __iter__(self):
+        return iter(self.items)
+
+
+def paginate_by_keyset(
+    stmt: Select,
+    sort_keys: Sequence[InstrumentedAttribute],
+    cursor: str | None,
+    per_page: int,
+    *,
+    descending: bool = True,
+    item_mapper: Mapper | None = None,
+    count_total: bool = True,
+    estimate_total: bool = False,
+) -> KeysetPagination:
+    """Return `per_page` items following (or preceding) the cursor.
+
+    Instead of skipping over all items of the previous pages (which
+    gets slower the deeper the page), items are selected by comparing
+    their sort key with the one of the last item of the previous page.
+
+    The statement has to select a single entity. It is ordered by the
+    sort keys (all ascending or all descending). The combination of
+    sort keys has to be unique, so the last one should usually be the
+    entity's ID. An index on the sort keys lets the database jump
+    straight to the page.
+
+    The first page is returned if no cursor (or an invalid one) is
+    given.
+
+    If `count_total` is false, the total number of items is not
+    determined. If `estimate_total` is true, it is estimated by the
+    query planner instead of being counted.
+    """
+    backwards = False
+    key_values = None
+    if cursor:
+        decoded_cursor = _decode_cursor(cursor, len(sort_keys))
+        if decoded_cursor is not None:
+            backwards, key_values = decoded_cursor
+
+    # Going backwards, fetch the preceding items in reverse order.
+    ascending = descending == backwards
+
+    page_stmt = stmt.order_by(None)
+
+    if key_values is not None:
+        row = tuple_(*sort_keys)
+        values = tuple_(
+            *[
+                literal(value, type_=sort_key.type)
+                for sort_key, value in zip(sort_keys, key_values, strict=True)
+            ]
+        )
+        page_stmt = page_stmt.filter(
+            row > values if ascending else row < values
+        )
+
+    page_stmt = page_stmt.order_by(
+        *[
+            sort_key.asc() if ascending else sort_key.desc()
+            for sort_key in sort_keys
+        ]
+    ).limit(per_page + 1)
+
+    items = list(db.session.scalars(page_stmt).unique().all())
+
+    has_more = len(items) > per_page
+    items = items[:per_page]
+
+    if backwards:
+        items.reverse()
+
+    def get_key(item) -> list[Any]:
+        return [getattr(item, sort_key.key) for sort_key in sort_keys]
+
+    if backwards:
+        # Coming from the following page, there is one.
+        has_prev, has_next = has_more, True
+    else:
+        has_prev, has_next = key_values is not None, has_more
+
+    prev_cursor = None
+    next_cursor = None
+    if items:
+        if has_prev:
+            prev_cursor = _encode_cursor(True, get_key(items[0]))
+        if has_next:
+            next_cursor = _encode_cursor(False, get_key(items[-1]))
+
+    if estimate_total:
+        total = estimate_count(stmt)
+    elif count_total:
+        total = count(stmt)
+    else:
+        total = None
+
+    if item_mapper is not None:
+        items = [item_mapper(item) for item in items]
+
+    return KeysetPagination(
+        items=items,
+        per_page=per_page,
+        total=total,
+        total_estimated=estimate_total,
+        prev_cursor=prev_cursor,
+        next_cursor=next_cursor,
+    )
+
+
+def _encode_cursor(backwards: bool, key_values: list[Any]) -> str:
+    payload = {
+        'b': backwards,
+        'k': [_serialize_key_value(value) for value in key_values],
+    }
+    data = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    return urlsafe_b64encode(data).decode('ascii').rstrip('=')
+
+
+def _decode_cursor(
+    cursor: str, key_length: int
+) -> tuple[bool, list[Any]] | None:
+    padding = '=' * (-len(cursor) % 4)
+    try:
+        data = urlsafe_b64decode(cursor + padding)
+        payload = json.loads(data)
+        backwards = payload['b']
+        key_values = [_deserialize_key_value(value) for value in payload['k']]
+    except (
+        binascii.Error,
+        KeyError,
+        TypeError,
+        UnicodeDecodeError,
+        ValueError,
+    ):
+        return None
+
+    if not isinstance(backwards, bool) or len(key_values) != key_length:
+        return None
+
+    return backwards, key_values
+
+
+def _serialize_key_value(value: Any) -> Any:
+    match value:
+        case datetime():
+            return {'dt': value.isoformat()}
+        case UUID():
+            return {'uuid': str(value)}
+        case _:
+            return value
+
+
+def _deserialize_key_value(value: Any) -> Any:
+    match value:
+        case {'dt': str(s)}:
+            return datetime.fromisoformat(s)
+        case {'uuid': str(s)}:
+            return UUID(s)
+        case bool() | int() | float() | str() | None:
+            return value
+        case _:
+            raise ValueError(f'Invalid cursor key value: {value!r}')
+
+
+def count(stmt: Select) -> int:
+    """Return the number of rows the statement selects."""
+    count_stmt = select(func.count()).select_from(
+        stmt.order_by(None).subquery()
+    )
+
+    return db.session.execute(count_stmt).scalar_one()
+
+
+def estimate_count(stmt: Select) -> int:
+    """Return the number of rows the query planner expects the statement
+    to select.
+
+    This is much cheaper than counting the rows of large tables, but
+    can be quite a bit off, especially for heavily filtered statements.
+    """
+    connection = db.session.connection()
+    # Expand `IN` lists right away as the statement is passed to the
+    # driver as-is.
+    compiled = stmt.order_by(None).compile(
+        dialect=connection.dialect,
+        compile_kwargs={'render_postcompile': True},
+    )
+
+    plan = connection.exec_driver_sql(
+        f'EXPLAIN (FORMAT JSON) {compiled}', compiled.params
+    ).scalar_one()
+
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
 def insert_ignore_on_conflict(table: Table, values: dict[str, Any]) -> None:
     """Insert the record identified by the primary key (specified as
     part of the values), or do nothing on conflict.
     """
+    execute_insert_ignore_on_conflict(table, values)
+    db.session.commit()
+
+
+def execute_insert_ignore_on_conflict(
+    table: Table, values: dict[str, Any]
+) -> None:
+    """Execute, but do not commit, an INSERT that does nothing on
+    conflict.
+    """
     query = (
         insert(table)
         .values(**values)
@@ -62,7 +362,6 @@ def insert_ignore_on_conflict(table: Table, values: dict[str, Any]) -> None:
     )
 
     db.session.execute(query)
-    db.session.commit()
 
 
 def upsert(
@@ -75,20 +374,6 @@ def upsert(
     db.session.commit()
 
 
-def upsert_many(
-    table: Table,
-    identifiers: Iterable[dict[str, Any]],
-    replacement: dict[str, Any],
-) -> None:
-    """Insert or update the record identified by `identifier` with value
-    `replacement`.
-    """
-    for identifier in identifiers:
-        execute_upsert(table, identifier, replacement)
-
-    db.session.commit()
-
-
 def execute_upsert(
     table: Table, identifier: dict[str, Any], replacement: dict[str, Any]
 ) -> None:
@@ -0,0 +1,110 @@
+"""
+byceps.services.authn.session.authn_session_cache
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Short-lived cache of authenticated identities, backed by Redis.
+
+An entry holds the active user and a digest of the session token that
+has been validated for that user. It saves the database round trips to
+look up the user and to validate the session token on every request.
+
+Entries expire after a short time, but are also evicted explicitly
+when session tokens are deleted or the user account changes in a way
+that affects the identity (suspension, deletion, screen name, avatar).
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import timedelta
+import hashlib
+import hmac
+import json
+
+from redis.exceptions import RedisError
+import structlog
+
+from byceps.byceps_app import get_current_byceps_app
+from byceps.services.user.models import User, UserID
+from byceps.services.user.user_cache_serialization import (
+    deserialize_user,
+    serialize_user,
+)
+
+
+log = structlog.get_logger()
+
+
+KEY_PREFIX = 'authn:session:users'
+
+ENTRY_TTL = timedelta(seconds=60)
+
+
+def find_user(user_id: UserID, auth_token: str) -> User | None:
+    """Return the cached user if an entry exists and has been stored
+    for that session token, `None` otherwise.
+    """
+    try:
+        entry_data = get_current_byceps_app().redis_client.get(
+            _get_key(user_id)
+        )
+    except RedisError as exc:
+        log.warning('Reading from session cache failed', exc_info=exc)
+        return None
+
+    if entry_data is None:
+        return None
+
+    entry = json.loads(entry_data)
+
+    if not hmac.compare_digest(
+        entry['token_digest'], _get_token_digest(auth_token)
+    ):
+        return None
+
+    return deserialize_user(entry['user'])
+
+
+def store_user(user: User, auth_token: str) -> None:
+    """Cache the user as authenticated by that session token."""
+    entry_data = json.dumps(
+        {
+            'token_digest': _get_token_digest(auth_token),
+            'user': serialize_user(user),
+        }
+    )
+
+    try:
+        get_current_byceps_app().redis_client.set(
+            _get_key(user.id), entry_data, ex=ENTRY_TTL
+        )
+    except RedisError as exc:
+        log.warning('Writing to session cache failed', exc_info=exc)
+
+
+def evict_user(user_id: UserID) -> None:
+    """Remove the user's entry, if any."""
+    try:
+        get_current_byceps_app().redis_client.delete(_get_key(user_id))
+    except RedisError as exc:
+        log.warning('Evicting from session cache failed', exc_info=exc)
+
+
+def evict_all_users() -> None:
+    """Remove all entries."""
+    redis_client = get_current_byceps_app().redis_client
+
+    try:
+        keys = list(redis_client.scan_iter(match=f'{KEY_PREFIX}:*'))
+        if keys:
+            redis_client.delete(*keys)
+    except RedisError as exc:
+        log.warning('Evicting from session cache failed', exc_info=exc)
+
+
+def _get_key(user_id: UserID) -> str:
+    return f'{KEY_PREFIX}:{user_id}'
+
+
+def _get_token_digest(auth_token: str) -> str:
+    return hashlib.sha256(auth_token.encode('utf-8')).hexdigest()
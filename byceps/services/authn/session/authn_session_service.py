@@ -14,16 +14,18 @@ from byceps.services.authn.events import (
 )
 from byceps.services.core.events import EventSite
 from byceps.services.site.models import Site
+from byceps.services.user import user_service
 from byceps.services.user.log import user_log_domain_service, user_log_service
 from byceps.services.user.log.models import UserLogEntry
 from byceps.services.user.models import User, UserID
 
-from . import authn_session_repository
+from . import authn_session_cache, authn_session_repository
 
 
 def delete_session_tokens_for_user(user_id: UserID) -> None:
     """Delete all session tokens that belong to the user."""
     authn_session_repository.delete_session_tokens_for_user(user_id)
+    authn_session_cache.evict_user(user_id)
 
 
 def delete_all_session_tokens() -> int:
@@ -31,7 +33,9 @@ def delete_all_session_tokens() -> int:
 
     Return the number of records deleted.
     """
-    return authn_session_repository.delete_all_session_tokens()
+    num_deleted = authn_session_repository.delete_all_session_tokens()
+    authn_session_cache.evict_all_users()
+    return num_deleted
 
 
 def is_session_valid(user_id: UserID, auth_token: str) -> bool:
@@ -47,6 +51,42 @@ def is_session_valid(user_id: UserID, auth_token: str) -> bool:
     return authn_session_repository.is_token_valid_for_user(auth_token, user_id)
 
 
+def find_authenticated_user(user_id: UserID, auth_token: str) -> User | None:
+    """Return the user if the account is active and the session is
+    valid, `None` otherwise.
+
+    The result is cached for a short time to avoid looking up the user
+    and validating the session token in the database on every request.
+    """
+    if not auth_token:
+        # Authentication token must not be empty.
+        return None
+
+    user = authn_session_cache.find_user(user_id, auth_token)
+    if user is not None:
+        return user
+
+    user = user_service.find_active_user(user_id, include_avatar=True)
+    if user is None:
+        return None
+
+    if not is_session_valid(user.id, auth_token):
+        return None
+
+    authn_session_cache.store_user(user, auth_token)
+
+    return user
+
+
+def evict_authenticated_user(user_id: UserID) -> None:
+    """Remove the user from the cache of authenticated users.
+
+    Call this whenever the account changes in a way that affects
+    either the user's ability to log in or the user object itself.
+    """
+    authn_session_cache.evict_user(user_id)
+
+
 def log_in_user_to_admin(
     user: User, ip_address: str | None
 ) -> tuple[str, UserLoggedInToAdminEvent]:
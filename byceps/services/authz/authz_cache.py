@@ -0,0 +1,131 @@
+"""
+byceps.services.authz.authz_cache
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Cache for the IDs of the permissions granted to users, backed by Redis.
+
+Each entry is stamped with the global version and the user's version
+that were current *before* the permissions were loaded.
+
+The user's version is bumped when roles are assigned to or deassigned
+from the user, and when permissions are assigned to or deassigned from
+a role the user has or such a role is deleted. The global version is
+only bumped on explicit request, to invalidate the entries of all users
+at once.
+
+A lookup fetches the entry and both current versions with a single
+`MGET`. An entry whose stamp does not match the current versions is
+outdated and gets replaced.
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from collections.abc import Callable, Iterable
+from datetime import timedelta
+import json
+
+from redis.exceptions import RedisError
+import structlog
+
+from byceps.byceps_app import get_current_byceps_app
+from byceps.services.user.models import UserID
+
+from .models import PermissionID
+
+
+log = structlog.get_logger()
+
+
+KEY_PREFIX = 'authz:permissions'
+GLOBAL_VERSION_KEY = f'{KEY_PREFIX}:version'
+
+# Limit the lifetime of entries in case a version bump got lost.
+ENTRY_TTL = timedelta(hours=1)
+
+
+def get_permission_ids_for_user(
+    user_id: UserID, load: Callable[[UserID], set[PermissionID]]
+) -> set[PermissionID]:
+    """Return the IDs of the permissions the user has been granted.
+
+    Return them from the cache, if available and up to date. Otherwise
+    call `load` to obtain them and put them into the cache.
+    """
+    redis_client = get_current_byceps_app().redis_client
+
+    entry_key = _get_entry_key(user_id)
+    user_version_key = _get_user_version_key(user_id)
+
+    try:
+        entry_data, global_version, user_version = redis_client.mget(
+            entry_key, GLOBAL_VERSION_KEY, user_version_key
+        )
+    except RedisError as exc:
+        log.warning('Reading from permission cache failed', exc_info=exc)
+        return load(user_id)
+
+    stamp = [_parse_version(global_version), _parse_version(user_version)]
+
+    if entry_data is not None:
+        entry = json.loads(entry_data)
+        if entry['stamp'] == stamp:
+            return {PermissionID(p_id) for p_id in entry['permission_ids']}
+
+    permission_ids = load(user_id)
+
+    entry_data = json.dumps(
+        {
+            'stamp': stamp,
+            'permission_ids': sorted(permission_ids),
+        }
+    )
+
+    try:
+        redis_client.set(entry_key, entry_data, ex=ENTRY_TTL)
+    except RedisError as exc:
+        log.warning('Writing to permission cache failed', exc_info=exc)
+
+    return permission_ids
+
+
+def invalidate_for_user(user_id: UserID) -> None:
+    """Invalidate the cached permissions of the user."""
+    _bump_versions([_get_user_version_key(user_id)])
+
+
+def invalidate_for_users(user_ids: Iterable[UserID]) -> None:
+    """Invalidate the cached permissions of the users."""
+    _bump_versions([_get_user_version_key(user_id) for user_id in user_ids])
+
+
+def invalidate_all() -> None:
+    """Invalidate the cached permissions of all users."""
+    _bump_versions([GLOBAL_VERSION_KEY])
+
+
+def _bump_versions(keys: list[str]) -> None:
+    if not keys:
+        return
+
+    redis_client = get_current_byceps_app().redis_client
+
+    try:
+        with redis_client.pipeline() as pipeline:
+            for key in keys:
+                pipeline.incr(key)
+            pipeline.execute()
+    except RedisError as exc:
+        log.warning('Invalidating permission cache failed', exc_info=exc)
+
+
+def _get_entry_key(user_id: UserID) -> str:
+    return f'{KEY_PREFIX}:users:{user_id}'
+
+
+def _get_user_version_key(user_id: UserID) -> str:
+    return f'{KEY_PREFIX}:users:{user_id}:version'
+
+
+def _parse_version(value: bytes | None) -> int:
+    return int(value) if value is not None else 0
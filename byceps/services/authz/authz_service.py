@@ -19,7 +19,7 @@ from byceps.services.user.log.models import UserLogEntry
 from byceps.services.user.models import User, UserID
 from byceps.util.result import Err, Ok, Result
 
-from . import authz_domain_service
+from . import authz_cache, authz_domain_service
 from .dbmodels import DbRole, DbRolePermission, DbUserRole
 from .events import RoleAssignedToUserEvent, RoleDeassignedFromUserEvent
 from .models import PermissionID, Role, RoleID
@@ -42,12 +42,16 @@ def create_role(role_id: RoleID, title: str) -> Result[Role, IntegrityError]:
 
 def delete_role(role_id: RoleID) -> None:
     """Delete a role."""
+    user_ids = find_user_ids_for_role(role_id)
+
     db.session.execute(
         delete(DbRolePermission).where(DbRolePermission.role_id == role_id)
     )
     db.session.execute(delete(DbRole).where(DbRole.id == role_id))
     db.session.commit()
 
+    authz_cache.invalidate_for_users(user_ids)
+
 
 def find_role(role_id: RoleID) -> Role | None:
     """Return the role with that ID, or `None` if not found."""
@@ -92,6 +96,8 @@ def assign_permission_to_role(
     db.session.add(db_role_permission)
     db.session.commit()
 
+    authz_cache.invalidate_for_users(find_user_ids_for_role(role_id))
+
 
 def deassign_permission_from_role(
     permission_id: PermissionID, role_id: RoleID
@@ -107,6 +113,8 @@ def deassign_permission_from_role(
     db.session.delete(db_role_permission)
     db.session.commit()
 
+    authz_cache.invalidate_for_users(find_user_ids_for_role(role_id))
+
     return Ok(None)
 
 
@@ -124,6 +132,8 @@ def assign_role_to_user(
 
     _persist_role_assignment_to_user(role_id, user, log_entry)
 
+    authz_cache.invalidate_for_user(user.id)
+
     return event
 
 
@@ -154,6 +164,8 @@ def deassign_role_from_user(
 
     _persist_role_deassignment_from_user(db_user_role, log_entry)
 
+    authz_cache.invalidate_for_user(user.id)
+
     return Ok(event)
 
 
@@ -171,11 +183,23 @@ def _persist_role_deassignment_from_user(
 def deassign_all_roles_from_user(
     user: User, *, initiator: User | None = None, commit: bool = True
 ) -> None:
-    """Deassign all roles from the user."""
+    """Deassign all roles from the user.
+
+    If not committing, the caller has to invalidate the user's cached
+    permissions (via `invalidate_permissions_for_user`) after having
+    committed the session. Doing so earlier would allow the permissions
+    to be cached again before the deassignment is persisted.
+    """
     db.session.execute(delete(DbUserRole).where(DbUserRole.user_id == user.id))
 
     if commit:
         db.session.commit()
+        invalidate_permissions_for_user(user.id)
+
+
+def invalidate_permissions_for_user(user_id: UserID) -> None:
+    """Invalidate the cached permissions of the user."""
+    authz_cache.invalidate_for_user(user_id)
 
 
 def _is_role_assigned_to_user(role_id: RoleID, user_id: UserID) -> bool:
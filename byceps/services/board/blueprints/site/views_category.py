@@ -94,7 +94,9 @@ def category_view(slug, page):
 @blueprint.post('/topics/mark_all_topics_as_read')
 @respond_no_content_with_location
 def mark_all_topics_as_viewed():
-    board_topic_command_service.mark_all_topics_as_viewed(g.user.id)
+    board_id = h.get_board_id()
+
+    board_topic_command_service.mark_all_topics_as_viewed(board_id, g.user.id)
 
     flash_success(gettext('All topics have been marked as read.'))
 
@@ -2,6 +2,15 @@
 byceps.services.board.board_aggregation_service
 ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
+Maintain the count and latest fields of categories and topics.
+
+Writes adjust the fields incrementally, in the same transaction as the
+change that caused them. Counts are changed with relative updates so
+that concurrent writes do not overwrite each other's changes.
+
+Remaining drift (e.g. from concurrent hiding and posting in the same
+topic) is fixed by reconciling a board, which recounts everything.
+
 :Copyright: 2014-2026 Jochen Kupperschmidt
 :License: Revised BSD (see `LICENSE` file for details)
 """
@@ -9,7 +18,7 @@ byceps.services.board.board_aggregation_service
 from dataclasses import dataclass
 from datetime import datetime
 
-from sqlalchemy import select
+from sqlalchemy import case, func, or_, select, update
 
 from byceps.database import db
 from byceps.services.user.models import UserID
@@ -17,7 +26,7 @@ from byceps.services.user.models import UserID
 from .dbmodels.category import DbBoardCategory
 from .dbmodels.posting import DbPosting
 from .dbmodels.topic import DbTopic
-from .models import BoardCategoryID, TopicID
+from .models import BoardCategoryID, BoardID, TopicID
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -26,22 +35,282 @@ class LatestPostingInfo:
     creator_id: UserID
 
 
-def aggregate_category(db_category: DbBoardCategory) -> None:
-    """Update the category's count and latest fields."""
+# incremental updates
+
+
+def add_posting(db_topic: DbTopic, db_posting: DbPosting) -> None:
+    """Account for a posting that has become visible (i.e. has been
+    created or un-hidden) in the topic.
+    """
+    latest_posting_info = LatestPostingInfo(
+        created_at=db_posting.created_at,
+        creator_id=db_posting.creator_id,
+    )
+
+    _update_topic(db_topic.id, 1, latest_posting_info)
+
+    if not db_topic.hidden:
+        _update_category(db_topic.category_id, 0, 1, latest_posting_info)
+
+
+def remove_posting(db_topic: DbTopic, db_posting: DbPosting) -> None:
+    """Account for a posting that has been hidden in the topic."""
+    _update_topic(db_topic.id, -1, None)
+
+    # Only if the removed posting is the latest one, the latest posting
+    # has to be looked up anew.
+    if db_posting.created_at >= db_topic.last_updated_at:
+        _update_topic_latest_posting(db_topic)
+
+    if not db_topic.hidden:
+        _remove_from_category(db_topic.category_id, 0, 1, db_posting.created_at)
+
+
+def add_topic(category_id: BoardCategoryID, db_topic: DbTopic) -> None:
+    """Account for a topic that has become visible (i.e. has been
+    created, un-hidden, or moved) in the category.
+    """
+    latest_posting_info = LatestPostingInfo(
+        created_at=db_topic.last_updated_at,
+        creator_id=db_topic.last_updated_by_id,
+    )
+
+    _update_category(
+        category_id, 1, db_topic.posting_count, latest_posting_info
+    )
+
+
+def remove_topic(category_id: BoardCategoryID, db_topic: DbTopic) -> None:
+    """Account for a topic that has been hidden in or moved away from
+    the category.
+    """
+    _remove_from_category(
+        category_id, 1, db_topic.posting_count, db_topic.last_updated_at
+    )
+
+
+def _update_topic(
+    topic_id: TopicID,
+    posting_delta: int,
+    latest_posting_info: LatestPostingInfo | None,
+) -> None:
+    values = {'posting_count': DbTopic.posting_count + posting_delta}
+
+    if latest_posting_info is not None:
+        is_later = DbTopic.last_updated_at <= latest_posting_info.created_at
+        values['last_updated_at'] = func.greatest(
+            DbTopic.last_updated_at, latest_posting_info.created_at
+        )
+        values['last_updated_by_id'] = case(
+            (is_later, latest_posting_info.creator_id),
+            else_=DbTopic.last_updated_by_id,
+        )
+
+    db.session.execute(
+        update(DbTopic)
+        .where(DbTopic.id == topic_id)
+        .values(values)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _update_category(
+    category_id: BoardCategoryID,
+    topic_delta: int,
+    posting_delta: int,
+    latest_posting_info: LatestPostingInfo | None,
+) -> None:
+    values = {
+        'topic_count': DbBoardCategory.topic_count + topic_delta,
+        'posting_count': DbBoardCategory.posting_count + posting_delta,
+    }
+
+    if latest_posting_info is not None:
+        # Within an `UPDATE`, all expressions see the previous values.
+        is_later = or_(
+            DbBoardCategory.last_posting_updated_at.is_(None),
+            DbBoardCategory.last_posting_updated_at
+            <= latest_posting_info.created_at,
+        )
+        values['last_posting_updated_at'] = case(
+            (is_later, latest_posting_info.created_at),
+            else_=DbBoardCategory.last_posting_updated_at,
+        )
+        values['last_posting_updated_by_id'] = case(
+            (is_later, latest_posting_info.creator_id),
+            else_=DbBoardCategory.last_posting_updated_by_id,
+        )
+
+    db.session.execute(
+        update(DbBoardCategory)
+        .where(DbBoardCategory.id == category_id)
+        .values(values)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _remove_from_category(
+    category_id: BoardCategoryID,
+    topic_delta: int,
+    posting_delta: int,
+    removed_latest_at: datetime | None,
+) -> None:
+    last_posting_updated_at = db.session.scalar(
+        select(DbBoardCategory.last_posting_updated_at).filter_by(
+            id=category_id
+        )
+    )
+
+    _update_category(category_id, -topic_delta, -posting_delta, None)
+
+    # See above.
+    if (
+        removed_latest_at is not None
+        and last_posting_updated_at is not None
+        and removed_latest_at >= last_posting_updated_at
+    ):
+        _update_category_latest_posting(category_id)
+
+
+def _update_topic_latest_posting(db_topic: DbTopic) -> None:
+    latest_posting_info = _get_topic_latest_posting_info(db_topic)
+
+    db.session.execute(
+        update(DbTopic)
+        .where(DbTopic.id == db_topic.id)
+        .values(
+            last_updated_at=latest_posting_info.created_at,
+            last_updated_by_id=latest_posting_info.creator_id,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _update_category_latest_posting(category_id: BoardCategoryID) -> None:
+    latest_posting_info = _get_category_latest_posting_info(category_id)
+
+    db.session.execute(
+        update(DbBoardCategory)
+        .where(DbBoardCategory.id == category_id)
+        .values(
+            last_posting_updated_at=(
+                latest_posting_info.created_at if latest_posting_info else None
+            ),
+            last_posting_updated_by_id=(
+                latest_posting_info.creator_id if latest_posting_info else None
+            ),
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+# reconciliation
+
+
+def reconcile_board(board_id: BoardID) -> int:
+    """Recount the fields of the board's categories and topics and fix
+    those that have drifted.
+
+    Return the number of categories and topics that had to be fixed.
+    """
+    fixed_count = 0
+
+    category_ids = db.session.scalars(
+        select(DbBoardCategory.id).filter_by(board_id=board_id)
+    ).all()
+
+    for category_id in category_ids:
+        fixed_count += _reconcile_topics_in_category(category_id)
+
+        db_category = db.session.get(DbBoardCategory, category_id)
+        if _reconcile_category(db_category):
+            fixed_count += 1
+
+    db.session.commit()
+
+    return fixed_count
+
+
+def _reconcile_topics_in_category(category_id: BoardCategoryID) -> int:
+    """Fix topics whose count or latest fields differ from the actual
+    (visible) postings.
+    """
+    actual_count_query = (
+        select(func.count(DbPosting.id))
+        .filter(DbPosting.topic_id == DbTopic.id)
+        .filter(DbPosting.hidden == False)  # noqa: E712
+        .scalar_subquery()
+    )
+    actual_latest_at_query = (
+        select(func.max(DbPosting.created_at))
+        .filter(DbPosting.topic_id == DbTopic.id)
+        .filter(DbPosting.hidden == False)  # noqa: E712
+        .scalar_subquery()
+    )
+
+    rows = db.session.execute(
+        select(
+            DbTopic.id,
+            DbTopic.posting_count,
+            actual_count_query,
+            DbTopic.last_updated_at,
+            func.coalesce(actual_latest_at_query, DbTopic.created_at),
+        ).filter(DbTopic.category_id == category_id)
+    ).all()
+
+    drifted_topic_ids = [
+        topic_id
+        for topic_id, count, actual_count, latest_at, actual_latest_at in rows
+        if (count != actual_count) or (latest_at != actual_latest_at)
+    ]
+
+    for topic_id in drifted_topic_ids:
+        db_topic = db.session.get(DbTopic, topic_id)
+        _reconcile_topic(db_topic)
+
+    return len(drifted_topic_ids)
+
+
+def _reconcile_category(db_category: DbBoardCategory) -> bool:
+    """Recount the category's fields.
+
+    Return `True` if any of them had drifted.
+    """
     topic_count = _get_category_topic_count(db_category.id)
     posting_count = _get_category_posting_count(db_category.id)
     latest_posting_info = _get_category_latest_posting_info(db_category.id)
 
-    db_category.topic_count = topic_count
-    db_category.posting_count = posting_count
-    db_category.last_posting_updated_at = (
+    last_posting_updated_at = (
         latest_posting_info.created_at if latest_posting_info else None
     )
-    db_category.last_posting_updated_by_id = (
+    last_posting_updated_by_id = (
         latest_posting_info.creator_id if latest_posting_info else None
     )
 
-    db.session.commit()
+    if (
+        db_category.topic_count == topic_count
+        and db_category.posting_count == posting_count
+        and db_category.last_posting_updated_at == last_posting_updated_at
+        and db_category.last_posting_updated_by_id == last_posting_updated_by_id
+    ):
+        return False
+
+    db_category.topic_count = topic_count
+    db_category.posting_count = posting_count
+    db_category.last_posting_updated_at = last_posting_updated_at
+    db_category.last_posting_updated_by_id = last_posting_updated_by_id
+
+    return True
+
+
+def _reconcile_topic(db_topic: DbTopic) -> None:
+    """Recount the topic's fields."""
+    posting_count = _get_topic_posting_count(db_topic.id)
+    latest_posting_info = _get_topic_latest_posting_info(db_topic)
+
+    db_topic.posting_count = posting_count
+    db_topic.last_updated_at = latest_posting_info.created_at
+    db_topic.last_updated_by_id = latest_posting_info.creator_id
 
 
 def _get_category_topic_count(category_id: BoardCategoryID) -> int:
@@ -74,6 +343,7 @@ def _get_category_latest_posting_info(
         .filter(DbTopic.category_id == category_id)
         .filter(DbTopic.hidden == False)  # noqa: E712
         .order_by(DbPosting.created_at.desc())
+        .limit(1)
     ).first()
 
     if not db_latest_posting:
@@ -85,20 +355,6 @@ def _get_category_latest_posting_info(
     )
 
 
-def aggregate_topic(db_topic: DbTopic) -> None:
-    """Update the topic's count and latest fields."""
-    posting_count = _get_topic_posting_count(db_topic.id)
-    latest_posting_info = _get_topic_latest_posting_info(db_topic)
-
-    db_topic.posting_count = posting_count
-    db_topic.last_updated_at = latest_posting_info.created_at
-    db_topic.last_updated_by_id = latest_posting_info.creator_id
-
-    db.session.commit()
-
-    aggregate_category(db_topic.category)
-
-
 def _get_topic_posting_count(topic_id: TopicID) -> int:
     posting_count = db.session.scalar(
         select(db.func.count(DbPosting.id))
@@ -114,6 +370,7 @@ def _get_topic_latest_posting_info(db_topic: DbTopic) -> LatestPostingInfo:
         .filter_by(topic_id=db_topic.id)
         .filter_by(hidden=False)
         .order_by(DbPosting.created_at.desc())
+        .limit(1)
     ).first()
 
     if not db_latest_posting:
@@ -18,6 +18,7 @@ from byceps.util.uuid import generate_uuid4
 from . import board_topic_query_service
 from .dbmodels.board import DbBoard
 from .dbmodels.category import DbBoardCategory, DbLastCategoryView
+from .dbmodels.read_watermark import DbCategoryReadWatermark
 from .errors import (
     BoardCategoryAlreadyAtBottomError,
     BoardCategoryAlreadyAtTopError,
@@ -127,6 +128,9 @@ def delete_category(category_id: BoardCategoryID) -> Result[None, str]:
             'contains topics. It will not be deleted because of that.'
         )
 
+    db.session.execute(
+        delete(DbCategoryReadWatermark).filter_by(category_id=db_category.id)
+    )
     db.session.delete(db_category)
     db.session.commit()
 
@@ -15,6 +15,10 @@ from byceps.services.authn.session.models import CurrentUser
 from byceps.services.user.models import UserID
 
 from .dbmodels.category import DbBoardCategory, DbLastCategoryView
+from .dbmodels.read_watermark import (
+    DbBoardReadWatermark,
+    DbCategoryReadWatermark,
+)
 from .models import (
     BoardCategory,
     BoardCategoryID,
@@ -176,20 +180,53 @@ def contains_category_unseen_postings(
     if not current_user.authenticated:
         return False
 
-    db_last_view = _find_last_category_view(current_user.id, category_id)
+    last_viewed_at = _find_category_last_viewed_at(current_user.id, category_id)
 
-    if db_last_view is None:
+    if last_viewed_at is None:
         return True
 
-    return last_posting_updated_at > db_last_view.occurred_at
+    return last_posting_updated_at > last_viewed_at
 
 
-def _find_last_category_view(
+def _find_category_last_viewed_at(
     user_id: UserID, category_id: BoardCategoryID
-) -> DbLastCategoryView | None:
-    """Return the user's last view of the category, or `None` if not found."""
-    return db.session.scalars(
-        select(DbLastCategoryView).filter_by(
-            user_id=user_id, category_id=category_id
+) -> datetime | None:
+    """Return the time the user last viewed the category, or `None` if
+    the user hasn't viewed it yet.
+
+    Marking all topics of the category or its board as viewed counts as
+    viewing the category.
+    """
+    return db.session.scalar(
+        select(
+            # `GREATEST` ignores `NULL` values.
+            db.func.greatest(
+                DbLastCategoryView.occurred_at,
+                DbCategoryReadWatermark.read_until,
+                DbBoardReadWatermark.read_until,
+            )
         )
-    ).first()
+        .select_from(DbBoardCategory)
+        .outerjoin(
+            DbLastCategoryView,
+            db.and_(
+                DbLastCategoryView.category_id == DbBoardCategory.id,
+                DbLastCategoryView.user_id == user_id,
+            ),
+        )
+        .outerjoin(
+            DbCategoryReadWatermark,
+            db.and_(
+                DbCategoryReadWatermark.category_id == DbBoardCategory.id,
+                DbCategoryReadWatermark.user_id == user_id,
+            ),
+        )
+        .outerjoin(
+            DbBoardReadWatermark,
+            db.and_(
+                DbBoardReadWatermark.board_id == DbBoardCategory.board_id,
+                DbBoardReadWatermark.user_id == user_id,
+            ),
+        )
+        .filter(DbBoardCategory.id == category_id)
+    )
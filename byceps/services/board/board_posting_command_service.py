@@ -13,6 +13,8 @@ from sqlalchemy import delete, select
 from byceps.database import db
 from byceps.services.brand import brand_service
 from byceps.services.core.events import EventBrand
+from byceps.services.search import search_service
+from byceps.services.search.models import SearchDocumentType
 from byceps.services.user import user_service
 from byceps.services.user.models import User, UserID
 from byceps.util.result import Err, Ok, Result
@@ -25,6 +27,7 @@ from . import (
     board_topic_query_service,
 )
 from .dbmodels.posting import DbPosting, DbPostingReaction
+from .dbmodels.topic import DbTopic
 from .events import (
     BoardPostingCreatedEvent,
     BoardPostingHiddenEvent,
@@ -52,9 +55,10 @@ def create_posting(
         posting_id, db_topic.id, created_at, creator.id, body
     )
     db.session.add(db_posting)
+    board_aggregation_service.add_posting(db_topic, db_posting)
     db.session.commit()
 
-    board_aggregation_service.aggregate_topic(db_topic)
+    index_posting(db_posting)
 
     db_category = db_topic.category
     brand = brand_service.get_brand(db_category.board.brand_id)
@@ -89,6 +93,7 @@ def update_posting(
 
     if commit:
         db.session.commit()
+        index_posting(db_posting)
 
     brand = brand_service.get_brand(db_posting.topic.category.board.brand_id)
     posting_creator = _get_user(db_posting.creator_id)
@@ -114,12 +119,16 @@ def hide_posting(
 
     now = datetime.utcnow()
 
+    was_visible = not db_posting.hidden
+
     db_posting.hidden = True
     db_posting.hidden_at = now
     db_posting.hidden_by_id = moderator.id
-    db.session.commit()
 
-    board_aggregation_service.aggregate_topic(db_posting.topic)
+    if was_visible:
+        board_aggregation_service.remove_posting(db_posting.topic, db_posting)
+
+    db.session.commit()
 
     brand = brand_service.get_brand(db_posting.topic.category.board.brand_id)
     posting_creator = _get_user(db_posting.creator_id)
@@ -147,12 +156,16 @@ def unhide_posting(
 
     now = datetime.utcnow()
 
+    was_hidden = db_posting.hidden
+
     db_posting.hidden = False
     db_posting.hidden_at = None
     db_posting.hidden_by_id = None
-    db.session.commit()
 
-    board_aggregation_service.aggregate_topic(db_posting.topic)
+    if was_hidden:
+        board_aggregation_service.add_posting(db_posting.topic, db_posting)
+
+    db.session.commit()
 
     brand = brand_service.get_brand(db_posting.topic.category.board.brand_id)
     posting_creator = _get_user(db_posting.creator_id)
@@ -174,10 +187,36 @@ def unhide_posting(
 
 def delete_posting(posting_id: PostingID) -> None:
     """Delete a posting."""
+    search_service.remove_documents(
+        SearchDocumentType.board_posting, [str(posting_id)]
+    )
     db.session.execute(delete(DbPosting).filter_by(id=posting_id))
     db.session.commit()
 
 
+def index_posting(db_posting: DbPosting, *, commit: bool = True) -> None:
+    """Add the posting to the search index.
+
+    Hidden postings are indexed as well. Searches exclude them if
+    necessary.
+    """
+    db_topic = db_posting.topic
+
+    # Only the initial posting carries the topic's title.
+    is_initial_posting = db_topic.initial_posting.id == db_posting.id
+    title = db_topic.title if is_initial_posting else ''
+
+    search_service.index_document(
+        SearchDocumentType.board_posting,
+        str(db_posting.id),
+        db_topic.category.board_id,
+        None,
+        title,
+        db_posting.body,
+        commit=commit,
+    )
+
+
 def add_reaction(
     db_posting: DbPosting, user: User, kind: ReactionKind
 ) -> Result[PostingReaction, ReactionDeniedError | ReactionExistsError]:
@@ -251,3 +290,22 @@ def _get_db_posting(posting_id: PostingID) -> DbPosting:
 
 def _get_user(user_id: UserID) -> User:
     return user_service.get_user(user_id)
+
+
+def reindex_all_postings() -> int:
+    """Add all postings to the search index.
+
+    Return the number of indexed postings.
+    """
+    db_postings = db.session.scalars(
+        select(DbPosting).options(
+            db.joinedload(DbPosting.topic).joinedload(DbTopic.category)
+        )
+    ).all()
+
+    for db_posting in db_postings:
+        index_posting(db_posting, commit=False)
+
+    db.session.commit()
+
+    return len(db_postings)
@@ -7,14 +7,19 @@ byceps.services.board.board_posting_query_service
 """
 
 from collections import defaultdict
+from uuid import UUID
 
 from sqlalchemy import select
 
 from byceps.database import db, paginate, Pagination
+from byceps.services.brand.models import BrandID
+from byceps.services.search import search_service
+from byceps.services.search.models import SearchDocumentType
+from byceps.services.text_markup import text_markup_service
 from byceps.services.user import user_service
 from byceps.services.user.dbmodels import DbUser
-from byceps.util.iterables import index_of
 
+from .dbmodels.board import DbBoard
 from .dbmodels.category import DbBoardCategory
 from .dbmodels.posting import DbPosting, DbPostingReaction
 from .dbmodels.topic import DbTopic
@@ -34,6 +39,20 @@ def count_postings_for_board(board_id: BoardID) -> int:
     )
 
 
+def count_postings_by_board(brand_ids: set[BrandID]) -> dict[BoardID, int]:
+    """Return the number of postings for each board of those brands."""
+    rows = db.session.execute(
+        select(DbBoard.id, db.func.count(DbPosting.id))
+        .outerjoin(DbBoardCategory, DbBoardCategory.board_id == DbBoard.id)
+        .outerjoin(DbTopic, DbTopic.category_id == DbBoardCategory.id)
+        .outerjoin(DbPosting, DbPosting.topic_id == DbTopic.id)
+        .filter(DbBoard.brand_id.in_(brand_ids))
+        .group_by(DbBoard.id)
+    ).all()
+
+    return dict(rows)
+
+
 def find_db_posting(posting_id: PostingID) -> DbPosting | None:
     """Return the posting with that ID, or `None` if not found."""
     return db.session.get(DbPosting, posting_id)
@@ -82,8 +101,15 @@ def paginate_postings(
         creator_ids, include_avatars=True
     )
 
-    for db_posting in db_postings.items:
+    bodies_html = text_markup_service.render_html_bulk(
+        [db_posting.body for db_posting in db_postings.items]
+    )
+
+    for db_posting, body_html in zip(
+        db_postings.items, bodies_html, strict=True
+    ):
         db_posting.creator = creators_by_id[db_posting.creator_id]
+        db_posting.body_html = body_html
         db_posting.reactions_by_kind = _get_reactions_by_kind(
             db_posting.reactions
         )
@@ -91,6 +117,57 @@ def paginate_postings(
     return db_postings
 
 
+def search_postings(
+    board_id: BoardID,
+    search_term: str,
+    *,
+    include_hidden: bool = False,
+    limit: int = 50,
+) -> list[DbPosting]:
+    """Return the postings in that board that match the search term,
+    most relevant first.
+    """
+    document_ids = None
+    if not include_hidden:
+        # Exclude hidden postings before limiting the results.
+        document_ids = (
+            select(db.cast(DbPosting.id, db.UnicodeText))
+            .join(DbTopic)
+            .join(DbBoardCategory)
+            .filter(DbBoardCategory.board_id == board_id)
+            .filter(DbPosting.hidden == False)  # noqa: E712
+            .filter(DbTopic.hidden == False)  # noqa: E712
+        )
+
+    results = search_service.search(
+        search_term,
+        SearchDocumentType.board_posting,
+        scopes=[board_id],
+        document_ids=document_ids,
+        limit=limit,
+    )
+    if not results:
+        return []
+
+    posting_ids = [PostingID(UUID(result.document_id)) for result in results]
+
+    db_postings = db.session.scalars(
+        select(DbPosting)
+        .options(db.joinedload(DbPosting.topic))
+        .filter(DbPosting.id.in_(posting_ids))
+    ).all()
+
+    db_postings_by_id = {
+        db_posting.id: db_posting for db_posting in db_postings
+    }
+
+    return [
+        db_postings_by_id[posting_id]
+        for posting_id in posting_ids
+        if posting_id in db_postings_by_id
+    ]
+
+
 def _get_reactions_by_kind(
     db_reactions: list[DbPostingReaction],
 ) -> dict[str, list[PostingReactionUser]]:
@@ -111,17 +188,20 @@ def calculate_posting_page_number(
     db_posting: DbPosting, include_hidden: bool, postings_per_page: int
 ) -> int:
     """Return the number of the page the posting should appear on."""
-    stmt = select(DbPosting).filter_by(topic_id=db_posting.topic_id)
+    if db_posting.hidden and not include_hidden:
+        return 1  # Shouldn't happen.
+
+    # Count the postings before this one instead of loading all of the
+    # topic's postings (backed by an index on topic and creation time).
+    stmt = (
+        select(db.func.count(DbPosting.id))
+        .filter_by(topic_id=db_posting.topic_id)
+        .filter(DbPosting.created_at < db_posting.created_at)
+    )
 
     if not include_hidden:
         stmt = stmt.filter_by(hidden=False)
 
-    stmt = stmt.order_by(DbPosting.created_at.asc())
-
-    db_topic_postings = db.session.scalars(stmt).all()
-
-    index = index_of(db_topic_postings, lambda p: p == db_posting)
-    if index is None:
-        return 1  # Shouldn't happen.
+    index = db.session.scalar(stmt) or 0
 
     return divmod(index, postings_per_page)[0] + 1
@@ -12,6 +12,7 @@ from byceps.database import db
 from byceps.services.brand.models import Brand, BrandID
 
 from .dbmodels.board import DbBoard
+from .dbmodels.read_watermark import DbBoardReadWatermark
 from .models import Board, BoardID
 
 
@@ -27,6 +28,9 @@ def create_board(brand: Brand, board_id: BoardID) -> Board:
 
 def delete_board(board_id: BoardID) -> None:
     """Delete a board."""
+    db.session.execute(
+        delete(DbBoardReadWatermark).filter_by(board_id=board_id)
+    )
     db.session.execute(delete(DbBoard).filter_by(id=board_id))
     db.session.commit()
 
@@ -8,11 +8,14 @@ byceps.services.board.board_topic_command_service
 
 from datetime import datetime
 
-from sqlalchemy import delete
+from sqlalchemy import delete, select
+from sqlalchemy.sql import Select
 
-from byceps.database import db, upsert, upsert_many
+from byceps.database import db, upsert
 from byceps.services.brand import brand_service
 from byceps.services.core.events import EventBrand
+from byceps.services.search import search_service
+from byceps.services.search.models import SearchDocumentType
 from byceps.services.user import user_service
 from byceps.services.user.models import User, UserID
 from byceps.util.uuid import generate_uuid7
@@ -24,6 +27,10 @@ from . import (
 )
 from .dbmodels.category import DbBoardCategory
 from .dbmodels.posting import DbInitialTopicPostingAssociation, DbPosting
+from .dbmodels.read_watermark import (
+    DbBoardReadWatermark,
+    DbCategoryReadWatermark,
+)
 from .dbmodels.topic import DbTopic, DbLastTopicView
 from .events import (
     BoardTopicCreatedEvent,
@@ -36,7 +43,7 @@ from .events import (
     BoardTopicUnpinnedEvent,
     BoardTopicUpdatedEvent,
 )
-from .models import BoardCategoryID, PostingID, Topic, TopicID
+from .models import BoardCategoryID, BoardID, PostingID, Topic, TopicID
 
 
 def create_topic(
@@ -47,7 +54,9 @@ def create_topic(
     topic_id = TopicID(generate_uuid7())
     posting_id = PostingID(generate_uuid7())
 
-    db_topic = DbTopic(topic_id, category_id, created_at, creator.id, title)
+    db_topic = DbTopic(
+        topic_id, category_id, created_at, creator.id, title, posting_count=1
+    )
     db_posting = DbPosting(posting_id, topic_id, created_at, creator.id, body)
     db_initial_topic_posting_association = DbInitialTopicPostingAssociation(
         topic_id, posting_id
@@ -56,9 +65,10 @@ def create_topic(
     db.session.add(db_topic)
     db.session.add(db_posting)
     db.session.add(db_initial_topic_posting_association)
+    board_aggregation_service.add_topic(category_id, db_topic)
     db.session.commit()
 
-    board_aggregation_service.aggregate_topic(db_topic)
+    board_posting_command_service.index_posting(db_posting)
 
     db_category = db_topic.category
     brand = brand_service.get_brand(db_category.board.brand_id)
@@ -92,6 +102,8 @@ def update_topic(
 
     db.session.commit()
 
+    board_posting_command_service.index_posting(db_topic.initial_posting)
+
     brand = brand_service.get_brand(db_topic.category.board.brand_id)
     topic_creator = _get_user(db_topic.creator_id)
     return BoardTopicUpdatedEvent(
@@ -113,12 +125,16 @@ def hide_topic(topic_id: TopicID, moderator: User) -> BoardTopicHiddenEvent:
 
     now = datetime.utcnow()
 
+    was_visible = not db_topic.hidden
+
     db_topic.hidden = True
     db_topic.hidden_at = now
     db_topic.hidden_by_id = moderator.id
-    db.session.commit()
 
-    board_aggregation_service.aggregate_topic(db_topic)
+    if was_visible:
+        board_aggregation_service.remove_topic(db_topic.category_id, db_topic)
+
+    db.session.commit()
 
     brand = brand_service.get_brand(db_topic.category.board.brand_id)
     topic_creator = _get_user(db_topic.creator_id)
@@ -141,12 +157,16 @@ def unhide_topic(topic_id: TopicID, moderator: User) -> BoardTopicUnhiddenEvent:
 
     now = datetime.utcnow()
 
+    was_hidden = db_topic.hidden
+
     db_topic.hidden = False
     db_topic.hidden_at = None
     db_topic.hidden_by_id = None
-    db.session.commit()
 
-    board_aggregation_service.aggregate_topic(db_topic)
+    if was_hidden:
+        board_aggregation_service.add_topic(db_topic.category_id, db_topic)
+
+    db.session.commit()
 
     brand = brand_service.get_brand(db_topic.category.board.brand_id)
     topic_creator = _get_user(db_topic.creator_id)
@@ -282,10 +302,12 @@ def move_topic(
         raise ValueError(f'Unknown board category ID "{new_category_id}"')
 
     db_topic.category = db_new_category
-    db.session.commit()
 
-    for db_category in db_old_category, db_new_category:
-        board_aggregation_service.aggregate_category(db_category)
+    if not db_topic.hidden:
+        board_aggregation_service.remove_topic(db_old_category.id, db_topic)
+        board_aggregation_service.add_topic(db_new_category.id, db_topic)
+
+    db.session.commit()
 
     brand = brand_service.get_brand(db_topic.category.board.brand_id)
     topic_creator = _get_user(db_topic.creator_id)
@@ -324,6 +346,14 @@ def remove_limit_of_topic_to_announcements(topic_id: TopicID) -> None:
 
 def delete_topic(topic_id: TopicID) -> None:
     """Delete a topic."""
+    posting_ids = db.session.scalars(
+        select(DbPosting.id).filter_by(topic_id=topic_id)
+    ).all()
+    search_service.remove_documents(
+        SearchDocumentType.board_posting,
+        [str(posting_id) for posting_id in posting_ids],
+    )
+
     db.session.execute(
         delete(DbInitialTopicPostingAssociation).filter_by(topic_id=topic_id)
     )
@@ -359,38 +389,48 @@ def mark_topic_as_just_viewed(topic_id: TopicID, user_id: UserID) -> None:
     upsert(table, identifier, replacement)
 
 
-def mark_all_topics_as_viewed(user_id: UserID) -> None:
-    """Mark all topics as viewed by the current user."""
-    topic_ids = board_topic_query_service.get_all_topic_ids()
+def mark_all_topics_as_viewed(board_id: BoardID, user_id: UserID) -> None:
+    """Mark all topics in the board as viewed by the current user."""
+    now = datetime.utcnow()
+
+    # Views of single topics before now are superseded.
+    category_ids = select(DbBoardCategory.id).filter_by(board_id=board_id)
+    topic_ids = select(DbTopic.id).filter(DbTopic.category_id.in_(category_ids))
+    _delete_last_topic_views_before(user_id, topic_ids, now)
 
-    _mark_topics_as_viewed(topic_ids, user_id)
+    table = DbBoardReadWatermark.__table__
+    identifier = {'user_id': user_id, 'board_id': board_id}
+    replacement = {'read_until': now}
+
+    upsert(table, identifier, replacement)
 
 
 def mark_all_topics_in_category_as_viewed(
     category_id: BoardCategoryID, user_id: UserID
 ) -> None:
     """Mark all topics in the category as viewed by the current user."""
-    topic_ids = board_topic_query_service.get_all_topic_ids_in_category(
-        category_id
-    )
-
-    _mark_topics_as_viewed(topic_ids, user_id)
+    now = datetime.utcnow()
 
+    # Views of single topics before now are superseded.
+    topic_ids = select(DbTopic.id).filter_by(category_id=category_id)
+    _delete_last_topic_views_before(user_id, topic_ids, now)
 
-def _mark_topics_as_viewed(topic_ids: set[TopicID], user_id: UserID) -> None:
-    if not topic_ids:
-        return
+    table = DbCategoryReadWatermark.__table__
+    identifier = {'user_id': user_id, 'category_id': category_id}
+    replacement = {'read_until': now}
 
-    table = DbLastTopicView.__table__
-    replacement = {
-        'occurred_at': datetime.utcnow(),
-    }
+    upsert(table, identifier, replacement)
 
-    identifiers = [
-        {'user_id': user_id, 'topic_id': topic_id} for topic_id in topic_ids
-    ]
 
-    upsert_many(table, identifiers, replacement)
+def _delete_last_topic_views_before(
+    user_id: UserID, topic_ids: Select, occurred_before: datetime
+) -> None:
+    db.session.execute(
+        delete(DbLastTopicView)
+        .filter_by(user_id=user_id)
+        .filter(DbLastTopicView.topic_id.in_(topic_ids))
+        .filter(DbLastTopicView.occurred_at <= occurred_before)
+    )
 
 
 def delete_last_topic_views(topic_id: TopicID) -> None:
@@ -6,21 +6,27 @@ byceps.services.board.board_topic_query_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from collections.abc import Iterable
+from collections.abc import Sequence
 from datetime import datetime
 
 from sqlalchemy import select
 from sqlalchemy.sql import Select
 
-from byceps.database import db, paginate, Pagination
+from byceps.database import db, paginate_with_window_count, Pagination
 from byceps.services.authn.session.models import CurrentUser
+from byceps.services.brand.models import BrandID
 from byceps.services.user import user_service
 from byceps.services.user.dbmodels import DbUser
 from byceps.services.user.models import User, UserID
 
 from . import board_access_control_service
+from .dbmodels.board import DbBoard
 from .dbmodels.category import DbBoardCategory
 from .dbmodels.posting import DbPosting
+from .dbmodels.read_watermark import (
+    DbBoardReadWatermark,
+    DbCategoryReadWatermark,
+)
 from .dbmodels.topic import DbTopic, DbLastTopicView
 from .models import (
     BoardCategoryID,
@@ -44,6 +50,19 @@ def count_topics_for_board(board_id: BoardID) -> int:
     )
 
 
+def count_topics_by_board(brand_ids: set[BrandID]) -> dict[BoardID, int]:
+    """Return the number of topics for each board of those brands."""
+    rows = db.session.execute(
+        select(DbBoard.id, db.func.count(DbTopic.id))
+        .outerjoin(DbBoardCategory, DbBoardCategory.board_id == DbBoard.id)
+        .outerjoin(DbTopic, DbTopic.category_id == DbBoardCategory.id)
+        .filter(DbBoard.brand_id.in_(brand_ids))
+        .group_by(DbBoard.id)
+    ).all()
+
+    return dict(rows)
+
+
 def find_topic(topic_id: TopicID) -> Topic | None:
     """Return the topic with that ID, or `None` if not found."""
     db_topic = find_db_topic(topic_id)
@@ -106,20 +125,15 @@ def get_recent_topics(
     if not has_access:
         return None
 
-    db_topics = (
-        db.session.scalars(
-            _select_topics(include_hidden=include_hidden)
-            .join(DbBoardCategory)
-            .filter(DbBoardCategory.board_id == board_id)
-            .filter(DbBoardCategory.hidden == False)  # noqa: E712
-            .order_by(DbTopic.last_updated_at.desc())
-            .limit(limit)
-        )
-        .unique()
-        .all()
-    )
+    rows = db.session.execute(
+        _select_topics(current_user, include_hidden=include_hidden)
+        .filter(DbBoardCategory.board_id == board_id)
+        .filter(DbBoardCategory.hidden == False)  # noqa: E712
+        .order_by(DbTopic.last_updated_at.desc())
+        .limit(limit)
+    ).all()
 
-    return _to_topic_summaries(db_topics, current_user)
+    return _to_topic_summaries(rows, current_user)
 
 
 def paginate_topics(
@@ -132,27 +146,19 @@ def paginate_topics(
 ) -> Pagination:
     """Paginate topics in that board."""
     stmt = (
-        _select_topics(include_hidden=include_hidden)
-        .join(DbBoardCategory)
+        _select_topics(current_user, include_hidden=include_hidden)
         .filter(DbBoardCategory.board_id == board_id)
         .filter(DbBoardCategory.hidden == False)  # noqa: E712
         .order_by(DbTopic.last_updated_at.desc())
     )
 
-    pagination = paginate(stmt, page, per_page)
+    pagination = paginate_with_window_count(stmt, page, per_page)
 
     pagination.items = _to_topic_summaries(pagination.items, current_user)
 
     return pagination
 
 
-def get_all_topic_ids() -> set[TopicID]:
-    """Return the IDs of all topics."""
-    topic_ids = db.session.scalars(select(DbTopic.id)).all()
-
-    return set(topic_ids)
-
-
 def get_all_topic_ids_in_category(category_id: BoardCategoryID) -> set[TopicID]:
     """Return the IDs of all topics in the category."""
     topic_ids = db.session.scalars(
@@ -175,35 +181,45 @@ def paginate_topics_of_category(
     Pinned topics are returned first.
     """
     stmt = (
-        _select_topics(include_hidden=include_hidden)
-        .filter_by(category_id=category_id)
+        _select_topics(current_user, include_hidden=include_hidden)
+        .filter(DbTopic.category_id == category_id)
         .order_by(DbTopic.pinned.desc(), DbTopic.last_updated_at.desc())
     )
 
-    pagination = paginate(stmt, page, per_page)
+    pagination = paginate_with_window_count(stmt, page, per_page)
 
     pagination.items = _to_topic_summaries(pagination.items, current_user)
 
     return pagination
 
 
-def _select_topics(*, include_hidden: bool = False) -> Select:
-    stmt = select(DbTopic).options(
-        db.joinedload(DbTopic.category),
-    )
+def _select_topics(
+    current_user: CurrentUser, *, include_hidden: bool = False
+) -> Select:
+    """Select topics, with their categories, along with the time the
+    user has last viewed each of them.
+    """
+    if current_user.authenticated:
+        stmt = _select_topics_with_last_viewed_at(current_user.id)
+    else:
+        stmt = select(DbTopic, db.null()).join(DbTopic.category)
+
+    stmt = stmt.options(db.contains_eager(DbTopic.category))
 
     if not include_hidden:
-        stmt = stmt.filter_by(hidden=False)
+        stmt = stmt.filter(DbTopic.hidden == False)  # noqa: E712
 
     return stmt
 
 
 def _to_topic_summaries(
-    db_topics: Iterable[DbTopic], current_user: CurrentUser
+    rows: Sequence[tuple[DbTopic, datetime | None]], current_user: CurrentUser
 ) -> list[BoardTopicSummary]:
-    """Build summary objects."""
-    creator_ids = {t.creator_id for t in db_topics}
-    last_updated_by_ids = {t.last_updated_by_id for t in db_topics}
+    """Build summary objects from topics along with the time the user
+    has last viewed each of them.
+    """
+    creator_ids = {db_topic.creator_id for db_topic, _ in rows}
+    last_updated_by_ids = {db_topic.last_updated_by_id for db_topic, _ in rows}
     user_ids = creator_ids | last_updated_by_ids
 
     users_by_id = user_service.get_users_indexed_by_id(
@@ -212,7 +228,7 @@ def _to_topic_summaries(
 
     summaries = []
 
-    for db_topic in db_topics:
+    for db_topic, last_viewed_at in rows:
         category = BoardTopicCategory(
             slug=db_topic.category.slug,
             title=db_topic.category.title,
@@ -223,7 +239,7 @@ def _to_topic_summaries(
         last_updated_by = users_by_id[db_topic.last_updated_by_id]
 
         contains_unseen_postings = _contains_topic_unseen_postings(
-            db_topic.id, db_topic.last_updated_at, current_user
+            db_topic.last_updated_at, last_viewed_at, current_user
         )
 
         summary = BoardTopicSummary(
@@ -247,6 +263,83 @@ def _to_topic_summaries(
     return summaries
 
 
+def _contains_topic_unseen_postings(
+    last_updated_at: datetime,
+    last_viewed_at: datetime | None,
+    current_user: CurrentUser,
+) -> bool:
+    """Return `True` if the topic contains postings created after the
+    last time the user viewed it.
+    """
+    if not current_user.authenticated:
+        return False
+
+    return last_viewed_at is None or last_updated_at > last_viewed_at
+
+
+def find_topic_last_viewed_at(
+    topic_id: TopicID, user_id: UserID
+) -> datetime | None:
+    """Return the time the topic was last viewed by the user (or
+    nothing, if it hasn't been viewed by the user yet).
+
+    Marking all topics of the topic's board or category as viewed
+    counts as viewing the topic.
+    """
+    row = db.session.execute(
+        _select_topics_with_last_viewed_at(user_id).filter(
+            DbTopic.id == topic_id
+        )
+    ).first()
+
+    if row is None:
+        return None
+
+    return row[1]
+
+
+def _select_topics_with_last_viewed_at(user_id: UserID) -> Select:
+    """Select topics along with the time the user has last viewed each
+    of them.
+
+    Marking all topics of a topic's board or category as viewed counts
+    as viewing the topic.
+    """
+    return (
+        select(
+            DbTopic,
+            # `GREATEST` ignores `NULL` values.
+            db.func.greatest(
+                DbLastTopicView.occurred_at,
+                DbCategoryReadWatermark.read_until,
+                DbBoardReadWatermark.read_until,
+            ),
+        )
+        .join(DbTopic.category)
+        .outerjoin(
+            DbLastTopicView,
+            db.and_(
+                DbLastTopicView.topic_id == DbTopic.id,
+                DbLastTopicView.user_id == user_id,
+            ),
+        )
+        .outerjoin(
+            DbCategoryReadWatermark,
+            db.and_(
+                DbCategoryReadWatermark.category_id == DbTopic.category_id,
+                DbCategoryReadWatermark.user_id == user_id,
+            ),
+        )
+        .outerjoin(
+            DbBoardReadWatermark,
+            db.and_(
+                DbBoardReadWatermark.board_id == DbBoardCategory.board_id,
+                DbBoardReadWatermark.user_id == user_id,
+            ),
+        )
+    )
+
+
 def find_default_posting_to_jump_to(
     topic_id: TopicID, last_viewed_at: datetime, *, include_hidden: bool = False
 ) -> DbPosting | None:
@@ -305,32 +398,3 @@ def _db_entity_to_topic(db_topic: DbTopic) -> Topic:
         posting_limited_to_moderators=db_topic.posting_limited_to_moderators,
         muted=db_topic.muted,
     )
-
-
-# last view
-
-
-def _contains_topic_unseen_postings(
-    topic_id: TopicID, last_updated_at: datetime, current_user: CurrentUser
-) -> bool:
-    """Return `True` if the topic contains postings created after the
-    last time the user viewed it.
-    """
-    if not current_user.authenticated:
-        return False
-
-    last_viewed_at = find_topic_last_viewed_at(topic_id, current_user.id)
-    return last_viewed_at is None or last_updated_at > last_viewed_at
-
-
-def find_topic_last_viewed_at(
-    topic_id: TopicID, user_id: UserID
-) -> datetime | None:
-    """Return the time the topic was last viewed by the user (or
-    nothing, if it hasn't been viewed by the user yet).
-    """
-    db_last_view = db.session.scalars(
-        select(DbLastTopicView).filter_by(user_id=user_id, topic_id=topic_id)
-    ).first()
-
-    return db_last_view.occurred_at if (db_last_view is not None) else None
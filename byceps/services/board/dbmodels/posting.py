@@ -23,6 +23,11 @@ class DbPosting(db.Model):
     """A posting."""
 
     __tablename__ = 'board_postings'
+    __table_args__ = (
+        db.Index(
+            'ix_board_postings_topic_id_created_at', 'topic_id', 'created_at'
+        ),
+    )
 
     id: Mapped[PostingID] = mapped_column(db.Uuid, primary_key=True)
     topic_id: Mapped[TopicID] = mapped_column(
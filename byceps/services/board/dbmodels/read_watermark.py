@@ -0,0 +1,64 @@
+"""
+byceps.services.board.dbmodels.read_watermark
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Marking all topics (of a board or category) as read stores a single
+point in time ("everything before this has been read") per user instead
+of a view per topic.
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import datetime
+
+from sqlalchemy.orm import Mapped, mapped_column
+
+from byceps.database import db
+from byceps.services.board.models import BoardCategoryID, BoardID
+from byceps.services.user.models import UserID
+
+
+class DbBoardReadWatermark(db.Model):
+    """The time before which a user has read all topics of a board."""
+
+    __tablename__ = 'board_read_watermarks'
+
+    user_id: Mapped[UserID] = mapped_column(
+        db.Uuid, db.ForeignKey('users.id'), primary_key=True
+    )
+    board_id: Mapped[BoardID] = mapped_column(
+        db.UnicodeText, db.ForeignKey('boards.id'), primary_key=True
+    )
+    read_until: Mapped[datetime]
+
+    def __init__(
+        self, user_id: UserID, board_id: BoardID, read_until: datetime
+    ) -> None:
+        self.user_id = user_id
+        self.board_id = board_id
+        self.read_until = read_until
+
+
+class DbCategoryReadWatermark(db.Model):
+    """The time before which a user has read all topics of a category."""
+
+    __tablename__ = 'board_category_read_watermarks'
+
+    user_id: Mapped[UserID] = mapped_column(
+        db.Uuid, db.ForeignKey('users.id'), primary_key=True
+    )
+    category_id: Mapped[BoardCategoryID] = mapped_column(
+        db.Uuid, db.ForeignKey('board_categories.id'), primary_key=True
+    )
+    read_until: Mapped[datetime]
+
+    def __init__(
+        self,
+        user_id: UserID,
+        category_id: BoardCategoryID,
+        read_until: datetime,
+    ) -> None:
+        self.user_id = user_id
+        self.category_id = category_id
+        self.read_until = read_until
@@ -52,6 +52,19 @@ def add_page_arg(args, page) -> dict[str, Any]:
     return args
 
 
+@blueprint.app_template_global()
+def add_cursor_arg(args, cursor) -> dict[str, Any]:
+    """Add the 'cursor' value.
+
+    Used for keyset pagination.
+    """
+    if args is None:
+        args = {}
+
+    args['cursor'] = cursor
+    return args
+
+
 @blueprint.before_app_request
 def prepare_request_globals() -> None:
     g.app_mode = get_current_byceps_app().byceps_app_mode
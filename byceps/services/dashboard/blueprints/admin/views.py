@@ -83,7 +83,8 @@ def view_global():
         one_week_ago
     )
 
-    uninitialized_user_count = user_stats_service.count_uninitialized_users()
+    user_state_counts = user_stats_service.count_users_by_state()
+    uninitialized_user_count = user_state_counts.uninitialized
 
     orgas_with_next_birthdays = list(
         orga_birthday_service.collect_orgas_with_next_birthdays(limit=3)
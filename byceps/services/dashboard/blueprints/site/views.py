@@ -9,8 +9,11 @@ Current user's dashboard
 """
 
 from collections.abc import Sequence
+from datetime import timedelta
 
-from flask import abort, g
+from flask import abort, g, render_template
+from flask_babel import get_locale
+from markupsafe import Markup
 
 from byceps.services.board.blueprints.site import (
     service as board_helper_service,
@@ -19,7 +22,6 @@ from byceps.services.guest_server import guest_server_service
 from byceps.services.guest_server.blueprints.site.views import _sort_addresses
 from byceps.services.guest_server.models import Server
 from byceps.services.news import news_item_service
-from byceps.services.news.models import NewsHeadline
 from byceps.services.shop.order import order_service
 from byceps.services.shop.order.models.order import SiteOrderListItem
 from byceps.services.shop.storefront import storefront_service
@@ -27,11 +29,18 @@ from byceps.services.ticketing import ticket_service
 from byceps.services.ticketing.dbmodels.ticket import DbTicket
 from byceps.services.user import user_service
 from byceps.services.user.models import UserID
+from byceps.util import fragment_cache
+from byceps.util.fragment_cache_invalidation import NEWS
 from byceps.util.framework.blueprint import create_blueprint
 from byceps.util.framework.templating import templated
 from byceps.util.views import login_required
 
 
+# News items can be scheduled to be published later, which does not
+# invalidate the cache.
+NEWS_TTL = timedelta(minutes=1)
+
+
 blueprint = create_blueprint('dashboard', __name__)
 
 
@@ -46,7 +55,7 @@ def index():
 
     open_orders = _get_open_orders(user.id)
     tickets = _get_tickets(user.id)
-    news_headlines = _get_news_headlines()
+    news_html = _render_news_headlines()
     board_topics = board_helper_service.get_recent_topics()
 
     guest_servers = _get_guest_servers()
@@ -54,7 +63,7 @@ def index():
     return {
         'open_orders': open_orders,
         'tickets': tickets,
-        'news_headlines': news_headlines,
+        'news_html': news_html,
         'board_topics': board_topics,
         'guest_servers': guest_servers,
         'sort_guest_server_addresses': _sort_addresses,
@@ -84,12 +93,30 @@ def _get_tickets(user_id: UserID) -> Sequence[DbTicket]:
     return ticket_service.get_tickets_used_by_user(user_id, g.party.id)
 
 
-def _get_news_headlines() -> list[NewsHeadline] | None:
+def _render_news_headlines() -> Markup | None:
+    """Render the most recent news headlines.
+
+    They are the same for all users, so they are cached.
+    """
     channel_ids = g.site.news_channel_ids
     if not channel_ids:
         return None
 
-    return news_item_service.get_recent_headlines(channel_ids, limit=4)
+    def render() -> str:
+        news_headlines = news_item_service.get_recent_headlines(
+            channel_ids, limit=4
+        )
+        return render_template(
+            'site/dashboard/_news.html', news_headlines=news_headlines
+        )
+
+    key = f'dashboard:news:{g.site.id}:{get_locale()}'
+    html = fragment_cache.get_or_render(
+        key, render, ttl=NEWS_TTL, depends_on=[NEWS]
+    )
+
+    # The fragment has been rendered from an autoescaping template.
+    return Markup(html)  # noqa: S704
 
 
 def _get_guest_servers() -> list[Server] | None:
@@ -6,10 +6,13 @@ byceps.services.email.email_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from datetime import timedelta
 from email.message import EmailMessage
 from email.utils import parseaddr
-from smtplib import SMTP, SMTP_SSL
+import json
+import time
 
+from redis.exceptions import RedisError
 import structlog
 
 from byceps.byceps_app import get_current_byceps_app
@@ -17,9 +20,20 @@ from byceps.config.models import SmtpConfig
 from byceps.util.jobqueue import enqueue
 from byceps.util.result import Err, Ok, Result
 
+from . import smtp_connection_pool
 from .models import Message, NameAndAddress
 
 
+# Send at most this many queued messages per job.
+BATCH_SIZE = 50
+
+OUTBOX_KEY = 'email:outbox'
+OUTBOX_PROCESSING_KEY = 'email:outbox:processing'
+OUTBOX_JOB_ENQUEUED_KEY = 'email:outbox:job_enqueued'
+OUTBOX_JOB_ENQUEUED_TTL = timedelta(minutes=5)
+DELIVERY_METRICS_KEY = 'email:delivery_metrics'
+
+
 log = structlog.get_logger()
 
 
@@ -35,9 +49,47 @@ def parse_address(address_str: str) -> Result[NameAndAddress, str]:
 
 def enqueue_message(message: Message) -> None:
     """Enqueue e-mail to be sent asynchronously."""
-    enqueue_email(
-        message.sender, message.recipients, message.subject, message.body
-    )
+    enqueue_messages([message])
+
+
+def enqueue_messages(messages: list[Message]) -> None:
+    """Enqueue e-mails to be sent asynchronously, in batches over as few
+    SMTP connections as possible.
+    """
+    if not messages:
+        return
+
+    if not get_current_byceps_app().byceps_config.jobs.asynchronous:
+        for message in messages:
+            enqueue(
+                send_email,
+                message.sender.format(),
+                message.recipients,
+                message.subject,
+                message.body,
+            )
+        return
+
+    serialized_messages = [
+        _serialize_message(
+            message.sender.format(),
+            message.recipients,
+            message.subject,
+            message.body,
+        )
+        for message in messages
+    ]
+
+    redis_client = get_current_byceps_app().redis_client
+
+    redis_client.rpush(OUTBOX_KEY, *serialized_messages)
+
+    # Only enqueue a job if none is waiting to be run already. The
+    # marker expires in case the job gets lost.
+    if redis_client.set(
+        OUTBOX_JOB_ENQUEUED_KEY, 1, nx=True, ex=OUTBOX_JOB_ENQUEUED_TTL
+    ):
+        enqueue(send_queued_emails)
 
 
 def enqueue_email(
@@ -47,8 +99,82 @@ def enqueue_email(
     body: str,
 ) -> None:
     """Enqueue e-mail to be sent asynchronously."""
-    sender_str = sender.format()
-    enqueue(send_email, sender_str, recipients, subject, body)
+    enqueue_message(
+        Message(
+            sender=sender, recipients=recipients, subject=subject, body=body
+        )
+    )
+
+
+def send_queued_emails() -> None:
+    """Send a batch of messages from the outbox.
+
+    The messages are moved to a processing list first and only removed
+    from there once they have been handed over, so that they do not get
+    lost if the worker dies in the middle of the batch.
+
+    A message that cannot be sent is enqueued to be sent on its own so
+    that a failure does not cause the other messages to be sent again.
+
+    Another job is enqueued as long as the outbox is not empty.
+    """
+    redis_client = get_current_byceps_app().redis_client
+
+    # Messages enqueued from now on are not guaranteed to be picked up
+    # by this job, so let them enqueue another one.
+    redis_client.delete(OUTBOX_JOB_ENQUEUED_KEY)
+
+    serialized_messages = _move_batch_to_processing()
+
+    for serialized_message in serialized_messages:
+        sender, recipients, subject, body = _deserialize_message(
+            serialized_message
+        )
+
+        try:
+            send(sender, recipients, subject, body)
+        except Exception as exc:
+            log.warning(
+                'Sending queued email failed, enqueueing it separately',
+                exc_info=exc,
+            )
+            enqueue(send_email, sender, recipients, subject, body)
+
+        redis_client.lrem(OUTBOX_PROCESSING_KEY, 1, serialized_message)
+
+    if redis_client.llen(OUTBOX_KEY) and redis_client.set(
+        OUTBOX_JOB_ENQUEUED_KEY, 1, nx=True, ex=OUTBOX_JOB_ENQUEUED_TTL
+    ):
+        enqueue(send_queued_emails)
+
+
+def _move_batch_to_processing() -> list[bytes]:
+    """Move up to `BATCH_SIZE` messages from the outbox to the
+    processing list, atomically, and return them.
+    """
+    with get_current_byceps_app().redis_client.pipeline() as pipeline:
+        for _ in range(BATCH_SIZE):
+            pipeline.lmove(OUTBOX_KEY, OUTBOX_PROCESSING_KEY, 'LEFT', 'RIGHT')
+        serialized_messages = pipeline.execute()
+
+    return [
+        serialized_message
+        for serialized_message in serialized_messages
+        if serialized_message is not None
+    ]
+
+
+def _serialize_message(
+    sender: str, recipients: list[str], subject: str, body: str
+) -> str:
+    return json.dumps([sender, recipients, subject, body])
+
+
+def _deserialize_message(
+    serialized_message: bytes,
+) -> tuple[str, list[str], str, str]:
+    sender, recipients, subject, body = json.loads(serialized_message)
+    return sender, recipients, subject, body
 
 
 def send_email(
@@ -85,33 +211,68 @@ def _build_message(
 
 
 def _send_via_smtp(smtp_config: SmtpConfig, message: EmailMessage) -> None:
-    """Send email via SMTP."""
-    if smtp_config.use_ssl:
-        _send_via_smtp_with_ssl(smtp_config, message)
-    else:
-        _send_via_smtp_without_ssl(smtp_config, message)
-
-
-def _send_via_smtp_with_ssl(
-    smtp_config: SmtpConfig, message: EmailMessage
-) -> None:
-    """Send email via SMTP with SSL."""
-    with SMTP_SSL(smtp_config.host, smtp_config.port) as smtp:
-        if smtp_config.username and smtp_config.password:
-            smtp.login(smtp_config.username, smtp_config.password)
-
-        smtp.send_message(message)
-
-
-def _send_via_smtp_without_ssl(
-    smtp_config: SmtpConfig, message: EmailMessage
-) -> None:
-    """Send email via SMTP without SSL (but potentially with STARTTLS)."""
-    with SMTP(smtp_config.host, smtp_config.port) as smtp:
-        if smtp_config.starttls:
-            smtp.starttls()
+    """Send email via SMTP, reusing this process' connection."""
+    pool = smtp_connection_pool.get_pool(smtp_config)
+    connections_opened_before = pool.connections_opened
+    started_at = time.perf_counter()
+
+    try:
+        pool.send_message(message)
+    except Exception:
+        _record_delivery_metrics({'messages_failed': 1})
+        raise
+
+    _record_delivery_metrics(
+        {
+            'messages_sent': 1,
+            'connections_opened': (
+                pool.connections_opened - connections_opened_before
+            ),
+            'send_seconds': time.perf_counter() - started_at,
+        }
+    )
 
-        if smtp_config.username and smtp_config.password:
-            smtp.login(smtp_config.username, smtp_config.password)
 
-        smtp.send_message(message)
+# throughput metrics
+
+
+def get_delivery_metrics() -> dict[str, float]:
+    """Return the totals of sent and failed messages, opened connections,
+    and seconds spent sending, across all processes.
+    """
+    try:
+        values = get_current_byceps_app().redis_client.hgetall(
+            DELIVERY_METRICS_KEY
+        )
+    except RedisError as exc:
+        log.warning('Could not read email delivery metrics', exc_info=exc)
+        values = {}
+
+    metrics = dict.fromkeys(_DELIVERY_METRIC_NAMES, 0.0)
+    for name, value in values.items():
+        metrics[name.decode('utf-8')] = float(value)
+
+    return metrics
+
+
+def _record_delivery_metrics(increments: dict[str, float]) -> None:
+    try:
+        pipeline = get_current_byceps_app().redis_client.pipeline(
+            transaction=False
+        )
+        for name, increment in increments.items():
+            if isinstance(increment, int):
+                pipeline.hincrby(DELIVERY_METRICS_KEY, name, increment)
+            else:
+                pipeline.hincrbyfloat(DELIVERY_METRICS_KEY, name, increment)
+        pipeline.execute()
+    except RedisError as exc:
+        log.warning('Could not record email delivery metrics', exc_info=exc)
+
+
+_DELIVERY_METRIC_NAMES = [
+    'messages_sent',
+    'messages_failed',
+    'connections_opened',
+    'send_seconds',
+]
@@ -0,0 +1,186 @@
+"""
+byceps.services.email.smtp_connection_pool
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Reuse an SMTP connection for multiple messages instead of connecting,
+negotiating TLS, and logging in again for each one.
+
+A connection that has been idle for a while is checked (with `NOOP`)
+before it is reused. After a number of messages, it is replaced by a
+new one so that servers limiting messages per connection are not hit.
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from collections.abc import Callable
+from email.message import EmailMessage
+import os
+from smtplib import SMTP, SMTP_SSL, SMTPException, SMTPServerDisconnected
+from threading import Lock, RLock
+import time
+
+import structlog
+
+from byceps.config.models import SmtpConfig
+
+
+# Close a connection after sending this many messages over it.
+MAX_MESSAGES_PER_CONNECTION = 100
+
+# Check that the server is still there before reusing a connection that
+# has been idle for longer than this many seconds.
+MAX_IDLE_SECONDS = 30.0
+
+
+log = structlog.get_logger()
+
+
+class SmtpConnectionPool:
+    """Hold one SMTP connection (to the configured server) for reuse.
+
+    Threads of the same process (e.g. of a web worker that sends
+    messages without a job queue) take turns using the connection.
+    """
+
+    def __init__(
+        self,
+        smtp_config: SmtpConfig,
+        *,
+        connect: Callable[[SmtpConfig], SMTP] | None = None,
+        max_messages_per_connection: int = MAX_MESSAGES_PER_CONNECTION,
+        max_idle_seconds: float = MAX_IDLE_SECONDS,
+    ) -> None:
+        self.smtp_config = smtp_config
+        self._connect = connect or open_connection
+        self.max_messages_per_connection = max_messages_per_connection
+        self.max_idle_seconds = max_idle_seconds
+
+        self._lock = RLock()
+        self._connection: SMTP | None = None
+        self._message_count = 0
+        self._last_used_at = 0.0
+
+        self.connections_opened = 0
+
+    def send_message(self, message: EmailMessage) -> None:
+        """Send the message, reusing the current connection if possible.
+
+        If the server has closed the connection in the meantime, send
+        the message again over a new connection.
+        """
+        with self._lock:
+            connection = self._get_connection()
+
+            try:
+                connection.send_message(message)
+            except SMTPServerDisconnected:
+                log.info('SMTP server closed connection, reconnecting')
+                self._discard_connection()
+                connection = self._get_connection()
+                connection.send_message(message)
+
+            self._message_count += 1
+            self._last_used_at = time.monotonic()
+
+            if self._message_count >= self.max_messages_per_connection:
+                self.close()
+
+    def close(self) -> None:
+        """Close the current connection, if any."""
+        with self._lock:
+            connection = self._connection
+            if connection is None:
+                return
+
+            self._connection = None
+
+            try:
+                connection.quit()
+            except SMTPException:
+                connection.close()
+
+    def _get_connection(self) -> SMTP:
+        connection = self._connection
+        if (connection is not None) and not self._is_usable(connection):
+            self._discard_connection()
+
+        if self._connection is None:
+            self._connection = self._connect(self.smtp_config)
+            self._message_count = 0
+            self._last_used_at = time.monotonic()
+            self.connections_opened += 1
+
+        return self._connection
+
+    def _is_usable(self, connection: SMTP) -> bool:
+        idle_seconds = time.monotonic() - self._last_used_at
+        if idle_seconds < self.max_idle_seconds:
+            return True
+
+        try:
+            status_code, _ = connection.noop()
+        except SMTPException:
+            return False
+
+        return status_code == 250
+
+    def _discard_connection(self) -> None:
+        connection = self._connection
+        self._connection = None
+
+        if connection is not None:
+            connection.close()
+
+
+def open_connection(smtp_config: SmtpConfig) -> SMTP:
+    """Connect to the SMTP server and log in (if configured)."""
+    smtp: SMTP
+    if smtp_config.use_ssl:
+        smtp = SMTP_SSL(smtp_config.host, smtp_config.port)
+    else:
+        smtp = SMTP(smtp_config.host, smtp_config.port)
+        if smtp_config.starttls:
+            smtp.starttls()
+
+    try:
+        if smtp_config.username and smtp_config.password:
+            smtp.login(smtp_config.username, smtp_config.password)
+    except SMTPException:
+        smtp.close()
+        raise
+
+    return smtp
+
+
+class _PoolHolder:
+    """Create a pool lazily per process, as connections must not be
+    shared with the parent of a forked process.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._pool: SmtpConnectionPool | None = None
+        self._pid: int | None = None
+
+    def get(self, smtp_config: SmtpConfig) -> SmtpConnectionPool:
+        with self._lock:
+            pid = os.getpid()
+            if self._pool is not None and self._pid == pid:
+                if self._pool.smtp_config == smtp_config:
+                    return self._pool
+
+                self._pool.close()
+
+            self._pool = SmtpConnectionPool(smtp_config)
+            self._pid = pid
+
+            return self._pool
+
+
+_pool_holder = _PoolHolder()
+
+
+def get_pool(smtp_config: SmtpConfig) -> SmtpConnectionPool:
+    """Return this process' pool for the SMTP configuration."""
+    return _pool_holder.get(smtp_config)
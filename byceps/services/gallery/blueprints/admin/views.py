@@ -15,6 +15,7 @@ from byceps.services.gallery import gallery_import_service, gallery_service
 from byceps.services.gallery.errors import (
     GalleryAlreadyAtBottomError,
     GalleryAlreadyAtTopError,
+    GalleryImportAlreadyInProgressError,
 )
 from byceps.services.gallery.models import Gallery, GalleryID
 from byceps.util.framework.blueprint import create_blueprint
@@ -205,8 +206,11 @@ def scan_images(gallery_id):
 
     image_file_sets = gallery_import_service.get_image_file_sets(gallery)
 
+    import_progress = gallery_import_service.get_import_progress(gallery.id)
+
     return {
         'image_file_sets': image_file_sets,
+        'import_progress': import_progress,
         'gallery': gallery,
         'brand': brand,
     }
@@ -215,17 +219,19 @@ def scan_images(gallery_id):
 @blueprint.post('/galleries/<uuid:gallery_id>/import_images')
 @permission_required('gallery.administrate')
 def import_images(gallery_id):
-    """Import images into the gallery."""
-    gallery = _get_gallery_or_404(gallery_id)
+    """Import images into the gallery.
 
-    image_file_sets = gallery_import_service.get_image_file_sets(gallery)
-    gallery_import_service.import_images_in_gallery_path(
-        gallery, image_file_sets
-    )
+    The import runs in the background.
+    """
+    gallery = _get_gallery_or_404(gallery_id)
 
-    flash_success(gettext('Images have been imported.'))
+    match gallery_import_service.start_import(gallery):
+        case Ok(_):
+            flash_success(gettext('Image import has been started.'))
+        case Err(GalleryImportAlreadyInProgressError()):
+            flash_error(gettext('An image import is already in progress.'))
 
-    return redirect_to('.gallery_view', gallery_id=gallery.id)
+    return redirect_to('.scan_images', gallery_id=gallery.id)
 
 
 # -------------------------------------------------------------------- #
@@ -17,3 +17,8 @@ class GalleryAlreadyAtBottomError:
 @dataclass(frozen=True)
 class GalleryAlreadyAtTopError:
     pass
+
+
+@dataclass(frozen=True)
+class GalleryImportAlreadyInProgressError:
+    pass
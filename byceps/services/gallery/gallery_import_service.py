@@ -2,18 +2,63 @@
 byceps.services.gallery.gallery_import_service
 ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
+Import image files from a gallery's filesystem path.
+
+Imports run as jobs. Missing previews are generated in a process pool,
+then all images are added in a single transaction. The progress is
+tracked in Redis.
+
 :Copyright: 2014-2026 Jochen Kupperschmidt
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
 from collections.abc import Iterable, Iterator
+from concurrent.futures import as_completed, ProcessPoolExecutor
 from dataclasses import dataclass
+from datetime import timedelta
 from pathlib import Path
 
+from redis import Redis
+import structlog
+
 from byceps.byceps_app import get_current_byceps_app
+from byceps.util.image.dimensions import Dimensions
+from byceps.util.image.image_type import ImageType
+from byceps.util.image.thumbnail import create_thumbnail
+from byceps.util.jobqueue import enqueue
+from byceps.util.result import Err, Ok, Result
 
 from . import gallery_service
-from .models import Gallery, GalleryImage
+from .errors import GalleryImportAlreadyInProgressError
+from .models import (
+    Gallery,
+    GalleryID,
+    GalleryImportProgress,
+    GalleryImportState,
+)
+
+
+log = structlog.get_logger()
+
+
+PREVIEW_MAXIMUM_DIMENSIONS = Dimensions(400, 300)
+
+# Only JPEG files are imported (see `get_image_file_sets`).
+PREVIEW_IMAGE_TYPE = ImageType.jpeg
+
+# Store the progress after each time this many previews have been
+# generated, not after every single one.
+PROGRESS_UPDATE_INTERVAL = 25
+
+# Generate previews in at most this many processes at a time so that an
+# import does not take all of the worker host's CPU cores.
+PREVIEW_PROCESS_COUNT = 4
+
+# If an import does not finish within this time (e.g. because the
+# worker died), another one may be started.
+IMPORT_LOCK_TIMEOUT = timedelta(hours=1)
+
+PROGRESS_RETENTION = timedelta(days=1)
 
 
 @dataclass(frozen=True, kw_only=True, order=True)
@@ -42,30 +87,210 @@ def get_image_file_sets(
     return image_file_sets
 
 
+def start_import(
+    gallery: Gallery,
+) -> Result[None, GalleryImportAlreadyInProgressError]:
+    """Import the images in the gallery's filesystem path in the
+    background.
+    """
+    redis_client = get_current_byceps_app().redis_client
+
+    lock_acquired = redis_client.set(
+        _get_lock_key(gallery.id), '1', nx=True, ex=IMPORT_LOCK_TIMEOUT
+    )
+    if not lock_acquired:
+        return Err(GalleryImportAlreadyInProgressError())
+
+    _store_progress(
+        redis_client,
+        gallery.id,
+        state=GalleryImportState.pending,
+        image_count=0,
+        missing_preview_count=0,
+        generated_preview_count=0,
+    )
+
+    enqueue(import_images, gallery.id)
+
+    return Ok(None)
+
+
+def import_images(gallery_id: GalleryID) -> None:
+    """Import the images in the gallery's filesystem path, and generate
+    missing previews first.
+
+    Meant to be run as a job (see `start_import`).
+    """
+    redis_client = get_current_byceps_app().redis_client
+
+    try:
+        _import_images(redis_client, gallery_id)
+    except Exception:
+        _store_progress(
+            redis_client, gallery_id, state=GalleryImportState.failed
+        )
+        raise
+    finally:
+        redis_client.delete(_get_lock_key(gallery_id))
+
+
+def _import_images(redis_client: Redis, gallery_id: GalleryID) -> None:
+    gallery = gallery_service.find_gallery(gallery_id)
+    if gallery is None:
+        raise ValueError(f'Unknown gallery ID "{gallery_id}"')
+
+    gallery_path = _get_gallery_filesystem_path(None, gallery)
+    image_file_sets = get_image_file_sets(gallery)
+    preview_missing_file_sets = [
+        image_file_set
+        for image_file_set in image_file_sets
+        if not image_file_set.preview_exists
+    ]
+
+    _store_progress(
+        redis_client,
+        gallery_id,
+        state=GalleryImportState.generating_previews,
+        image_count=len(image_file_sets),
+        missing_preview_count=len(preview_missing_file_sets),
+        generated_preview_count=0,
+    )
+
+    _generate_previews(
+        redis_client, gallery_id, gallery_path, preview_missing_file_sets
+    )
+
+    _store_progress(
+        redis_client, gallery_id, state=GalleryImportState.importing
+    )
+
+    import_images_in_gallery_path(gallery, image_file_sets)
+
+    _store_progress(redis_client, gallery_id, state=GalleryImportState.finished)
+
+    log.info(
+        'Gallery images imported',
+        gallery_id=str(gallery_id),
+        image_count=len(image_file_sets),
+        generated_preview_count=len(preview_missing_file_sets),
+    )
+
+
+def _generate_previews(
+    redis_client: Redis,
+    gallery_id: GalleryID,
+    gallery_path: Path,
+    image_file_sets: list[ImageFileSet],
+) -> None:
+    """Generate the previews in parallel, in separate processes."""
+    if not image_file_sets:
+        return
+
+    max_workers = min(PREVIEW_PROCESS_COUNT, len(image_file_sets))
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                _create_preview,
+                gallery_path / image_file_set.full_filename,
+                gallery_path / image_file_set.preview_filename,
+            )
+            for image_file_set in image_file_sets
+        ]
+
+        for generated_count, future in enumerate(
+            as_completed(futures), start=1
+        ):
+            # Raise exception, if any occurred.
+            future.result()
+
+            if (generated_count % PROGRESS_UPDATE_INTERVAL == 0) or (
+                generated_count == len(futures)
+            ):
+                _store_progress(
+                    redis_client,
+                    gallery_id,
+                    generated_preview_count=generated_count,
+                )
+
+
+def _create_preview(full_path: Path, preview_path: Path) -> None:
+    """Create a preview from the full image.
+
+    Runs in a separate process.
+    """
+    stream = create_thumbnail(
+        str(full_path), PREVIEW_IMAGE_TYPE.name, PREVIEW_MAXIMUM_DIMENSIONS
+    )
+    preview_path.write_bytes(stream.read())
+
+
 def import_images_in_gallery_path(
     gallery: Gallery,
     image_file_sets: list[ImageFileSet],
 ) -> None:
-    """Import all matching files in the gallery's path as images."""
+    """Import all matching files in the gallery's path as images.
+
+    The first image becomes the gallery's title image.
+    """
     if not image_file_sets:
         return None
 
-    images = list(_create_images(gallery, sorted(image_file_sets)))
-    title_image = images[0]
+    filename_pairs = [
+        (image_file_set.full_filename, image_file_set.preview_filename)
+        for image_file_set in sorted(image_file_sets)
+    ]
 
-    gallery_service.set_gallery_title_image(gallery.id, title_image.id)
+    gallery_service.create_images(
+        gallery, filename_pairs, set_first_as_title_image=True
+    )
 
 
-def _create_images(
-    gallery: Gallery, image_file_sets: list[ImageFileSet]
-) -> Iterator[GalleryImage]:
-    """Create images for all matching files in the gallery's path as images."""
-    for image_file_set in image_file_sets:
-        yield gallery_service.create_image(
-            gallery,
-            image_file_set.full_filename,
-            image_file_set.preview_filename,
-        )
+def get_import_progress(gallery_id: GalleryID) -> GalleryImportProgress | None:
+    """Return the progress of the gallery's current or latest import,
+    if any.
+    """
+    redis_client = get_current_byceps_app().redis_client
+
+    data = redis_client.hgetall(_get_progress_key(gallery_id))
+    if not data:
+        return None
+
+    values = {field.decode(): value.decode() for field, value in data.items()}
+
+    return GalleryImportProgress(
+        state=GalleryImportState[values['state']],
+        image_count=int(values.get('image_count', 0)),
+        missing_preview_count=int(values.get('missing_preview_count', 0)),
+        generated_preview_count=int(values.get('generated_preview_count', 0)),
+    )
+
+
+def _store_progress(
+    redis_client: Redis,
+    gallery_id: GalleryID,
+    *,
+    state: GalleryImportState | None = None,
+    **counts: int,
+) -> None:
+    mapping: dict[str, str | int] = dict(counts)
+    if state is not None:
+        mapping['state'] = state.name
+
+    key = _get_progress_key(gallery_id)
+
+    with redis_client.pipeline() as pipeline:
+        pipeline.hset(key, mapping=mapping)
+        pipeline.expire(key, PROGRESS_RETENTION)
+        pipeline.execute()
+
+
+def _get_lock_key(gallery_id: GalleryID) -> str:
+    return f'gallery_import:{gallery_id}:lock'
+
+
+def _get_progress_key(gallery_id: GalleryID) -> str:
+    return f'gallery_import:{gallery_id}:progress'
 
 
 def _get_gallery_filesystem_path(
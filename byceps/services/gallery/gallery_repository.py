@@ -8,9 +8,9 @@ byceps.services.gallery.gallery_repository
 
 from collections.abc import Sequence
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, insert, select
 
-from byceps.database import db, upsert
+from byceps.database import db, execute_upsert, upsert
 from byceps.services.brand import brand_service
 from byceps.services.brand.models import BrandID
 from byceps.util.result import Err, Ok, Result
@@ -227,3 +227,58 @@ def create_image(image: GalleryImage) -> None:
     db_gallery.images.append(db_image)
 
     db.session.commit()
+
+
+def create_images(
+    gallery_id: GalleryID,
+    images: list[GalleryImage],
+    *,
+    title_image_id: GalleryImageID | None = None,
+) -> None:
+    """Add images to a gallery, after its existing images.
+
+    All images are inserted in bulk, in a single transaction.
+    """
+    # Lock the gallery to prevent concurrent additions from being
+    # assigned the same positions.
+    db.session.execute(
+        select(DbGallery.id).filter_by(id=gallery_id).with_for_update()
+    )
+
+    last_position = (
+        db.session.scalar(
+            select(db.func.max(DbGalleryImage.position)).filter_by(
+                gallery_id=gallery_id
+            )
+        )
+        or 0
+    )
+
+    if images:
+        db.session.execute(
+            insert(DbGalleryImage),
+            [
+                {
+                    'id': image.id,
+                    'created_at': image.created_at,
+                    'gallery_id': gallery_id,
+                    'position': position,
+                    'filename_full': image.filename_full,
+                    'filename_preview': image.filename_preview,
+                    'caption': image.caption,
+                    'hidden': image.hidden,
+                }
+                for position, image in enumerate(
+                    images, start=last_position + 1
+                )
+            ],
+        )
+
+    if title_image_id is not None:
+        table = DbGalleryTitleImage.__table__
+        identifier = {'gallery_id': gallery_id}
+        replacement = {'image_id': title_image_id}
+
+        execute_upsert(table, identifier, replacement)
+
+    db.session.commit()
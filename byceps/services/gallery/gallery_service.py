@@ -206,6 +206,35 @@ def create_image(
     return image
 
 
+def create_images(
+    gallery: Gallery,
+    filename_pairs: list[tuple[str, str]],
+    *,
+    set_first_as_title_image: bool = False,
+) -> list[GalleryImage]:
+    """Add images to a gallery, in a single transaction.
+
+    Each pair consists of the filenames of the full image and of its
+    preview.
+    """
+    images = [
+        gallery_domain_service.create_image(
+            gallery, filename_full, filename_preview, None, False
+        )
+        for filename_full, filename_preview in filename_pairs
+    ]
+
+    title_image_id = (
+        images[0].id if (images and set_first_as_title_image) else None
+    )
+
+    gallery_repository.create_images(
+        gallery.id, images, title_image_id=title_image_id
+    )
+
+    return images
+
+
 def _db_entity_to_image(
     db_image: DbGalleryImage, db_gallery: DbGallery
 ) -> GalleryImage:
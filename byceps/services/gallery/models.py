@@ -10,6 +10,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
+from enum import Enum
 from typing import NewType
 from uuid import UUID
 
@@ -62,3 +63,23 @@ class GalleryImage:
 @dataclass(frozen=True, kw_only=True)
 class GalleryWithImages(Gallery):
     images: list[GalleryImage]
+
+
+GalleryImportState = Enum(
+    'GalleryImportState',
+    [
+        'pending',
+        'generating_previews',
+        'importing',
+        'finished',
+        'failed',
+    ],
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class GalleryImportProgress:
+    state: GalleryImportState
+    image_count: int
+    missing_preview_count: int
+    generated_preview_count: int
@@ -6,14 +6,25 @@ byceps.services.homepage.blueprints.site.views
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from flask import g
+from datetime import timedelta
+
+from flask import g, render_template, session
+from flask_babel import get_locale
+from markupsafe import Markup
 
 from byceps.services.news import news_item_service
-from byceps.services.news.models import NewsTeaser
+from byceps.util import fragment_cache
+from byceps.util.fragment_cache_invalidation import NEWS, SNIPPETS
 from byceps.util.framework.blueprint import create_blueprint
 from byceps.util.framework.templating import templated
 
 
+# News items can be scheduled to be published later, which does not
+# invalidate the cache.
+PAGE_TTL = timedelta(minutes=1)
+NEWS_TTL = timedelta(minutes=1)
+
+
 blueprint = create_blueprint('homepage', __name__)
 
 
@@ -21,15 +32,30 @@ blueprint = create_blueprint('homepage', __name__)
 @templated
 def index():
     """Show homepage."""
-    news_teasers = _get_news_teasers()
+    # The page is the same for all anonymous users (as long as there
+    # are no flash messages pending to be rendered), so serve it from
+    # the cache.
+    if not g.user.authenticated and not session.get('_flashes'):
+        key = f'homepage:{g.site.id}:{get_locale()}'
+        return fragment_cache.get_or_render(
+            key, _render_page, ttl=PAGE_TTL, depends_on=[NEWS, SNIPPETS]
+        )
+
+    return _get_context()
+
 
+def _render_page() -> str:
+    return render_template('site/homepage/index.html', **_get_context())
+
+
+def _get_context() -> dict[str, Markup | None]:
     return {
-        'news_teasers': news_teasers,
+        'news_html': _render_news(),
     }
 
 
-def _get_news_teasers() -> list[NewsTeaser] | None:
-    """Return the most recent news teasers.
+def _render_news() -> Markup | None:
+    """Render the most recent news teasers.
 
     Returns `None` if no news channels are configured for this site.
     """
@@ -37,4 +63,18 @@ def _get_news_teasers() -> list[NewsTeaser] | None:
     if not channel_ids:
         return None
 
-    return news_item_service.get_recent_teasers(channel_ids, limit=3)
+    def render() -> str:
+        news_teasers = news_item_service.get_recent_teasers(
+            channel_ids, limit=3
+        )
+        return render_template(
+            'site/homepage/_news.html', news_teasers=news_teasers
+        )
+
+    key = f'homepage:news:{g.site.id}:{get_locale()}'
+    html = fragment_cache.get_or_render(
+        key, render, ttl=NEWS_TTL, depends_on=[NEWS]
+    )
+
+    # The fragment has been rendered from an autoescaping template.
+    return Markup(html)  # noqa: S704
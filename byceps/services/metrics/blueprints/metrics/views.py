@@ -10,7 +10,11 @@ Metrics export for `Prometheus <https://prometheus.io/>`_
 
 from flask import Response
 
-from byceps.services.metrics import metrics_service
+from byceps.byceps_app import get_current_byceps_app
+from byceps.services.metrics import (
+    metrics_snapshot_service,
+    request_metrics_service,
+)
 from byceps.util.framework.blueprint import create_blueprint
 
 
@@ -19,8 +23,16 @@ blueprint = create_blueprint('metrics', __name__)
 
 @blueprint.get('/')
 def metrics():
-    """Return metrics."""
-    metrics = metrics_service.collect_metrics()
-    lines = list(metrics_service.serialize(metrics))
+    """Return metrics.
+
+    They are served from a snapshot that is collected in the background.
+    Request metrics (if request instrumentation is enabled) are recorded
+    continuously.
+    """
+    lines = list(metrics_snapshot_service.get_snapshot_lines())
+
+    feature_states = get_current_byceps_app().byceps_feature_states
+    if feature_states['request_instrumentation']:
+        lines.extend(request_metrics_service.get_metrics_lines())
 
     return Response(lines, status=200, mimetype='text/plain; version=0.0.4')
@@ -0,0 +1,96 @@
+"""
+byceps.services.metrics.histograms
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Histograms whose observations are accumulated in Redis, so they can be
+recorded by any process and exported by the metrics endpoint.
+
+Each histogram is stored in a hash, with the bucket counters, sum and
+count for each label value as fields. An observation increments only
+the counter of the smallest bucket it fits into (so recording it takes
+a constant number of commands); the counters are accumulated when
+serializing.
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+from redis.client import Pipeline
+
+from .models import Label, Metric
+
+
+@dataclass(frozen=True)
+class Histogram:
+    name: str
+    label_name: str
+    buckets: tuple[float, ...]  # upper bounds, ascending
+
+    @property
+    def key(self) -> str:
+        return f'metrics:histograms:{self.name}'
+
+    def observe(
+        self, pipeline: Pipeline, label_value: str, value: float
+    ) -> None:
+        """Add the observed value to the histogram.
+
+        The commands are added to the pipeline, which has to be executed
+        by the caller.
+        """
+        for upper_bound in self.buckets:
+            if value <= upper_bound:
+                pipeline.hincrby(self.key, f'{label_value}:{upper_bound}', 1)
+                break
+
+        pipeline.hincrbyfloat(self.key, f'{label_value}:sum', value)
+        pipeline.hincrby(self.key, f'{label_value}:count', 1)
+
+    def serialize(self, data: dict[bytes, bytes]) -> Iterator[str]:
+        """Serialize the histogram's data (as fetched from its hash) to
+        text lines.
+        """
+        yield f'# TYPE {self.name} histogram\n'
+
+        for metric in self._assemble_metrics(data):
+            yield metric.serialize() + '\n'
+
+    def _assemble_metrics(self, data: dict[bytes, bytes]) -> Iterator[Metric]:
+        values = {field.decode(): float(value) for field, value in data.items()}
+
+        label_values = sorted(
+            field.removesuffix(':count')
+            for field in values
+            if field.endswith(':count')
+        )
+
+        for label_value in label_values:
+            label = Label(self.label_name, label_value)
+
+            cumulative_count = 0
+            for upper_bound in self.buckets:
+                cumulative_count += int(
+                    values.get(f'{label_value}:{upper_bound}', 0)
+                )
+                yield Metric(
+                    f'{self.name}_bucket',
+                    cumulative_count,
+                    labels=[label, Label('le', str(upper_bound))],
+                )
+
+            count = int(values[f'{label_value}:count'])
+
+            yield Metric(
+                f'{self.name}_bucket',
+                count,
+                labels=[label, Label('le', '+Inf')],
+            )
+            yield Metric(
+                f'{self.name}_sum',
+                values.get(f'{label_value}:sum', 0.0),
+                labels=[label],
+            )
+            yield Metric(f'{self.name}_count', count, labels=[label])
@@ -6,16 +6,17 @@ byceps.metrics.metrics_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
+from functools import partial
 
 from byceps.services.board import (
     board_posting_query_service,
-    board_service,
     board_topic_query_service,
 )
 from byceps.services.brand import brand_service
 from byceps.services.brand.models import BrandID
 from byceps.services.consent import consent_service
+from byceps.services.email import email_service
 from byceps.services.metrics.models import Label, Metric
 from byceps.services.party import party_service
 from byceps.services.party.models import Party
@@ -35,39 +36,53 @@ def serialize(metrics: Iterator[Metric]) -> Iterator[str]:
 
 
 def collect_metrics() -> Iterator[Metric]:
-    brand_ids = [brand.id for brand in brand_service.get_active_brands()]
+    for collect in get_metric_collectors().values():
+        yield from collect()
+
+
+def get_metric_collectors() -> dict[str, Callable[[], Iterator[Metric]]]:
+    """Return a function to collect the metrics of each family, by
+    family name.
+    """
+    brand_ids = {brand.id for brand in brand_service.get_active_brands()}
     active_parties = party_service.get_active_parties()
     active_shops = shop_service.get_active_shops()
 
-    yield from _collect_board_metrics(brand_ids)
-    yield from _collect_consent_metrics()
-    yield from _collect_shop_ordered_product_metrics(active_shops)
-    yield from _collect_shop_order_metrics(active_shops)
-    # Copy and uncomment the following line to add all orders with the
-    # given order number prefix (usually one per party) to the metrics.
-    # yield from _collect_shop_order_metrics_for_order_number_prefix('LAN23-B')
-    yield from _collect_seating_metrics(active_parties)
-    yield from _collect_ticket_metrics(active_parties)
-    yield from _collect_user_metrics()
-
+    return {
+        'board': partial(_collect_board_metrics, brand_ids),
+        'consent': _collect_consent_metrics,
+        'email': _collect_email_metrics,
+        'shop_ordered_product': partial(
+            _collect_shop_ordered_product_metrics, active_shops
+        ),
+        'shop_order': partial(_collect_shop_order_metrics, active_shops),
+        # Copy and uncomment the following lines to add all orders with
+        # the given order number prefix (usually one per party) to the
+        # metrics.
+        # 'shop_order_for_order_number_prefix': partial(
+        #     _collect_shop_order_metrics_for_order_number_prefix, 'LAN23-B'
+        # ),
+        'seating': partial(_collect_seating_metrics, active_parties),
+        'ticket': partial(_collect_ticket_metrics, active_parties),
+        'user': _collect_user_metrics,
+    }
+
+
+def _collect_board_metrics(brand_ids: set[BrandID]) -> Iterator[Metric]:
+    topic_counts_by_board_id = board_topic_query_service.count_topics_by_board(
+        brand_ids
+    )
+    posting_counts_by_board_id = (
+        board_posting_query_service.count_postings_by_board(brand_ids)
+    )
 
-def _collect_board_metrics(brand_ids: list[BrandID]) -> Iterator[Metric]:
-    for brand_id in brand_ids:
-        boards = board_service.get_boards_for_brand(brand_id)
-        board_ids = [board.id for board in boards]
+    for board_id, topic_count in sorted(topic_counts_by_board_id.items()):
+        labels = [Label('board', board_id)]
 
-        for board_id in board_ids:
-            labels = [Label('board', board_id)]
+        yield Metric('board_topic_count', topic_count, labels=labels)
 
-            topic_count = board_topic_query_service.count_topics_for_board(
-                board_id
-            )
-            yield Metric('board_topic_count', topic_count, labels=labels)
-
-            posting_count = (
-                board_posting_query_service.count_postings_for_board(board_id)
-            )
-            yield Metric('board_posting_count', posting_count, labels=labels)
+        posting_count = posting_counts_by_board_id.get(board_id, 0)
+        yield Metric('board_posting_count', posting_count, labels=labels)
 
 
 def _collect_consent_metrics() -> Iterator[Metric]:
@@ -80,6 +95,21 @@ def _collect_consent_metrics() -> Iterator[Metric]:
         )
 
 
+def _collect_email_metrics() -> Iterator[Metric]:
+    """Provide email delivery totals (to derive throughput from)."""
+    delivery_metrics = email_service.get_delivery_metrics()
+
+    yield Metric('email_messages_sent_total', delivery_metrics['messages_sent'])
+    yield Metric(
+        'email_messages_failed_total', delivery_metrics['messages_failed']
+    )
+    yield Metric(
+        'email_smtp_connections_opened_total',
+        delivery_metrics['connections_opened'],
+    )
+    yield Metric('email_send_seconds_total', delivery_metrics['send_seconds'])
+
+
 def _collect_shop_ordered_product_metrics(
     shops: list[Shop],
 ) -> Iterator[Metric]:
@@ -102,10 +132,13 @@ def _collect_shop_ordered_product_metrics(
 
 def _collect_shop_order_metrics(shops: list[Shop]) -> Iterator[Metric]:
     """Provide order counts grouped by payment state for shops."""
+    shop_ids = {shop.id for shop in shops}
+    order_counts_by_shop_id = (
+        order_service.count_orders_per_shop_and_payment_state(shop_ids)
+    )
+
     for shop in shops:
-        order_counts_per_payment_state = (
-            order_service.count_orders_per_payment_state(shop.id)
-        )
+        order_counts_per_payment_state = order_counts_by_shop_id[shop.id]
 
         for payment_state, quantity in order_counts_per_payment_state.items():
             yield Metric(
@@ -143,12 +176,13 @@ def _collect_shop_order_metrics_for_order_number_prefix(
 
 def _collect_seating_metrics(active_parties: list[Party]) -> Iterator[Metric]:
     """Provide seat occupation counts per party and category."""
-    for party in active_parties:
-        occupied_seat_counts_by_category = (
-            seat_service.count_occupied_seats_by_category(party.id)
-        )
+    party_ids = {party.id for party in active_parties}
+    occupied_seat_counts_by_party_id = (
+        seat_service.count_occupied_seats_by_party_and_category(party_ids)
+    )
 
-        for category, count in occupied_seat_counts_by_category:
+    for party in active_parties:
+        for category, count in occupied_seat_counts_by_party_id[party.id]:
             yield Metric(
                 'occupied_seat_count',
                 count,
@@ -161,43 +195,32 @@ def _collect_seating_metrics(active_parties: list[Party]) -> Iterator[Metric]:
 
 def _collect_ticket_metrics(active_parties: list[Party]) -> Iterator[Metric]:
     """Provide ticket counts for active parties."""
+    party_ids = {party.id for party in active_parties}
+    ticket_counts_by_party_id = ticket_service.count_tickets_by_party(party_ids)
+
     for party in active_parties:
-        party_id = party.id
-        labels = [Label('party', party_id)]
+        labels = [Label('party', party.id)]
 
         max_ticket_quantity = party.max_ticket_quantity
         if max_ticket_quantity is not None:
             yield Metric('tickets_max', max_ticket_quantity, labels=labels)
 
-        tickets_revoked_count = ticket_service.count_revoked_tickets_for_party(
-            party_id
-        )
-        yield Metric(
-            'tickets_revoked_count', tickets_revoked_count, labels=labels
-        )
+        ticket_counts = ticket_counts_by_party_id[party.id]
 
-        tickets_sold_count = ticket_service.count_sold_tickets_for_party(
-            party_id
-        )
-        yield Metric('tickets_sold_count', tickets_sold_count, labels=labels)
-
-        tickets_checked_in_count = (
-            ticket_service.count_tickets_checked_in_for_party(party_id)
+        yield Metric(
+            'tickets_revoked_count', ticket_counts.revoked, labels=labels
         )
+        yield Metric('tickets_sold_count', ticket_counts.sold, labels=labels)
         yield Metric(
-            'tickets_checked_in_count', tickets_checked_in_count, labels=labels
+            'tickets_checked_in_count', ticket_counts.checked_in, labels=labels
         )
 
 
 def _collect_user_metrics() -> Iterator[Metric]:
-    users_active = user_stats_service.count_active_users()
-    users_uninitialized = user_stats_service.count_uninitialized_users()
-    users_suspended = user_stats_service.count_suspended_users()
-    users_deleted = user_stats_service.count_deleted_users()
-    users_total = user_stats_service.count_users()
-
-    yield Metric('users_active_count', users_active)
-    yield Metric('users_uninitialized_count', users_uninitialized)
-    yield Metric('users_suspended_count', users_suspended)
-    yield Metric('users_deleted_count', users_deleted)
-    yield Metric('users_total_count', users_total)
+    counts = user_stats_service.count_users_by_state()
+
+    yield Metric('users_active_count', counts.active)
+    yield Metric('users_uninitialized_count', counts.uninitialized)
+    yield Metric('users_suspended_count', counts.suspended)
+    yield Metric('users_deleted_count', counts.deleted)
+    yield Metric('users_total_count', counts.total)
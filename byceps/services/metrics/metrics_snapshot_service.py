@@ -0,0 +1,147 @@
+"""
+byceps.services.metrics.metrics_snapshot_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Collect metrics in the background, and serve them from a snapshot
+stored in Redis.
+
+This keeps the load on the database independent of how many scrapers
+request metrics, and how often.
+
+A request for metrics that finds the snapshot outdated (or missing)
+enqueues a job to collect new metrics, unless another one is already
+pending. Meanwhile, the current snapshot is served.
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from collections.abc import Iterator
+from datetime import timedelta
+import json
+from time import perf_counter, time
+
+from redis import Redis
+import structlog
+
+from byceps.byceps_app import get_current_byceps_app
+from byceps.util.jobqueue import enqueue
+
+from . import metrics_service
+from .histograms import Histogram
+from .models import Metric
+
+
+log = structlog.get_logger()
+
+
+COLLECTION_INTERVAL = timedelta(seconds=15)
+
+# If a collection job does not finish within this time (e.g. because
+# the worker died), another one may be enqueued.
+COLLECTION_LOCK_TIMEOUT = timedelta(minutes=2)
+
+KEY_PREFIX = 'metrics'
+SNAPSHOT_KEY = f'{KEY_PREFIX}:snapshot'
+COLLECTION_LOCK_KEY = f'{KEY_PREFIX}:collection_lock'
+
+COLLECTION_DURATION_HISTOGRAM = Histogram(
+    name='metrics_collection_duration_seconds',
+    label_name='family',
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+
+SNAPSHOT_AGE_METRIC_NAME = 'metrics_snapshot_age_seconds'
+
+
+def collect_and_store_snapshot() -> None:
+    """Collect all metrics, and store them as the current snapshot.
+
+    Also record how long collecting each metric family took.
+    """
+    lines = []
+    durations_by_family = {}
+
+    for family, collect in metrics_service.get_metric_collectors().items():
+        started_at = perf_counter()
+        metrics = list(collect())
+        durations_by_family[family] = perf_counter() - started_at
+
+        lines.extend(metrics_service.serialize(metrics))
+
+    snapshot = {
+        'collected_at': time(),
+        'lines': lines,
+    }
+
+    redis_client = get_current_byceps_app().redis_client
+
+    with redis_client.pipeline() as pipeline:
+        for family, duration in durations_by_family.items():
+            COLLECTION_DURATION_HISTOGRAM.observe(pipeline, family, duration)
+
+        pipeline.set(SNAPSHOT_KEY, json.dumps(snapshot))
+        pipeline.delete(COLLECTION_LOCK_KEY)
+        pipeline.execute()
+
+    log.info(
+        'Metrics collected',
+        metric_count=len(lines),
+        duration=sum(durations_by_family.values()),
+    )
+
+
+def get_snapshot_lines() -> Iterator[str]:
+    """Return the serialized metrics of the current snapshot, with the
+    collection durations and the age of the snapshot.
+
+    Request collection of new metrics if the snapshot is outdated.
+    """
+    redis_client = get_current_byceps_app().redis_client
+
+    snapshot_data, duration_data = _read_snapshot(redis_client)
+
+    if snapshot_data is None:
+        _request_collection(redis_client)
+
+        # If jobs are not processed asynchronously, the snapshot is
+        # already available.
+        snapshot_data, duration_data = _read_snapshot(redis_client)
+        if snapshot_data is None:
+            return
+
+    snapshot = json.loads(snapshot_data)
+
+    age = max(time() - snapshot['collected_at'], 0.0)
+    if age >= COLLECTION_INTERVAL.total_seconds():
+        _request_collection(redis_client)
+
+    yield from snapshot['lines']
+
+    yield from COLLECTION_DURATION_HISTOGRAM.serialize(duration_data)
+
+    age_metric = Metric(SNAPSHOT_AGE_METRIC_NAME, age)
+    yield f'# TYPE {SNAPSHOT_AGE_METRIC_NAME} gauge\n'
+    yield from metrics_service.serialize([age_metric])
+
+
+def _read_snapshot(
+    redis_client: Redis,
+) -> tuple[bytes | None, dict[bytes, bytes]]:
+    with redis_client.pipeline() as pipeline:
+        pipeline.get(SNAPSHOT_KEY)
+        pipeline.hgetall(COLLECTION_DURATION_HISTOGRAM.key)
+        snapshot_data, duration_data = pipeline.execute()
+
+    return snapshot_data, duration_data
+
+
+def _request_collection(redis_client: Redis) -> None:
+    """Enqueue a job to collect metrics, unless one is already pending."""
+    lock_acquired = redis_client.set(
+        COLLECTION_LOCK_KEY, '1', nx=True, ex=COLLECTION_LOCK_TIMEOUT
+    )
+    if not lock_acquired:
+        return
+
+    enqueue(collect_and_store_snapshot)
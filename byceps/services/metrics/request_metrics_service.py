@@ -0,0 +1,114 @@
+"""
+byceps.services.metrics.request_metrics_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Per-endpoint metrics of the requests handled by the web applications.
+
+They are recorded by the request instrumentation (if enabled), and
+exported alongside the other metrics.
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from collections.abc import Iterator
+
+
+from byceps.byceps_app import get_current_byceps_app
+
+from .histograms import Histogram
+
+
+# upper bounds (in seconds)
+DURATION_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+
+REQUEST_DURATION_HISTOGRAM = Histogram(
+    name='http_request_duration_seconds',
+    label_name='endpoint',
+    buckets=DURATION_BUCKETS,
+)
+
+SQL_STATEMENTS_HISTOGRAM = Histogram(
+    name='http_request_sql_statements',
+    label_name='endpoint',
+    buckets=COUNT_BUCKETS,
+)
+
+SQL_DURATION_HISTOGRAM = Histogram(
+    name='http_request_sql_duration_seconds',
+    label_name='endpoint',
+    buckets=DURATION_BUCKETS,
+)
+
+TEMPLATE_RENDER_DURATION_HISTOGRAM = Histogram(
+    name='http_request_template_render_duration_seconds',
+    label_name='endpoint',
+    buckets=DURATION_BUCKETS,
+)
+
+REDIS_ROUND_TRIPS_HISTOGRAM = Histogram(
+    name='http_request_redis_round_trips',
+    label_name='endpoint',
+    buckets=COUNT_BUCKETS,
+)
+
+HISTOGRAMS = [
+    REQUEST_DURATION_HISTOGRAM,
+    SQL_STATEMENTS_HISTOGRAM,
+    SQL_DURATION_HISTOGRAM,
+    TEMPLATE_RENDER_DURATION_HISTOGRAM,
+    REDIS_ROUND_TRIPS_HISTOGRAM,
+]
+
+
+def record_request(
+    endpoint: str,
+    *,
+    duration: float,
+    sql_statement_count: int,
+    sql_duration: float,
+    template_render_duration: float,
+    redis_round_trip_count: int,
+) -> None:
+    """Record the measurements of a request to the endpoint."""
+    redis_client = get_current_byceps_app().redis_client
+
+    with redis_client.pipeline() as pipeline:
+        for histogram, value in [
+            (REQUEST_DURATION_HISTOGRAM, duration),
+            (SQL_STATEMENTS_HISTOGRAM, sql_statement_count),
+            (SQL_DURATION_HISTOGRAM, sql_duration),
+            (TEMPLATE_RENDER_DURATION_HISTOGRAM, template_render_duration),
+            (REDIS_ROUND_TRIPS_HISTOGRAM, redis_round_trip_count),
+        ]:
+            histogram.observe(pipeline, endpoint, value)
+
+        pipeline.execute()
+
+
+def get_metrics_lines() -> Iterator[str]:
+    """Return the serialized request metrics."""
+    redis_client = get_current_byceps_app().redis_client
+
+    with redis_client.pipeline() as pipeline:
+        for histogram in HISTOGRAMS:
+            pipeline.hgetall(histogram.key)
+        histogram_data = pipeline.execute()
+
+    for histogram, data in zip(HISTOGRAMS, histogram_data, strict=True):
+        yield from histogram.serialize(data)
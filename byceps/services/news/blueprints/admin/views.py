@@ -455,7 +455,7 @@ def item_view_version_preview(version_id):
         body_format=version.body_format,
     )
 
-    rendered_item = news_item_service.render_html(item)
+    rendered_item = news_item_service.render_html(item, version_id=version.id)
 
     return {
         'item': rendered_item,
@@ -8,6 +8,7 @@ Render HTML fragments from news items and images.
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from collections.abc import Iterable
 from functools import partial
 from typing import Any
 
@@ -16,11 +17,46 @@ from flask_babel import gettext
 from markupsafe import Markup
 import mistletoe
 
+from byceps.services.rendered_html import rendered_html_service
 from byceps.util.iterables import find
 from byceps.util.result import Err, Ok, Result
 from byceps.util.templating import load_template
 
-from .models import BodyFormat, NewsImage, NewsItem
+from .models import BodyFormat, NewsImage, NewsItem, NewsItemVersionID
+
+
+# Increase to have bodies rendered anew after changing how they are
+# rendered (e.g. due to a different Markdown renderer).
+BODY_RENDERER_VERSION = 1
+
+
+def store_body_html(
+    version_id: NewsItemVersionID, body: str, body_format: BodyFormat
+) -> None:
+    """Render the version's body to HTML and store it, unless it has to
+    be rendered live (e.g. because it embeds images).
+
+    The caller is expected to commit the session.
+    """
+    rendered_html_service.store_html(
+        version_id,
+        'body',
+        BODY_RENDERER_VERSION,
+        body,
+        partial(_render_storable_body, body_format=body_format),
+    )
+
+
+def find_body_htmls(
+    version_ids: Iterable[NewsItemVersionID],
+) -> dict[NewsItemVersionID, str]:
+    """Return the HTML stored for the versions' bodies, by version ID.
+
+    Versions whose body has to be rendered live are missing.
+    """
+    return rendered_html_service.find_html_for_versions(
+        version_ids, 'body', BODY_RENDERER_VERSION
+    )
 
 
 def render_body_html(item: NewsItem) -> Result[str, str]:
@@ -37,6 +73,13 @@ def render_body_html(item: NewsItem) -> Result[str, str]:
         return Err(str(exc))
 
 
+def _render_storable_body(body: str, *, body_format: BodyFormat) -> str:
+    html = load_template(body).render()
+    if body_format == BodyFormat.markdown:
+        html = mistletoe.markdown(html)
+    return html
+
+
 def render_featured_image_html(image: NewsImage) -> Result[str, str]:
     """Render item's featured image to HTML."""
     try:
@@ -8,6 +8,7 @@ byceps.services.news.news_item_service
 
 import dataclasses
 from datetime import datetime
+from uuid import UUID
 
 from sqlalchemy import delete, select
 from sqlalchemy.sql import Select
@@ -15,6 +16,9 @@ import structlog
 
 from byceps.database import db, paginate, Pagination, execute_upsert
 from byceps.services.brand.models import BrandID
+from byceps.services.rendered_html import rendered_html_service
+from byceps.services.search import search_service
+from byceps.services.search.models import SearchDocumentType
 from byceps.services.site import site_service
 from byceps.services.site.models import SiteID
 from byceps.services.user import user_service
@@ -95,6 +99,9 @@ def create_item(
 
     db.session.commit()
 
+    _store_html(db_version)
+    _index(db_item, db_version)
+
     return Ok(item)
 
 
@@ -126,6 +133,9 @@ def update_item(
 
     db.session.commit()
 
+    _store_html(db_version)
+    _index(db_item, db_version)
+
     return _db_entity_to_item(db_item)
 
 
@@ -144,6 +154,26 @@ def _create_version(
     )
 
 
+def _store_html(db_version: DbNewsItemVersion) -> None:
+    """Render the version's body ahead of time, if possible."""
+    _store_body_html(db_version)
+    db.session.commit()
+
+
+def _store_body_html(db_version: DbNewsItemVersion) -> None:
+    try:
+        news_html_service.store_body_html(
+            db_version.id, db_version.body, db_version.body_format
+        )
+    except Exception as exc:
+        # The body gets rendered live when the item is viewed.
+        log.warning(
+            'Storing HTML of body for news item version %s failed: %s',
+            db_version.id,
+            exc,
+        )
+
+
 def set_featured_image(item_id: NewsItemID, image_id: NewsImageID) -> None:
     """Set an image as featured image."""
     db_item = _get_db_item(item_id)
@@ -222,8 +252,66 @@ def unpublish_item(
     return Ok(None)
 
 
+def _index(
+    db_item: DbNewsItem, db_version: DbNewsItemVersion, *, commit: bool = True
+) -> None:
+    """Add the item's current version to the search index.
+
+    News channels have no language, so the item is stemmed according to
+    the default locale.
+    """
+    search_service.index_document(
+        SearchDocumentType.news_item,
+        str(db_item.id),
+        db_item.channel_id,
+        None,
+        db_version.title,
+        db_version.body,
+        commit=commit,
+    )
+
+
+def reindex_all_items() -> int:
+    """Add the current versions of all news items to the search index.
+
+    Return the number of indexed items.
+    """
+    db_items = db.session.scalars(select(DbNewsItem)).all()
+
+    for db_item in db_items:
+        _index(db_item, db_item.current_version, commit=False)
+
+    db.session.commit()
+
+    return len(db_items)
+
+
+def store_html_for_all_items() -> int:
+    """Store the body HTML of the current versions of all news items,
+    unless it has to be rendered live.
+
+    Return the number of processed items.
+    """
+    db_items = db.session.scalars(select(DbNewsItem)).all()
+
+    for db_item in db_items:
+        _store_body_html(db_item.current_version)
+
+    db.session.commit()
+
+    return len(db_items)
+
+
 def delete_item(item_id: NewsItemID) -> None:
     """Delete a news item and its versions."""
+    version_ids = db.session.scalars(
+        select(DbNewsItemVersion.id).filter_by(item_id=item_id)
+    ).all()
+    rendered_html_service.delete_html(version_ids)
+    search_service.remove_documents(
+        SearchDocumentType.news_item, [str(item_id)]
+    )
+
     db.session.execute(
         delete(DbCurrentNewsItemVersionAssociation).where(
             DbCurrentNewsItemVersionAssociation.item_id == item_id
@@ -306,7 +394,7 @@ def find_rendered_item_by_slug(
         return None
 
     item = _db_entity_to_item(db_item)
-    return render_html(item)
+    return render_html(item, version_id=db_item.current_version.id)
 
 
 def get_rendered_items_paginated(
@@ -323,11 +411,22 @@ def get_rendered_items_paginated(
         now = datetime.utcnow()
         stmt = stmt.filter(DbNewsItem.published_at <= now)
 
-    def item_mapper(db_item: DbNewsItem) -> RenderedNewsItem:
-        item = _db_entity_to_item(db_item)
-        return render_html(item)
+    pagination = paginate(stmt, page, items_per_page)
+
+    # Obtain the stored body HTML of all items on the page at once.
+    stored_body_htmls_by_version_id = news_html_service.find_body_htmls(
+        db_item.current_version.id for db_item in pagination.items
+    )
+
+    pagination.items = [
+        _render_html(
+            _db_entity_to_item(db_item),
+            stored_body_htmls_by_version_id.get(db_item.current_version.id),
+        )
+        for db_item in pagination.items
+    ]
 
-    return paginate(stmt, page, items_per_page, item_mapper=item_mapper)
+    return pagination
 
 
 def get_admin_list_items_paginated(
@@ -438,6 +537,55 @@ def get_recent_headlines(
     return [_db_entity_to_headline(db_item) for db_item in db_items]
 
 
+def search_headlines(
+    search_term: str,
+    channel_ids: frozenset[NewsChannelID] | set[NewsChannelID],
+    *,
+    include_unpublished: bool = False,
+) -> list[NewsHeadline]:
+    """Search in (the latest versions of) news items, most relevant
+    first.
+    """
+    document_ids = None
+    if not include_unpublished:
+        # Exclude unpublished items before limiting the results.
+        document_ids = select(db.cast(DbNewsItem.id, db.UnicodeText)).filter(
+            DbNewsItem.published_at <= datetime.utcnow()
+        )
+
+    results = search_service.search(
+        search_term,
+        SearchDocumentType.news_item,
+        scopes=channel_ids,
+        document_ids=document_ids,
+    )
+
+    item_ids = [NewsItemID(UUID(result.document_id)) for result in results]
+    if not item_ids:
+        return []
+
+    stmt = (
+        select(DbNewsItem)
+        .filter(DbNewsItem.id.in_(item_ids))
+        .options(
+            db.joinedload(DbNewsItem.current_version_association).joinedload(
+                DbCurrentNewsItemVersionAssociation.version
+            )
+        )
+    )
+
+    db_items_by_id = {
+        db_item.id: db_item
+        for db_item in db.session.scalars(stmt).unique().all()
+    }
+
+    return [
+        _db_entity_to_headline(db_items_by_id[item_id])
+        for item_id in item_ids
+        if item_id in db_items_by_id
+    ]
+
+
 def get_recent_teasers(
     channel_ids: frozenset[NewsChannelID] | set[NewsChannelID], limit: int
 ) -> list[NewsTeaser]:
@@ -596,15 +744,37 @@ def _db_entity_to_item(db_item: DbNewsItem) -> NewsItem:
     )
 
 
-def render_html(item: NewsItem) -> RenderedNewsItem:
-    """Render item's raw body and featured image to HTML."""
+def render_html(
+    item: NewsItem, *, version_id: NewsItemVersionID | None = None
+) -> RenderedNewsItem:
+    """Render item's raw body and featured image to HTML.
+
+    If the ID of the item's version is given, use the body HTML stored
+    for it, if possible.
+    """
+    stored_body_html = (
+        news_html_service.find_body_htmls([version_id]).get(version_id)
+        if version_id is not None
+        else None
+    )
+
+    return _render_html(item, stored_body_html)
+
+
+def _render_html(
+    item: NewsItem, stored_body_html: str | None
+) -> RenderedNewsItem:
     featured_image_html = (
         _render_featured_image_html(item.id, item.featured_image)
         if item.featured_image
         else None
     )
 
-    body_html = _render_body_html(item)
+    body_html = (
+        Ok(stored_body_html)
+        if stored_body_html is not None
+        else _render_body_html(item)
+    )
 
     return news_item_domain_service.create_rendered_item(
         item, featured_image_html, body_html
@@ -6,6 +6,7 @@ byceps.services.newsletter.blueprints.admin.views
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from operator import attrgetter
 
@@ -20,13 +21,17 @@ from byceps.services.newsletter import (
 )
 from byceps.services.newsletter.models import List, ListID
 from byceps.services.user import user_stats_service
+from byceps.util.export import (
+    serialize_dicts_to_json_array,
+    serialize_dicts_to_ndjson,
+)
 from byceps.util.framework.blueprint import create_blueprint
 from byceps.util.framework.flash import flash_success
 from byceps.util.framework.templating import templated
 from byceps.util.views import (
-    jsonified,
     permission_required,
     redirect_to,
+    streamed_as,
     textified,
 )
 
@@ -116,7 +121,7 @@ def view_subscriptions(list_id):
 
 @blueprint.get('/lists/<list_id>/subscriptions/export')
 @permission_required('newsletter.export_subscribers')
-@jsonified
+@streamed_as('application/json')
 def export_subscribers(list_id):
     """Export the screen names and email addresses of enabled users
     which are currently subscribed to that list as JSON.
@@ -125,9 +130,34 @@ def export_subscribers(list_id):
 
     subscribers = newsletter_service.get_subscribers_to_list(list_.id)
 
-    exports = list(map(assemble_subscriber_export, subscribers))
+    exports = map(assemble_subscriber_export, subscribers)
+
+    return _serialize_subscriber_exports_to_json(exports)
+
+
+def _serialize_subscriber_exports_to_json(
+    exports: Iterable[dict[str, str]],
+) -> Iterator[str]:
+    yield '{"subscribers": '
+    yield from serialize_dicts_to_json_array(exports)
+    yield '}'
+
+
+@blueprint.get('/lists/<list_id>/subscriptions/export/ndjson')
+@permission_required('newsletter.export_subscribers')
+@streamed_as('application/x-ndjson')
+def export_subscribers_as_ndjson(list_id):
+    """Export the screen names and email addresses of enabled users
+    which are currently subscribed to that list as newline-delimited
+    JSON, with one subscriber per line.
+    """
+    list_ = _get_list_or_404(list_id)
+
+    subscribers = newsletter_service.get_subscribers_to_list(list_.id)
+
+    exports = map(assemble_subscriber_export, subscribers)
 
-    return {'subscribers': exports}
+    return serialize_dicts_to_ndjson(exports)
 
 
 def assemble_subscriber_export(subscriber):
@@ -148,7 +178,17 @@ def export_subscriber_email_addresses(list_id):
 
     subscribers = newsletter_service.get_subscribers_to_list(list_.id)
     email_addresses = map(attrgetter('email_address'), subscribers)
-    return '\n'.join(email_addresses)
+    return _join_lines(email_addresses)
+
+
+def _join_lines(lines: Iterable[str]) -> Iterator[str]:
+    """Separate the lines by line breaks, like `'\n'.join()` does, but
+    one by one.
+    """
+    separator = ''
+    for line in lines:
+        yield separator + line
+        separator = '\n'
 
 
 def _get_brand_or_404(brand_id: BrandID) -> Brand:
@@ -6,7 +6,7 @@ byceps.services.newsletter.newsletter_repository
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 
 from sqlalchemy import select, delete
 
@@ -20,6 +20,9 @@ from .errors import UnknownListIdError
 from .models import ListID, SubscriptionUpdate
 
 
+SUBSCRIBERS_BATCH_SIZE = 1000
+
+
 def create_list(list_id: ListID, title: str) -> DbList:
     """Create a list."""
     db_list = DbList(list_id, title)
@@ -125,7 +128,7 @@ def count_subscribers_to_list(list_id: ListID) -> int:
 
 def get_subscribers_to_list(
     list_id: ListID,
-) -> Sequence[tuple[str | None, str | None]]:
+) -> Iterator[tuple[str | None, str | None]]:
     """Yield screen name and email address of the users that are
     currently subscribed to the list.
 
@@ -134,25 +137,25 @@ def get_subscribers_to_list(
     - have no or an unverified email address,
     - are suspended, or
     - have been deleted.
+
+    The rows are fetched in batches through a server-side cursor, so
+    lists with many subscribers do not have to be loaded at once.
     """
-    return (
-        db.session.execute(
-            select(
-                DbUser.screen_name,
-                DbUser.email_address,
-            )
-            .join(DbSubscription)
-            .filter(DbSubscription.list_id == list_id)
-            .filter(DbUser.email_address.is_not(None))
-            .filter(DbUser.initialized == True)  # noqa: E712
-            .filter(DbUser.email_address_verified == True)  # noqa: E712
-            .filter(DbUser.suspended == False)  # noqa: E712
-            .filter(DbUser.deleted == False)  # noqa: E712
-            .order_by(DbUser.email_address)
+    return db.session.execute(
+        select(
+            DbUser.screen_name,
+            DbUser.email_address,
         )
-        .tuples()
-        .all()
-    )
+        .join(DbSubscription)
+        .filter(DbSubscription.list_id == list_id)
+        .filter(DbUser.email_address.is_not(None))
+        .filter(DbUser.initialized == True)  # noqa: E712
+        .filter(DbUser.email_address_verified == True)  # noqa: E712
+        .filter(DbUser.suspended == False)  # noqa: E712
+        .filter(DbUser.deleted == False)  # noqa: E712
+        .order_by(DbUser.email_address)
+        .execution_options(yield_per=SUBSCRIBERS_BATCH_SIZE)
+    ).tuples()
 
 
 def get_subscription_updates_for_user(
@@ -14,7 +14,7 @@ from jinja2 import TemplateNotFound
 import structlog
 
 from byceps.services.page import page_service
-from byceps.services.page.models import Page, PageAggregate
+from byceps.services.page.models import Page, PageAggregate, PageVersionID
 from byceps.services.site_navigation import site_navigation_service
 from byceps.services.site_navigation.models import NavMenuID
 from byceps.services.snippet.blueprints.site.templating import (
@@ -33,7 +33,9 @@ Context = dict[str, Any]
 def render_page(page: PageAggregate) -> str | tuple[str, int]:
     """Render the page, or an error page if that fails."""
     try:
-        context = build_template_context(page.title, page.head, page.body)
+        context = build_template_context(
+            page.title, page.head, page.body, version_id=page.version_id
+        )
         context['current_page'] = page.current_page_id
 
         subnav_menu_id = _find_subnav_menu_id(page)
@@ -67,11 +69,27 @@ def _find_subnav_menu_id(page: Page) -> NavMenuID | None:
 
 
 def build_template_context(
-    title: str, raw_head: str | None, raw_body: str
+    title: str,
+    raw_head: str | None,
+    raw_body: str,
+    *,
+    version_id: PageVersionID | None = None,
 ) -> Context:
-    """Build the page context to insert into the outer template."""
-    head = _render_template(raw_head) if raw_head else None
-    body = _render_template(raw_body)
+    """Build the page context to insert into the outer template.
+
+    If the ID of the page version is given, use the HTML stored for it,
+    if possible.
+    """
+    stored_html_parts = (
+        page_service.find_html_parts(version_id)
+        if version_id is not None
+        else {}
+    )
+
+    head = (
+        _render_part(stored_html_parts, 'head', raw_head) if raw_head else None
+    )
+    body = _render_part(stored_html_parts, 'body', raw_body)
 
     return {
         'page_title': title,
@@ -80,6 +98,16 @@ def build_template_context(
     }
 
 
+def _render_part(
+    stored_html_parts: dict[str, str], part: str, source: str
+) -> str:
+    html = stored_html_parts.get(part)
+    if html is not None:
+        return html
+
+    return _render_template(source)
+
+
 def _render_template(source: str) -> str:
     template_globals: Context = {
         'render_snippet': render_snippet_as_partial_from_template,
@@ -50,6 +50,7 @@ class PageVersion:
 
 @dataclass(frozen=True, kw_only=True)
 class PageAggregate(Page):
+    version_id: PageVersionID
     title: str
     head: str | None
     body: str
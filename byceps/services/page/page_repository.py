@@ -6,7 +6,7 @@ byceps.services.page.page_repository
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from datetime import datetime
 
 from sqlalchemy import delete, select
@@ -249,17 +249,27 @@ def get_pages_for_site_with_current_versions(
     )
 
 
-def search_pages(
-    search_term: str, *, site_id: SiteID | None = None
-) -> Sequence[DbPage]:
-    """Search in (the latest versions of) pages."""
-    stmt = (
-        select(DbPage).join(DbCurrentPageVersionAssociation).join(DbPageVersion)
+def get_all_pages_with_current_versions() -> Sequence[DbPage]:
+    """Return all pages with their current versions."""
+    return (
+        db.session.scalars(
+            select(DbPage).options(
+                db.joinedload(DbPage.current_version_association).joinedload(
+                    DbCurrentPageVersionAssociation.version
+                )
+            )
+        )
+        .unique()
+        .all()
     )
 
-    if site_id:
-        stmt = stmt.filter(DbPage.site_id == site_id)
 
-    stmt = stmt.filter(DbPageVersion.body.contains(search_term))
+def get_pages(page_ids: Iterable[PageID]) -> Sequence[DbPage]:
+    """Return the pages with those IDs."""
+    page_ids = set(page_ids)
+    if not page_ids:
+        return []
 
-    return db.session.scalars(stmt).all()
+    return db.session.scalars(
+        select(DbPage).filter(DbPage.id.in_(page_ids))
+    ).all()
@@ -7,14 +7,22 @@ byceps.services.page.page_service
 """
 
 from datetime import datetime
+from uuid import UUID
 
+import structlog
+
+from byceps.database import db
 from byceps.services.core.events import EventSite
+from byceps.services.rendered_html import rendered_html_service
+from byceps.services.search import search_service
+from byceps.services.search.models import SearchDocumentType
 from byceps.services.site import site_service
 from byceps.services.site.models import Site, SiteID
 from byceps.services.site_navigation.models import NavMenuID
 from byceps.services.user import user_service
 from byceps.services.user.models import User
 from byceps.util.result import Err, Ok, Result
+from byceps.util.templating import load_template
 
 from . import page_repository
 from .dbmodels import DbPage, DbPageVersion
@@ -37,6 +45,14 @@ from .models import (
 )
 
 
+log = structlog.get_logger()
+
+
+# Increase to have stored HTML rendered anew after changing how page
+# content is rendered.
+HTML_RENDERER_VERSION = 1
+
+
 def copy_page(
     source_site: Site, target_site: Site, name: str, language_code: str
 ) -> Result[
@@ -103,6 +119,9 @@ def create_page(
         hidden,
     )
 
+    _store_html(db_version)
+    _index(db_page, db_version)
+
     event = PageCreatedEvent(
         occurred_at=created_at,
         initiator=creator,
@@ -141,6 +160,9 @@ def update_page(
         hidden,
     )
 
+    _store_html(db_version)
+    _index(db_page, db_version)
+
     site = site_service.get_site(db_page.site_id)
 
     event = PageUpdatedEvent(
@@ -169,11 +191,16 @@ def delete_page(
     site = site_service.get_site(db_page.site_id)
     page_name = db_page.name
     language_code = db_page.language_code
+    version_ids = [db_version.id for db_version in get_versions(page_id)]
 
     match page_repository.delete_page(page_id):
         case Err(e):
             return Err(e)
 
+    rendered_html_service.delete_html(version_ids)
+    search_service.remove_documents(SearchDocumentType.page, [str(page_id)])
+    db.session.commit()
+
     event = PageDeletedEvent(
         occurred_at=datetime.utcnow(),
         initiator=initiator,
@@ -186,6 +213,96 @@ def delete_page(
     return Ok(event)
 
 
+def _index(
+    db_page: DbPage, db_version: DbPageVersion, *, commit: bool = True
+) -> None:
+    """Add the page's current version to the search index."""
+    search_service.index_document(
+        SearchDocumentType.page,
+        str(db_page.id),
+        db_page.site_id,
+        db_page.language_code,
+        db_version.title,
+        db_version.body,
+        commit=commit,
+    )
+
+
+def reindex_all_pages() -> int:
+    """Add the current versions of all pages to the search index.
+
+    Return the number of indexed pages.
+    """
+    db_pages = page_repository.get_all_pages_with_current_versions()
+
+    for db_page in db_pages:
+        _index(db_page, db_page.current_version, commit=False)
+
+    db.session.commit()
+
+    return len(db_pages)
+
+
+def store_html_for_all_pages() -> int:
+    """Store the head and body HTML of the current versions of all
+    pages, unless they have to be rendered live.
+
+    Return the number of processed pages.
+    """
+    db_pages = page_repository.get_all_pages_with_current_versions()
+
+    for db_page in db_pages:
+        _store_html_parts(db_page.current_version)
+
+    db.session.commit()
+
+    return len(db_pages)
+
+
+def _store_html(db_version: DbPageVersion) -> None:
+    """Render the version's head and body ahead of time, if possible."""
+    _store_html_parts(db_version)
+    db.session.commit()
+
+
+def _store_html_parts(db_version: DbPageVersion) -> None:
+    if db_version.head:
+        _store_html_part(db_version.id, 'head', db_version.head)
+
+    _store_html_part(db_version.id, 'body', db_version.body)
+
+
+def _store_html_part(version_id: PageVersionID, part: str, source: str) -> None:
+    try:
+        rendered_html_service.store_html(
+            version_id, part, HTML_RENDERER_VERSION, source, _render_html
+        )
+    except Exception as exc:
+        # The part gets rendered live when the page is viewed.
+        log.warning(
+            'Storing HTML of %s for page version %s failed: %s',
+            part,
+            version_id,
+            exc,
+        )
+
+
+def find_html_parts(version_id: PageVersionID) -> dict[str, str]:
+    """Return the HTML stored for the version's parts (head and body),
+    by part.
+
+    Parts that have to be rendered live (e.g. because they embed
+    snippets) are missing.
+    """
+    return rendered_html_service.find_html_parts(
+        version_id, HTML_RENDERER_VERSION
+    )
+
+
+def _render_html(source: str) -> str:
+    return load_template(source).render()
+
+
 def set_nav_menu_id(page_id: PageID, nav_menu_id: NavMenuID | None) -> None:
     """Set navigation menu for page."""
     page_repository.set_nav_menu_id(page_id, nav_menu_id)
@@ -304,6 +421,7 @@ def build_page_aggregate(page: Page, version: PageVersion) -> PageAggregate:
         url_path=page.url_path,
         hidden=page.hidden,
         nav_menu_id=page.nav_menu_id,
+        version_id=version.id,
         title=version.title,
         head=version.head,
         body=version.body,
@@ -319,10 +437,22 @@ def get_pages_for_site_with_current_versions(site_id: SiteID) -> list[DbPage]:
 def search_pages(
     search_term: str, *, site_id: SiteID | None = None
 ) -> list[Page]:
-    """Search in (the latest versions of) pages."""
-    db_pages = page_repository.search_pages(search_term, site_id=site_id)
+    """Search in (the latest versions of) pages, most relevant first."""
+    scopes = {site_id} if site_id else None
+    results = search_service.search(
+        search_term, SearchDocumentType.page, scopes=scopes, limit=None
+    )
 
-    return [_db_entity_to_page(db_page) for db_page in db_pages]
+    page_ids = [PageID(UUID(result.document_id)) for result in results]
+    db_pages_by_id = {
+        db_page.id: db_page for db_page in page_repository.get_pages(page_ids)
+    }
+
+    return [
+        _db_entity_to_page(db_pages_by_id[page_id])
+        for page_id in page_ids
+        if page_id in db_pages_by_id
+    ]
 
 
 def _db_entity_to_page(db_page: DbPage) -> Page:
@@ -0,0 +1,52 @@
+"""
+byceps.services.rendered_html.dbmodels
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy.orm import Mapped, mapped_column
+
+from byceps.database import db
+from byceps.util.instances import ReprBuilder
+
+
+class DbRenderedHtml(db.Model):
+    """HTML rendered from (a part of) a version of some content, e.g. a
+    news item, page, or snippet version.
+    """
+
+    __tablename__ = 'rendered_html'
+
+    version_id: Mapped[UUID] = mapped_column(db.Uuid, primary_key=True)
+    part: Mapped[str] = mapped_column(db.UnicodeText, primary_key=True)
+    renderer_version: Mapped[int] = mapped_column(primary_key=True)
+    created_at: Mapped[datetime]
+    html: Mapped[str] = mapped_column(db.UnicodeText)
+
+    def __init__(
+        self,
+        version_id: UUID,
+        part: str,
+        renderer_version: int,
+        created_at: datetime,
+        html: str,
+    ) -> None:
+        self.version_id = version_id
+        self.part = part
+        self.renderer_version = renderer_version
+        self.created_at = created_at
+        self.html = html
+
+    def __repr__(self) -> str:
+        return (
+            ReprBuilder(self)
+            .add_with_lookup('version_id')
+            .add_with_lookup('part')
+            .add_with_lookup('renderer_version')
+            .build()
+        )
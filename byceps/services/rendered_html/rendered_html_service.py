@@ -0,0 +1,144 @@
+"""
+byceps.services.rendered_html.rendered_html_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Store HTML rendered from content versions so that it does not have to
+be rendered again on every request.
+
+Content versions do not change, so their HTML can be stored once and
+for all, when the version is created. Exceptions are sources that refer
+to template variables or functions (e.g. to embed snippets or images):
+their output can depend on the request (site, locale) or on other
+content, so they are not stored and have to be rendered live.
+
+Reads never store HTML. Versions without stored HTML (e.g. those
+created before HTML was stored) are rendered live until their HTML has
+been stored by the corresponding script.
+
+Stored HTML is identified by the version ID, the part of the version
+it has been rendered from, and the version of the renderer. Changing
+the renderer's output requires a new renderer version so that HTML
+stored by the previous one is not used anymore.
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from collections.abc import Callable, Iterable
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import delete, select
+
+from byceps.database import db, execute_insert_ignore_on_conflict
+from byceps.util.templating import refers_to_variables
+
+from .dbmodels import DbRenderedHtml
+
+
+Renderer = Callable[[str], str]
+
+
+def store_html(
+    version_id: UUID,
+    part: str,
+    renderer_version: int,
+    source: str,
+    render: Renderer,
+) -> bool:
+    """Render the source and store the result, unless the source is
+    unsuitable for storage.
+
+    Return `True` if the HTML has been stored.
+
+    The caller is expected to commit the session.
+    """
+    if not is_storable(source):
+        return False
+
+    html = render(source)
+
+    table = DbRenderedHtml.__table__
+    values = {
+        'version_id': version_id,
+        'part': part,
+        'renderer_version': renderer_version,
+        'created_at': datetime.utcnow(),
+        'html': html,
+    }
+
+    execute_insert_ignore_on_conflict(table, values)
+
+    return True
+
+
+def find_html(version_id: UUID, part: str, renderer_version: int) -> str | None:
+    """Return the stored HTML for the version's part, or `None` if none
+    has been stored.
+    """
+    return db.session.scalar(
+        select(DbRenderedHtml.html)
+        .filter_by(version_id=version_id)
+        .filter_by(part=part)
+        .filter_by(renderer_version=renderer_version)
+    )
+
+
+def find_html_parts(version_id: UUID, renderer_version: int) -> dict[str, str]:
+    """Return the stored HTML for all parts of the version, by part.
+
+    Parts for which no HTML has been stored are missing.
+    """
+    rows = db.session.execute(
+        select(DbRenderedHtml.part, DbRenderedHtml.html)
+        .filter_by(version_id=version_id)
+        .filter_by(renderer_version=renderer_version)
+    ).all()
+
+    return dict(rows)
+
+
+def find_html_for_versions(
+    version_ids: Iterable[UUID], part: str, renderer_version: int
+) -> dict[UUID, str]:
+    """Return the stored HTML for the versions' part, by version ID.
+
+    Versions for which no HTML has been stored are missing.
+    """
+    version_ids = set(version_ids)
+    if not version_ids:
+        return {}
+
+    rows = db.session.execute(
+        select(DbRenderedHtml.version_id, DbRenderedHtml.html)
+        .filter(DbRenderedHtml.version_id.in_(version_ids))
+        .filter_by(part=part)
+        .filter_by(renderer_version=renderer_version)
+    ).all()
+
+    return dict(rows)
+
+
+def is_storable(source: str) -> bool:
+    """Return `True` if the HTML rendered from the source only depends
+    on the source itself.
+    """
+    try:
+        return not refers_to_variables(source)
+    except Exception:
+        # Leave reporting syntax errors to live rendering.
+        return False
+
+
+def delete_html(version_ids: Iterable[UUID]) -> None:
+    """Delete the HTML stored for the versions.
+
+    The caller is expected to commit the session.
+    """
+    version_ids = set(version_ids)
+    if not version_ids:
+        return
+
+    db.session.execute(
+        delete(DbRenderedHtml).where(DbRenderedHtml.version_id.in_(version_ids))
+    )
@@ -0,0 +1,47 @@
+"""
+byceps.services.search.dbmodels
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import datetime
+
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import Mapped, mapped_column
+
+from byceps.database import db
+from byceps.util.instances import ReprBuilder
+
+
+class DbSearchDocument(db.Model):
+    """The searchable text of a document (e.g. a page or a board
+    posting), preprocessed for full-text search.
+    """
+
+    __tablename__ = 'search_documents'
+    __table_args__ = (
+        db.Index(
+            'ix_search_documents_document_type_scope',
+            'document_type',
+            'scope',
+        ),
+        db.Index('ix_search_documents_tsv', 'tsv', postgresql_using='gin'),
+    )
+
+    document_type: Mapped[str] = mapped_column(db.UnicodeText, primary_key=True)
+    document_id: Mapped[str] = mapped_column(db.UnicodeText, primary_key=True)
+    scope: Mapped[str] = mapped_column(db.UnicodeText)
+    text_search_config: Mapped[str] = mapped_column(db.UnicodeText)
+    title: Mapped[str] = mapped_column(db.UnicodeText)
+    tsv: Mapped[str] = mapped_column(TSVECTOR)
+    indexed_at: Mapped[datetime]
+
+    def __repr__(self) -> str:
+        return (
+            ReprBuilder(self)
+            .add_with_lookup('document_type')
+            .add_with_lookup('document_id')
+            .build()
+        )
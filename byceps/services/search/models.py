@@ -0,0 +1,26 @@
+"""
+byceps.services.search.models
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from dataclasses import dataclass
+from enum import StrEnum
+
+
+class SearchDocumentType(StrEnum):
+    board_posting = 'board_posting'
+    news_item = 'news_item'
+    page = 'page'
+    snippet = 'snippet'
+
+
+@dataclass(frozen=True, kw_only=True)
+class SearchResult:
+    document_type: SearchDocumentType
+    document_id: str
+    scope: str
+    title: str
+    rank: float
@@ -0,0 +1,214 @@
+"""
+byceps.services.search.search_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Full-text search over documents of different types (board postings,
+news items, pages, snippets).
+
+The services owning the documents add them to the index when they are
+created or updated, and remove them when they are deleted. Documents
+are stemmed according to their language.
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from collections.abc import Iterable
+from datetime import datetime
+
+from sqlalchemy import delete, Select, select
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.sql.elements import ColumnElement
+
+from byceps.database import db, execute_upsert, upsert
+from byceps.util.l10n import get_default_locale
+
+from .dbmodels import DbSearchDocument
+from .models import SearchDocumentType, SearchResult
+
+
+# PostgreSQL text search configurations, by language code
+TEXT_SEARCH_CONFIGS_BY_LANGUAGE_CODE = {
+    'da': 'danish',
+    'de': 'german',
+    'en': 'english',
+    'es': 'spanish',
+    'fi': 'finnish',
+    'fr': 'french',
+    'it': 'italian',
+    'nl': 'dutch',
+    'no': 'norwegian',
+    'pt': 'portuguese',
+    'sv': 'swedish',
+}
+
+# Do not stem words of other languages.
+FALLBACK_TEXT_SEARCH_CONFIG = 'simple'
+
+TEXT_SEARCH_CONFIGS = frozenset(
+    TEXT_SEARCH_CONFIGS_BY_LANGUAGE_CODE.values()
+) | {FALLBACK_TEXT_SEARCH_CONFIG}
+
+
+def index_document(
+    document_type: SearchDocumentType,
+    document_id: str,
+    scope: str,
+    language_code: str | None,
+    title: str,
+    body: str,
+    *,
+    commit: bool = True,
+) -> None:
+    """Add the document to the search index, or update it there.
+
+    Matches in the title are ranked higher than those in the body.
+
+    Documents without a language are stemmed according to the
+    application's default locale.
+    """
+    if language_code is None:
+        language_code = get_default_locale().language
+
+    config = get_text_search_config(language_code)
+
+    table = DbSearchDocument.__table__
+    identifier = {
+        'document_type': document_type.name,
+        'document_id': document_id,
+    }
+    replacement = {
+        'scope': scope,
+        'text_search_config': config,
+        'title': title,
+        'tsv': _build_tsvector(config, title, body),
+        'indexed_at': datetime.utcnow(),
+    }
+
+    if commit:
+        upsert(table, identifier, replacement)
+    else:
+        execute_upsert(table, identifier, replacement)
+
+
+def _build_tsvector(config: str, title: str, body: str) -> ColumnElement:
+    regconfig = db.cast(config, REGCONFIG)
+
+    return db.func.setweight(
+        db.func.to_tsvector(regconfig, title), db.literal_column("'A'")
+    ).op('||')(
+        db.func.setweight(
+            db.func.to_tsvector(regconfig, body), db.literal_column("'B'")
+        )
+    )
+
+
+def remove_documents(
+    document_type: SearchDocumentType, document_ids: Iterable[str]
+) -> None:
+    """Remove the documents from the search index.
+
+    Does not commit, so it can be part of the transaction that deletes
+    the documents themselves.
+    """
+    document_ids = set(document_ids)
+    if not document_ids:
+        return
+
+    db.session.execute(
+        delete(DbSearchDocument)
+        .filter_by(document_type=document_type.name)
+        .filter(DbSearchDocument.document_id.in_(document_ids))
+    )
+
+
+def search(
+    search_term: str,
+    document_type: SearchDocumentType,
+    *,
+    scopes: Iterable[str] | None = None,
+    document_ids: Select | None = None,
+    limit: int | None = 50,
+) -> list[SearchResult]:
+    """Return the documents of that type that match the search term,
+    most relevant first.
+
+    If a statement selecting `document_ids` is given, only consider
+    documents with those IDs (e.g. to exclude hidden ones before the
+    limit is applied).
+
+    Return all matching documents if `limit` is `None`.
+
+    The search term supports the syntax of web search engines: quoted
+    phrases, `or`, and `-` to exclude words.
+    """
+    search_term = search_term.strip()
+    if not search_term:
+        return []
+
+    def to_tsquery(config: str) -> ColumnElement:
+        return db.func.websearch_to_tsquery(
+            db.cast(config, REGCONFIG), search_term
+        )
+
+    # Match each document against the query stemmed according to the
+    # document's language. Comparing against constant queries lets the
+    # index be used.
+    matches = db.or_(
+        *[
+            db.and_(
+                DbSearchDocument.text_search_config == config,
+                DbSearchDocument.tsv.op('@@')(to_tsquery(config)),
+            )
+            for config in sorted(TEXT_SEARCH_CONFIGS)
+        ]
+    )
+
+    tsquery = db.case(
+        *[
+            (DbSearchDocument.text_search_config == config, to_tsquery(config))
+            for config in sorted(TEXT_SEARCH_CONFIGS)
+        ]
+    )
+    rank = db.func.ts_rank_cd(DbSearchDocument.tsv, tsquery)
+
+    stmt = (
+        select(
+            DbSearchDocument.document_id,
+            DbSearchDocument.scope,
+            DbSearchDocument.title,
+            rank,
+        )
+        .filter(DbSearchDocument.document_type == document_type.name)
+        .filter(matches)
+    )
+
+    if scopes is not None:
+        stmt = stmt.filter(DbSearchDocument.scope.in_(set(scopes)))
+
+    if document_ids is not None:
+        stmt = stmt.filter(DbSearchDocument.document_id.in_(document_ids))
+
+    rows = db.session.execute(
+        stmt.order_by(rank.desc(), DbSearchDocument.document_id).limit(limit)
+    ).all()
+
+    return [
+        SearchResult(
+            document_type=document_type,
+            document_id=document_id,
+            scope=scope,
+            title=title,
+            rank=rank,
+        )
+        for document_id, scope, title, rank in rows
+    ]
+
+
+def get_text_search_config(language_code: str) -> str:
+    """Return the name of the text search configuration to stem texts
+    of that language with.
+    """
+    return TEXT_SEARCH_CONFIGS_BY_LANGUAGE_CODE.get(
+        language_code, FALLBACK_TEXT_SEARCH_CONFIG
+    )
@@ -0,0 +1,213 @@
+"""
+byceps.services.seating.area_seats_cache
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Cache of the seats of seating areas as needed to render seating plans,
+including their occupancy and the occupying tickets' users, backed by
+Redis.
+
+An area's seats are kept in a hash (one field per seat). Each area also
+has a version which is incremented whenever the cached seats of the
+area change. It can be used to tell whether a seating plan has changed
+since a client last received it.
+
+Seats are updated individually when seats are occupied or released.
+Other changes (creating or deleting seats, occupying or releasing seat
+groups) drop the area's cached seats, which are then rebuilt on the next
+access.
+
+Changes to users' screen names and avatars are not tracked; entries
+expire after a while to eventually pick up those changes.
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from collections.abc import Callable, Iterable
+from datetime import timedelta
+import json
+from uuid import UUID
+
+from redis.client import Pipeline
+from redis.exceptions import RedisError, WatchError
+import structlog
+
+from byceps.byceps_app import get_current_byceps_app
+from byceps.services.ticketing.models.ticket import TicketID
+from byceps.services.user.user_cache_serialization import (
+    deserialize_user,
+    serialize_user,
+)
+
+from .models import AreaSeat, AreaSeats, SeatID, SeatingAreaID
+
+
+log = structlog.get_logger()
+
+
+KEY_PREFIX = 'seating:areas'
+
+ENTRY_TTL = timedelta(minutes=10)
+
+# Marks a hash as complete, and allows for areas without seats.
+_COMPLETE_FIELD = b'complete'
+
+
+def get_area_seats(
+    area_id: SeatingAreaID, load: Callable[[SeatingAreaID], list[AreaSeat]]
+) -> AreaSeats:
+    """Return the area's seats and version.
+
+    Return the seats from the cache, if available. Otherwise call `load`
+    to obtain them and put them into the cache.
+    """
+    redis_client = get_current_byceps_app().redis_client
+
+    seats_key = _get_seats_key(area_id)
+    version_key = _get_version_key(area_id)
+
+    try:
+        pipeline = redis_client.pipeline(transaction=False)
+        pipeline.get(version_key)
+        pipeline.hgetall(seats_key)
+        version, fields = pipeline.execute()
+    except RedisError as exc:
+        log.warning('Reading from area seats cache failed', exc_info=exc)
+        return AreaSeats(area_id=area_id, version=None, seats=load(area_id))
+
+    if fields.pop(_COMPLETE_FIELD, None) is not None:
+        seats = [
+            _deserialize_seat(json.loads(seat_data))
+            for seat_data in fields.values()
+        ]
+        return AreaSeats(
+            area_id=area_id, version=_parse_version(version), seats=seats
+        )
+
+    seats = load(area_id)
+
+    new_version = _store_seats(area_id, seats, version)
+
+    return AreaSeats(area_id=area_id, version=new_version, seats=seats)
+
+
+def _store_seats(
+    area_id: SeatingAreaID, seats: list[AreaSeat], version: bytes | None
+) -> int | None:
+    """Store the seats unless the area's version has changed since the
+    seats were loaded (because they could be outdated then).
+
+    Return the area's new version, or `None` if the seats have not been
+    stored.
+    """
+    seats_key = _get_seats_key(area_id)
+    version_key = _get_version_key(area_id)
+
+    mapping: dict[bytes | str, str] = {
+        str(seat.id): json.dumps(_serialize_seat(seat)) for seat in seats
+    }
+    mapping[_COMPLETE_FIELD] = '1'
+
+    try:
+        with get_current_byceps_app().redis_client.pipeline() as pipeline:
+            pipeline.watch(version_key)
+            if pipeline.get(version_key) != version:
+                return None
+
+            pipeline.multi()
+            pipeline.delete(seats_key)
+            pipeline.hset(seats_key, mapping=mapping)
+            pipeline.expire(seats_key, ENTRY_TTL)
+            pipeline.incr(version_key)
+            results = pipeline.execute()
+    except WatchError:
+        return None
+    except RedisError as exc:
+        log.warning('Writing to area seats cache failed', exc_info=exc)
+        return None
+
+    return results[-1]
+
+
+def update_seat(area_id: SeatingAreaID, seat: AreaSeat) -> None:
+    """Update a single seat of the area, if the area's seats are cached."""
+    seats_key = _get_seats_key(area_id)
+    version_key = _get_version_key(area_id)
+
+    seat_data = json.dumps(_serialize_seat(seat))
+
+    def update(pipeline: Pipeline) -> None:
+        is_cached = pipeline.exists(seats_key)
+
+        pipeline.multi()
+        if is_cached:
+            pipeline.hset(seats_key, str(seat.id), seat_data)
+        pipeline.incr(version_key)
+
+    try:
+        get_current_byceps_app().redis_client.transaction(update, seats_key)
+    except RedisError as exc:
+        log.warning('Updating area seats cache failed', exc_info=exc)
+        # Better rebuild than keep an outdated seat.
+        invalidate_areas([area_id])
+
+
+def invalidate_areas(area_ids: Iterable[SeatingAreaID]) -> None:
+    """Remove the seats of the areas from the cache."""
+    try:
+        pipeline = get_current_byceps_app().redis_client.pipeline()
+        for area_id in area_ids:
+            pipeline.delete(_get_seats_key(area_id))
+            pipeline.incr(_get_version_key(area_id))
+        pipeline.execute()
+    except RedisError as exc:
+        log.warning('Invalidating area seats cache failed', exc_info=exc)
+
+
+def _get_seats_key(area_id: SeatingAreaID) -> str:
+    return f'{KEY_PREFIX}:{area_id}:seats'
+
+
+def _get_version_key(area_id: SeatingAreaID) -> str:
+    return f'{KEY_PREFIX}:{area_id}:version'
+
+
+def _parse_version(value: bytes | None) -> int:
+    return int(value) if value is not None else 0
+
+
+def _serialize_seat(seat: AreaSeat) -> dict:
+    return {
+        'id': str(seat.id),
+        'coord_x': seat.coord_x,
+        'coord_y': seat.coord_y,
+        'rotation': seat.rotation,
+        'label': seat.label,
+        'type_': seat.type_,
+        'blocked': seat.blocked,
+        'occupied_by_ticket_id': str(seat.occupied_by_ticket_id)
+        if seat.occupied_by_ticket_id
+        else None,
+        'occupied_by_user': serialize_user(seat.occupied_by_user)
+        if seat.occupied_by_user
+        else None,
+    }
+
+
+def _deserialize_seat(data: dict) -> AreaSeat:
+    ticket_id_str = data['occupied_by_ticket_id']
+    user_data = data['occupied_by_user']
+
+    return AreaSeat(
+        id=SeatID(UUID(data['id'])),
+        coord_x=data['coord_x'],
+        coord_y=data['coord_y'],
+        rotation=data['rotation'],
+        label=data['label'],
+        type_=data['type_'],
+        blocked=data['blocked'],
+        occupied_by_ticket_id=TicketID(UUID(ticket_id_str))
+        if ticket_id_str
+        else None,
+        occupied_by_user=deserialize_user(user_data) if user_data else None,
+    )
@@ -7,17 +7,25 @@ byceps.services.seating.blueprints.site.views
 """
 
 from datetime import datetime
+import hashlib
 from typing import Any
 
-from flask import abort, g, request
-from flask_babel import gettext
+from flask import abort, g, make_response, request, Response, session
+from flask_babel import get_locale, gettext
 
 from byceps.services.seating import (
     seat_reservation_service,
     seat_service,
     seating_area_service,
 )
-from byceps.services.seating.models import Seat, SeatID, SeatingArea
+from byceps.services.seating.models import (
+    AreaSeat,
+    AreaSeats,
+    Seat,
+    SeatID,
+    SeatingArea,
+    SeatUtilization,
+)
 from byceps.services.site.blueprints.site.navigation import (
     subnavigation_for_view,
 )
@@ -82,15 +90,76 @@ def view_area(slug):
     return _render_view_area(area)
 
 
-@templated('site/seating/view_area')
-@subnavigation_for_view('seating_plan')
-def _render_view_area(area: SeatingArea) -> dict[str, Any]:
+def _render_view_area(area: SeatingArea) -> Response:
     seat_management_enabled = _is_seat_management_enabled()
 
-    seats = seat_service.get_area_seats(area.id)
+    area_seats = seat_service.get_cached_area_seats(area.id)
 
     seat_utilization = seat_service.get_seat_utilization(g.party.id)
 
+    etag = _build_view_area_etag(
+        area, area_seats, seat_utilization, seat_management_enabled
+    )
+
+    # Pending flash messages have to be rendered, so respond in full.
+    if (
+        etag is not None
+        and request.if_none_match.contains(etag)
+        and not session.get('_flashes')
+    ):
+        response = Response(status=304)
+    else:
+        response = make_response(
+            _render_view_area_template(
+                area,
+                area_seats.seats,
+                seat_utilization,
+                seat_management_enabled,
+            )
+        )
+
+    if etag is not None:
+        response.set_etag(etag)
+        response.cache_control.private = True
+        response.cache_control.no_cache = True
+
+    return response
+
+
+def _build_view_area_etag(
+    area: SeatingArea,
+    area_seats: AreaSeats,
+    seat_utilization: SeatUtilization,
+    seat_management_enabled: bool,
+) -> str | None:
+    """Build an entity tag for the area view.
+
+    It changes whenever the area's seats do, but also depends on the
+    other parts of the page that vary.
+    """
+    if area_seats.version is None:
+        return None
+
+    parts = [
+        area,
+        area_seats.version,
+        seat_utilization,
+        seat_management_enabled,
+        g.user.id if g.user.authenticated else None,
+        get_locale(),
+    ]
+
+    return hashlib.sha256(repr(parts).encode('utf-8')).hexdigest()[:32]
+
+
+@templated('site/seating/view_area')
+@subnavigation_for_view('seating_plan')
+def _render_view_area_template(
+    area: SeatingArea,
+    seats: list[AreaSeat],
+    seat_utilization: SeatUtilization,
+    seat_management_enabled: bool,
+) -> dict[str, Any]:
     return {
         'area': area,
         'seat_management_enabled': seat_management_enabled,
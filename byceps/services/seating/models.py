@@ -70,6 +70,13 @@ class AreaSeat:
         return self.occupied_by_ticket_id is not None
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AreaSeats:
+    area_id: SeatingAreaID
+    version: int | None  # `None` if unknown
+    seats: list[AreaSeat]
+
+
 SeatGroupID = NewType('SeatGroupID', UUID)
 
 
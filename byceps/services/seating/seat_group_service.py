@@ -68,6 +68,8 @@ def occupy_group(
         case Err(e):
             return Err(e)
 
+    _invalidate_cached_area_seats(group.seats)
+
     return Ok((occupancy, event))
 
 
@@ -114,6 +116,8 @@ def switch_group(
         case Err(e):
             return Err(e)
 
+    _invalidate_cached_area_seats(old_group.seats + new_group.seats)
+
     return Ok((release_event, occupation_event))
 
 
@@ -150,9 +154,16 @@ def release_group(
         case Err(e):
             return Err(e)
 
+    _invalidate_cached_area_seats(group.seats)
+
     return Ok(event)
 
 
+def _invalidate_cached_area_seats(seats: list[Seat]) -> None:
+    area_ids = {seat.area_id for seat in seats}
+    seat_service.invalidate_cached_area_seats(area_ids)
+
+
 def release_potential_group_for_bundle(
     ticket_bundle_id: TicketBundleID, initiator: User
 ) -> Result[None, SeatingError]:
@@ -78,6 +78,45 @@ def count_occupied_seats_by_category(
     ]
 
 
+def count_occupied_seats_by_party_and_category(
+    party_ids: set[PartyID],
+) -> dict[PartyID, list[tuple[TicketCategory, int]]]:
+    """Count occupied seats for the parties, grouped by party and ticket
+    category.
+    """
+    subquery = (
+        select(DbSeat.id, DbSeat.category_id)
+        .join(DbTicket)
+        .filter_by(revoked=False)
+        .subquery()
+    )
+
+    rows = db.session.execute(
+        select(
+            DbTicketCategory.id,
+            DbTicketCategory.party_id,
+            DbTicketCategory.title,
+            db.func.count(subquery.c.id),
+        )
+        .outerjoin(subquery, DbTicketCategory.id == subquery.c.category_id)
+        .filter(DbTicketCategory.party_id.in_(party_ids))
+        .group_by(DbTicketCategory.id)
+        .order_by(DbTicketCategory.id)
+    ).all()
+
+    counts_by_party_id: dict[PartyID, list[tuple[TicketCategory, int]]] = {
+        party_id: [] for party_id in party_ids
+    }
+
+    for category_id, party_id, title, occupied_seat_count in rows:
+        category = TicketCategory(
+            id=category_id, party_id=party_id, title=title
+        )
+        counts_by_party_id[party_id].append((category, occupied_seat_count))
+
+    return counts_by_party_id
+
+
 def count_occupied_seats_for_party(party_id: PartyID) -> int:
     """Count occupied seats for the party."""
     return (
@@ -19,9 +19,16 @@ from byceps.services.ticketing.models.ticket import (
 from byceps.services.user import user_service
 from byceps.services.user.models import User, UserID
 
-from . import seat_domain_service, seat_repository
+from . import area_seats_cache, seat_domain_service, seat_repository
 from .dbmodels.seat import DbSeat
-from .models import AreaSeat, Seat, SeatID, SeatingAreaID, SeatUtilization
+from .models import (
+    AreaSeat,
+    AreaSeats,
+    Seat,
+    SeatID,
+    SeatingAreaID,
+    SeatUtilization,
+)
 
 
 def create_seat(
@@ -47,13 +54,21 @@ def create_seat(
 
     seat_repository.create_seat(seat)
 
+    area_seats_cache.invalidate_areas([seat.area_id])
+
     return seat
 
 
 def delete_seat(seat_id: SeatID) -> None:
     """Delete a seat."""
+    seat = find_seat(seat_id)
+    if seat is None:
+        return
+
     seat_repository.delete_seat(seat_id)
 
+    area_seats_cache.invalidate_areas([seat.area_id])
+
 
 def count_occupied_seats_by_category(
     party_id: PartyID,
@@ -62,6 +77,15 @@ def count_occupied_seats_by_category(
     return seat_repository.count_occupied_seats_by_category(party_id)
 
 
+def count_occupied_seats_by_party_and_category(
+    party_ids: set[PartyID],
+) -> dict[PartyID, list[tuple[TicketCategory, int]]]:
+    """Count occupied seats for the parties, grouped by party and ticket
+    category.
+    """
+    return seat_repository.count_occupied_seats_by_party_and_category(party_ids)
+
+
 def count_occupied_seats_for_party(party_id: PartyID) -> int:
     """Count occupied seats for the party."""
     return seat_repository.count_occupied_seats_for_party(party_id)
@@ -138,12 +162,32 @@ def get_area_seats(area_id: SeatingAreaID) -> list[AreaSeat]:
     )
 
     return [
-        _build_area_seat(seat, db_ticket, users_by_id)
+        _build_area_seat_from_db_ticket(seat, db_ticket, users_by_id)
         for seat, db_ticket in seats_with_db_tickets
     ]
 
 
-def _build_area_seat(
+def get_cached_area_seats(area_id: SeatingAreaID) -> AreaSeats:
+    """Return the area's seats (see `get_area_seats`) and their
+    version, from the cache if available.
+    """
+    return area_seats_cache.get_area_seats(area_id, get_area_seats)
+
+
+def update_cached_area_seat(
+    seat: Seat, ticket_id: TicketID | None, user: User | None
+) -> None:
+    """Update the occupancy of the seat in the cache."""
+    area_seat = _build_area_seat(seat, ticket_id, user)
+    area_seats_cache.update_seat(seat.area_id, area_seat)
+
+
+def invalidate_cached_area_seats(area_ids: Iterable[SeatingAreaID]) -> None:
+    """Remove the seats of the areas from the cache."""
+    area_seats_cache.invalidate_areas(area_ids)
+
+
+def _build_area_seat_from_db_ticket(
     seat: Seat, db_ticket: DbTicket | None, users_by_id: dict[UserID, User]
 ) -> AreaSeat:
     ticket_id: TicketID | None = None
@@ -154,6 +198,12 @@ def _build_area_seat(
         if user_id:
             user = users_by_id[user_id]
 
+    return _build_area_seat(seat, ticket_id, user)
+
+
+def _build_area_seat(
+    seat: Seat, ticket_id: TicketID | None, user: User | None
+) -> AreaSeat:
     return AreaSeat(
         id=seat.id,
         coord_x=seat.coord_x,
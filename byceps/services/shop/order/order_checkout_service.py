@@ -6,16 +6,22 @@ byceps.services.shop.order.order_checkout_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from collections import defaultdict
 from collections.abc import Iterator
 from datetime import datetime
 
 from sqlalchemy.exc import IntegrityError
 import structlog
 
+from byceps.byceps_app import get_current_byceps_app
 from byceps.database import db
 from byceps.services.shop.cart.models import Cart
 from byceps.services.shop.order.log import order_log_service
 from byceps.services.shop.product import product_service
+from byceps.services.shop.product.errors import (
+    InsufficientProductQuantityError,
+)
+from byceps.services.shop.product.models import ProductID
 from byceps.services.shop.shop import shop_service
 from byceps.services.shop.storefront.models import Storefront
 from byceps.util.result import Err, Ok, Result
@@ -44,8 +50,13 @@ def place_order(
     order_number_sequence = order_sequence_service.get_order_number_sequence(
         storefront.order_number_sequence_id
     )
+    order_number_block_size = (
+        get_current_byceps_app().byceps_config.shop.order_number_block_size
+    )
     order_number_generation_result = (
-        order_sequence_service.generate_order_number(order_number_sequence.id)
+        order_sequence_service.generate_order_number(
+            order_number_sequence.id, block_size=order_number_block_size
+        )
     )
     if order_number_generation_result.is_err():
         error_message = order_number_generation_result.unwrap_err()
@@ -76,7 +87,14 @@ def place_order(
     db.session.add(db_order)
     db.session.add_all(db_line_items)
 
-    _reduce_product_stock(incoming_order)
+    reduce_stock_result = _reduce_product_stock(incoming_order)
+    if reduce_stock_result.is_err():
+        log.error(
+            'Order placement failed',
+            error_message='Insufficient product quantity',
+            product_ids=sorted(reduce_stock_result.unwrap_err().product_ids),
+        )
+        return Err(None)
 
     db_log_entry = order_log_service.to_db_entry(log_entry)
     db.session.add(db_log_entry)
@@ -150,9 +168,18 @@ def _build_db_line_items(
         )
 
 
-def _reduce_product_stock(incoming_order: IncomingOrder) -> None:
-    """Reduce product stock according to what is in the cart."""
+def _reduce_product_stock(
+    incoming_order: IncomingOrder,
+) -> Result[None, InsufficientProductQuantityError]:
+    """Reduce product stock according to what is in the cart.
+
+    Fail (and roll back the transaction) if the stock of any product is
+    insufficient.
+    """
+    quantities_by_product_id: dict[ProductID, int] = defaultdict(int)
     for line_item in incoming_order.line_items:
-        product_service.decrease_quantity(
-            line_item.product_id, line_item.quantity, commit=False
-        )
+        quantities_by_product_id[line_item.product_id] += line_item.quantity
+
+    return product_service.decrease_quantities(
+        quantities_by_product_id, commit=False
+    )
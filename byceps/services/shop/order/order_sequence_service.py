@@ -6,6 +6,9 @@ byceps.services.shop.order.order_sequence_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from dataclasses import dataclass
+from threading import Lock
+
 from sqlalchemy import delete, select, update
 from sqlalchemy.exc import IntegrityError
 
@@ -75,16 +78,72 @@ def get_order_number_sequences_for_shop(
     ]
 
 
+@dataclass(kw_only=True)
+class _ReservedOrderNumberBlock:
+    """A block of order numbers reserved by this process."""
+
+    prefix: str
+    next_value: int
+    last_value: int
+
+    def is_exhausted(self) -> bool:
+        return self.next_value > self.last_value
+
+
+_reserved_blocks: dict[OrderNumberSequenceID, _ReservedOrderNumberBlock] = {}
+_reserved_blocks_lock = Lock()
+
+
 def generate_order_number(
-    sequence_id: OrderNumberSequenceID,
+    sequence_id: OrderNumberSequenceID, *, block_size: int = 1
 ) -> Result[OrderNumber, str]:
     """Generate and reserve an unused, unique order number from this
     sequence.
+
+    With a block size greater than 1, a block of that many numbers is
+    reserved from the sequence at once. Subsequent calls in this process
+    hand out numbers from that block (without touching the database)
+    until it is exhausted.
+    """
+    if block_size <= 1:
+        return _reserve_values(sequence_id, 1).map(
+            lambda prefix_and_value: _build_order_number(*prefix_and_value)
+        )
+
+    with _reserved_blocks_lock:
+        block = _reserved_blocks.get(sequence_id)
+
+        if (block is None) or block.is_exhausted():
+            reservation_result = _reserve_values(sequence_id, block_size)
+            if reservation_result.is_err():
+                return Err(reservation_result.unwrap_err())
+
+            prefix, last_value = reservation_result.unwrap()
+
+            block = _ReservedOrderNumberBlock(
+                prefix=prefix,
+                next_value=last_value - block_size + 1,
+                last_value=last_value,
+            )
+            _reserved_blocks[sequence_id] = block
+
+        value = block.next_value
+        block.next_value += 1
+
+    return Ok(_build_order_number(block.prefix, value))
+
+
+def _reserve_values(
+    sequence_id: OrderNumberSequenceID, quantity: int
+) -> Result[tuple[str, int], str]:
+    """Advance the sequence by that quantity in a single statement.
+
+    Return the sequence's prefix and the last reserved value.
     """
     row = db.session.execute(
         update(DbOrderNumberSequence)
         .filter_by(id=sequence_id)
-        .values(value=DbOrderNumberSequence.value + 1)
+        .values(value=DbOrderNumberSequence.value + quantity)
         .returning(DbOrderNumberSequence.prefix, DbOrderNumberSequence.value)
     ).one_or_none()
     db.session.commit()
@@ -93,9 +152,44 @@ def generate_order_number(
         return Err(f'No order number sequence found for ID "{sequence_id}".')
 
     prefix, value = row
-    order_number = OrderNumber(f'{prefix}{value:05d}')
 
-    return Ok(order_number)
+    return Ok((prefix, value))
+
+
+def _build_order_number(prefix: str, value: int) -> OrderNumber:
+    return OrderNumber(f'{prefix}{value:05d}')
+
+
+def release_unused_order_numbers() -> int:
+    """Try to hand back the reserved but unused order numbers of this
+    process to their sequences.
+
+    This succeeds for a sequence only if no numbers have been reserved
+    from it since this process reserved its block. Otherwise, the unused
+    numbers remain as a gap.
+
+    Return the number of order numbers handed back.
+    """
+    released_count = 0
+
+    with _reserved_blocks_lock:
+        for sequence_id, block in _reserved_blocks.items():
+            if block.is_exhausted():
+                continue
+
+            result = db.session.execute(
+                update(DbOrderNumberSequence)
+                .filter_by(id=sequence_id, value=block.last_value)
+                .values(value=block.next_value - 1)
+            )
+            if result.rowcount:
+                released_count += block.last_value - block.next_value + 1
+
+        db.session.commit()
+
+        _reserved_blocks.clear()
+
+    return released_count
 
 
 def _db_entity_to_order_number_sequence(
@@ -75,6 +75,29 @@ def count_orders_per_payment_state(shop_id: ShopID) -> dict[PaymentState, int]:
     return counts_by_payment_state
 
 
+def count_orders_per_shop_and_payment_state(
+    shop_ids: set[ShopID],
+) -> dict[ShopID, dict[PaymentState, int]]:
+    """Count orders for the shops, grouped by shop and payment state."""
+    counts_by_shop_id = {
+        shop_id: dict.fromkeys(PaymentState, 0) for shop_id in shop_ids
+    }
+
+    rows = db.session.execute(
+        select(
+            DbOrder.shop_id, DbOrder._payment_state, db.func.count(DbOrder.id)
+        )
+        .filter(DbOrder.shop_id.in_(shop_ids))
+        .group_by(DbOrder.shop_id, DbOrder._payment_state)
+    ).all()
+
+    for shop_id, payment_state_str, count in rows:
+        payment_state = PaymentState[payment_state_str]
+        counts_by_shop_id[shop_id][payment_state] = count
+
+    return counts_by_shop_id
+
+
 def count_orders_per_payment_state_via_order_prefix(
     order_number_prefix: str,
 ) -> dict[PaymentState, int]:
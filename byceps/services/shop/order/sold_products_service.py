@@ -10,6 +10,7 @@ from __future__ import annotations
 
 from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
+from itertools import chain
 
 from flask_babel import lazy_gettext
 
@@ -127,13 +128,13 @@ def get_product_quantity(product_number: ProductNumber, order: Order) -> int:
     return product_line_item.quantity
 
 
-def export_sold_products_as_csv(report: SoldProductsReport) -> str:
+def export_sold_products_as_csv(report: SoldProductsReport) -> Iterator[str]:
+    """Serialize the report to CSV, line by line."""
     header_row = _assemble_csv_header_row(report)
     data_rows = _assemble_csv_data_rows(report)
-    all_rows = [header_row] + data_rows
+    all_rows = chain([header_row], data_rows)
 
-    lines = serialize_tuples_to_csv(all_rows)
-    return ''.join(lines)
+    return serialize_tuples_to_csv(all_rows)
 
 
 def _assemble_csv_header_row(report: SoldProductsReport) -> CsvRow:
@@ -146,11 +147,9 @@ def _assemble_csv_header_row(report: SoldProductsReport) -> CsvRow:
     return fixed_column_names + product_names
 
 
-def _assemble_csv_data_rows(report: SoldProductsReport) -> list[CsvRow]:
-    return [
-        tuple(_assemble_data_row(order_summary))
-        for order_summary in report.order_summaries
-    ]
+def _assemble_csv_data_rows(report: SoldProductsReport) -> Iterator[CsvRow]:
+    for order_summary in report.order_summaries:
+        yield tuple(_assemble_data_row(order_summary))
 
 
 def _assemble_data_row(order_summary: OrderSummary) -> Iterator[str]:
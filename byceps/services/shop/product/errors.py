@@ -6,6 +6,17 @@ byceps.services.shop.product.errors
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from dataclasses import dataclass
+
+from .models import ProductID
+
+
+@dataclass(frozen=True)
+class InsufficientProductQuantityError:
+    """The available quantity of these products is too low."""
+
+    product_ids: frozenset[ProductID]
+
 
 class NoProductsAvailableError:
     pass
@@ -10,7 +10,7 @@ from collections import defaultdict
 from collections.abc import Sequence
 from datetime import datetime
 
-from sqlalchemy import delete, select, update
+from sqlalchemy import column, delete, Integer, select, update, Uuid, values
 from sqlalchemy.sql import Select
 
 from byceps.database import db, paginate, Pagination
@@ -149,6 +149,57 @@ def decrease_quantity(
         db.session.commit()
 
 
+def decrease_quantities(
+    quantities_by_product_id: dict[ProductID, int], commit: bool
+) -> set[ProductID]:
+    """Decrease the quantities of multiple products in a single
+    statement.
+
+    The product rows are locked in order of their IDs to avoid
+    deadlocks between concurrent calls.
+
+    If any product's quantity is insufficient, roll back the transaction
+    and return the IDs of those products. Otherwise, return an empty
+    set.
+    """
+    product_ids = set(quantities_by_product_id.keys())
+
+    locked_product_ids = (
+        select(DbProduct.id)
+        .filter(DbProduct.id.in_(product_ids))
+        .order_by(DbProduct.id)
+        .with_for_update()
+        .cte('locked_product_ids')
+    )
+
+    quantities = values(
+        column('product_id', Uuid),
+        column('quantity', Integer),
+        name='quantities',
+    ).data(list(quantities_by_product_id.items()))
+
+    updated_product_ids = db.session.scalars(
+        update(DbProduct)
+        .where(DbProduct.id == locked_product_ids.c.id)
+        .where(DbProduct.id == quantities.c.product_id)
+        .where(DbProduct.quantity >= quantities.c.quantity)
+        .values(quantity=DbProduct.quantity - quantities.c.quantity)
+        .returning(DbProduct.id)
+        .execution_options(synchronize_session=False)
+    ).all()
+
+    insufficient_product_ids = product_ids.difference(updated_product_ids)
+
+    if insufficient_product_ids:
+        db.session.rollback()
+        return insufficient_product_ids
+
+    if commit:
+        db.session.commit()
+
+    return set()
+
+
 def delete_product(product_id: ProductID) -> None:
     """Delete a product."""
     db.session.execute(delete(DbProduct).filter_by(id=product_id))
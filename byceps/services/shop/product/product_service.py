@@ -21,7 +21,7 @@ from byceps.util.result import Err, Ok, Result
 from . import product_domain_service, product_repository
 from .dbmodels.product import DbProduct, DbProductImage
 from .dbmodels.attached_product import DbAttachedProduct
-from .errors import NoProductsAvailableError
+from .errors import InsufficientProductQuantityError, NoProductsAvailableError
 from .models import (
     Product,
     ProductAttachment,
@@ -244,6 +244,32 @@ def decrease_quantity(
     )
 
 
+def decrease_quantities(
+    quantities_by_product_id: dict[ProductID, int], *, commit: bool = True
+) -> Result[None, InsufficientProductQuantityError]:
+    """Decrease the quantities of multiple products at once.
+
+    Either all quantities are decreased, or – if any product's quantity
+    is insufficient – none are and the current transaction is rolled
+    back.
+    """
+    if not quantities_by_product_id:
+        return Ok(None)
+
+    insufficient_product_ids = product_repository.decrease_quantities(
+        quantities_by_product_id, commit
+    )
+
+    if insufficient_product_ids:
+        return Err(
+            InsufficientProductQuantityError(
+                product_ids=frozenset(insufficient_product_ids)
+            )
+        )
+
+    return Ok(None)
+
+
 def delete_product(product_id: ProductID) -> None:
     """Delete a product."""
     product_repository.delete_product(product_id)
@@ -27,6 +27,10 @@ Context = dict[str, Any]
 
 def get_rendered_snippet_body(version: DbSnippetVersion) -> str:
     """Return the rendered body of the snippet."""
+    html = snippet_service.find_html(version.id)
+    if html is not None:
+        return html
+
     template = _load_template_with_globals(version.body)
     return template.render()
 
@@ -92,6 +96,10 @@ def render_snippet_as_partial(
         context = {}
 
     try:
+        html = snippet_service.find_html(current_version.id)
+        if html is not None:
+            return html
+
         return _render_template(current_version.body, context=context)
     except Exception as e:
         log.error(
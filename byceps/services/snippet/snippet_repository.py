@@ -152,6 +152,21 @@ def get_snippets_for_scope_with_current_versions(
     )
 
 
+def get_all_snippets_with_current_versions() -> Sequence[DbSnippet]:
+    """Return all snippets with their current versions."""
+    return (
+        db.session.scalars(
+            select(DbSnippet).options(
+                db.joinedload(DbSnippet.current_version_association).joinedload(
+                    DbCurrentSnippetVersionAssociation.version
+                )
+            )
+        )
+        .unique()
+        .all()
+    )
+
+
 def get_all_scopes() -> list[SnippetScope]:
     """List all scopes that contain snippets."""
     rows = db.session.execute(
@@ -196,23 +211,3 @@ def get_versions(snippet_id: SnippetID) -> Sequence[DbSnippetVersion]:
         .filter_by(snippet_id=snippet_id)
         .order_by(DbSnippetVersion.created_at.desc())
     ).all()
-
-
-def search_snippets(
-    search_term: str, scope: SnippetScope | None
-) -> Sequence[DbSnippetVersion]:
-    """Search in (the latest versions of) snippets."""
-    stmt = (
-        select(DbSnippetVersion)
-        .join(DbCurrentSnippetVersionAssociation)
-        .join(DbSnippet)
-    )
-
-    if scope is not None:
-        stmt = stmt.filter(DbSnippet.scope_type == scope.type_).filter(
-            DbSnippet.scope_name == scope.name
-        )
-
-    stmt = stmt.filter(DbSnippetVersion.body.contains(search_term))
-
-    return db.session.scalars(stmt).all()
@@ -7,10 +7,18 @@ byceps.services.snippet.snippet_service
 """
 
 from datetime import datetime
+from uuid import UUID
 
+import structlog
+
+from byceps.database import db
+from byceps.services.rendered_html import rendered_html_service
+from byceps.services.search import search_service
+from byceps.services.search.models import SearchDocumentType
 from byceps.services.user import user_service
 from byceps.services.user.models import User
 from byceps.util.result import Err, Ok, Result
+from byceps.util.templating import load_template
 
 from . import snippet_repository
 from .dbmodels import DbSnippet, DbSnippetVersion
@@ -27,6 +35,14 @@ from .events import (
 from .models import SnippetID, SnippetScope, SnippetVersionID
 
 
+log = structlog.get_logger()
+
+
+# Increase to have stored HTML rendered anew after changing how snippet
+# bodies are rendered.
+HTML_RENDERER_VERSION = 1
+
+
 def copy_snippet(
     source_scope: SnippetScope,
     target_scope: SnippetScope,
@@ -84,6 +100,9 @@ def create_snippet(
         scope, name, language_code, created_at, creator.id, body
     )
 
+    _store_html(db_version)
+    _index(db_snippet, db_version)
+
     event = SnippetCreatedEvent(
         occurred_at=db_version.created_at,
         initiator=creator,
@@ -107,6 +126,9 @@ def update_snippet(
         snippet_id, created_at, creator.id, body
     )
 
+    _store_html(db_version)
+    _index(db_snippet, db_version)
+
     event = SnippetUpdatedEvent(
         occurred_at=db_version.created_at,
         initiator=creator,
@@ -134,11 +156,18 @@ def delete_snippet(
     snippet_name = db_snippet.name
     scope = db_snippet.scope
     language_code = db_snippet.language_code
+    version_ids = [db_version.id for db_version in get_versions(snippet_id)]
 
     match snippet_repository.delete_snippet(snippet_id):
         case Err(e):
             return Err(e)
 
+    rendered_html_service.delete_html(version_ids)
+    search_service.remove_documents(
+        SearchDocumentType.snippet, [str(snippet_id)]
+    )
+    db.session.commit()
+
     event = SnippetDeletedEvent(
         occurred_at=datetime.utcnow(),
         initiator=initiator,
@@ -151,6 +180,91 @@ def delete_snippet(
     return Ok(event)
 
 
+def _index(
+    db_snippet: DbSnippet, db_version: DbSnippetVersion, *, commit: bool = True
+) -> None:
+    """Add the snippet's current version to the search index."""
+    search_service.index_document(
+        SearchDocumentType.snippet,
+        str(db_snippet.id),
+        db_snippet.scope.as_string(),
+        db_snippet.language_code,
+        db_snippet.name,
+        db_version.body,
+        commit=commit,
+    )
+
+
+def reindex_all_snippets() -> int:
+    """Add the current versions of all snippets to the search index.
+
+    Return the number of indexed snippets.
+    """
+    db_snippets = snippet_repository.get_all_snippets_with_current_versions()
+
+    for db_snippet in db_snippets:
+        _index(db_snippet, db_snippet.current_version, commit=False)
+
+    db.session.commit()
+
+    return len(db_snippets)
+
+
+def store_html_for_all_snippets() -> int:
+    """Store the body HTML of the current versions of all snippets,
+    unless it has to be rendered live.
+
+    Return the number of processed snippets.
+    """
+    db_snippets = snippet_repository.get_all_snippets_with_current_versions()
+
+    for db_snippet in db_snippets:
+        _store_body_html(db_snippet.current_version)
+
+    db.session.commit()
+
+    return len(db_snippets)
+
+
+def _store_html(db_version: DbSnippetVersion) -> None:
+    """Render the version's body ahead of time, if possible."""
+    _store_body_html(db_version)
+    db.session.commit()
+
+
+def _store_body_html(db_version: DbSnippetVersion) -> None:
+    try:
+        rendered_html_service.store_html(
+            db_version.id,
+            'body',
+            HTML_RENDERER_VERSION,
+            db_version.body,
+            _render_html,
+        )
+    except Exception as exc:
+        # The body gets rendered live when the snippet is viewed.
+        log.warning(
+            'Storing HTML of body for snippet version %s failed: %s',
+            db_version.id,
+            exc,
+        )
+
+
+def find_html(version_id: SnippetVersionID) -> str | None:
+    """Return the HTML stored for the version's body.
+
+    Return `None` if the body has to be rendered live (e.g. because it
+    refers to variables passed by the embedding template).
+    """
+    return rendered_html_service.find_html(
+        version_id, 'body', HTML_RENDERER_VERSION
+    )
+
+
+def _render_html(source: str) -> str:
+    return load_template(source).render()
+
+
 def find_snippet(snippet_id: SnippetID) -> DbSnippet | None:
     """Return the snippet with that ID, or `None` if not found."""
     return snippet_repository.find_snippet(snippet_id)
@@ -225,7 +339,20 @@ def get_snippet_body(
 def search_snippets(
     search_term: str, scope: SnippetScope | None
 ) -> list[DbSnippetVersion]:
-    """Search in (the latest versions of) snippets."""
-    db_versions = snippet_repository.search_snippets(search_term, scope)
+    """Search in (the latest versions of) snippets, most relevant first."""
+    scopes = {scope.as_string()} if scope is not None else None
+    results = search_service.search(
+        search_term, SearchDocumentType.snippet, scopes=scopes, limit=None
+    )
 
-    return list(db_versions)
+    snippet_ids = [SnippetID(UUID(result.document_id)) for result in results]
+    db_snippets_by_id = {
+        db_snippet.id: db_snippet
+        for db_snippet in snippet_repository.get_snippets(set(snippet_ids))
+    }
+
+    return [
+        db_snippets_by_id[snippet_id].current_version
+        for snippet_id in snippet_ids
+        if snippet_id in db_snippets_by_id
+    ]
@@ -2,14 +2,39 @@
 byceps.services.text_markup.text_markup_service
 ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
+Rendered HTML is cached by a digest of the text and the locale (as the
+output can contain translated phrases), in the process and, when
+rendering in bulk, in Redis.
+
 :Copyright: 2014-2026 Jochen Kupperschmidt
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from collections import OrderedDict
+from collections.abc import Sequence
+from datetime import timedelta
+from hashlib import sha256
 from html import escape
+from threading import Lock
 
 from bbcode import Parser
-from flask_babel import gettext
+from flask import current_app, has_app_context, has_request_context
+from flask_babel import get_locale, gettext
+from redis.exceptions import RedisError
+import structlog
+
+from byceps.byceps_app import get_current_byceps_app
+
+
+# The maximum number of rendered texts to keep per process.
+CACHE_MAX_SIZE = 2048
+
+CACHE_TTL = timedelta(days=1)
+
+REDIS_KEY_PREFIX = 'text_markup:html'
+
+
+log = structlog.get_logger()
 
 
 try:
@@ -82,6 +107,122 @@ _PARSER = _create_parser()
 
 def render_html(value: str) -> str:
     """Render text as HTML, interpreting BBcode."""
+    cache_key = _get_cache_key(value)
+
+    html = _get_cached(cache_key)
+    if html is None:
+        html = _render_html(value)
+        _put_cached(cache_key, html)
+
+    return html
+
+
+def render_html_bulk(values: Sequence[str]) -> list[str]:
+    """Render texts as HTML, interpreting BBcode.
+
+    Texts not cached in this process are looked up in Redis with a
+    single request. Those not found there are rendered and stored.
+    """
+    cache_keys = [_get_cache_key(value) for value in values]
+
+    htmls = [_get_cached(cache_key) for cache_key in cache_keys]
+
+    missing_indexes = [i for i, html in enumerate(htmls) if html is None]
+    if missing_indexes:
+        missing_cache_keys = [cache_keys[i] for i in missing_indexes]
+        stored_htmls = _get_stored(missing_cache_keys)
+
+        to_store = {}
+        for i, stored_html in zip(missing_indexes, stored_htmls, strict=True):
+            html = stored_html
+            if html is None:
+                html = _render_html(values[i])
+                to_store[cache_keys[i]] = html
+
+            htmls[i] = html
+            _put_cached(cache_keys[i], html)
+
+        _store(to_store)
+
+    return htmls  # type: ignore[return-value]
+
+
+def _render_html(value: str) -> str:
     html = _PARSER.format(value)
     html = _replace_smileys(html)
     return html
+
+
+# caching
+
+
+_cache_lock = Lock()
+_cache: OrderedDict[str, str] = OrderedDict()
+
+
+def _get_cache_key(value: str) -> str:
+    locale = _get_locale_key()
+    digest = sha256(value.encode('utf-8')).hexdigest()
+    return f'{locale}:{digest}'
+
+
+def _get_locale_key() -> str | None:
+    """Identify the locale that translations are rendered in."""
+    if has_request_context():
+        return str(get_locale())
+
+    if has_app_context():
+        return current_app.config.get('BABEL_DEFAULT_LOCALE')
+
+    return None
+
+
+def _get_cached(cache_key: str) -> str | None:
+    with _cache_lock:
+        html = _cache.get(cache_key)
+        if html is not None:
+            _cache.move_to_end(cache_key)
+        return html
+
+
+def _put_cached(cache_key: str, html: str) -> None:
+    with _cache_lock:
+        _cache[cache_key] = html
+        _cache.move_to_end(cache_key)
+
+        while len(_cache) > CACHE_MAX_SIZE:
+            _cache.popitem(last=False)
+
+
+def _get_stored(cache_keys: list[str]) -> list[str | None]:
+    if not has_app_context():
+        return [None] * len(cache_keys)
+
+    redis_keys = [_get_redis_key(cache_key) for cache_key in cache_keys]
+
+    try:
+        values = get_current_byceps_app().redis_client.mget(redis_keys)
+    except RedisError as exc:
+        log.warning('Could not read rendered text markup', exc_info=exc)
+        return [None] * len(cache_keys)
+
+    return [
+        value.decode('utf-8') if value is not None else None for value in values
+    ]
+
+
+def _store(htmls_by_cache_key: dict[str, str]) -> None:
+    if not htmls_by_cache_key or not has_app_context():
+        return
+
+    try:
+        pipeline = get_current_byceps_app().redis_client.pipeline()
+        for cache_key, html in htmls_by_cache_key.items():
+            pipeline.set(_get_redis_key(cache_key), html, ex=CACHE_TTL)
+        pipeline.execute()
+    except RedisError as exc:
+        log.warning('Could not store rendered text markup', exc_info=exc)
+
+
+def _get_redis_key(cache_key: str) -> str:
+    return f'{REDIS_KEY_PREFIX}:{cache_key}'
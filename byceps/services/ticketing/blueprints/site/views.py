@@ -6,12 +6,14 @@ byceps.services.ticketing.blueprints.site.views
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from datetime import timedelta
 from typing import Any
 
 from flask import abort, g, request
 from flask_babel import gettext
 
 from byceps.services.party import party_service
+from byceps.services.party.models import Party
 from byceps.services.shop.order import order_service
 from byceps.services.ticketing import (
     barcode_service,
@@ -20,6 +22,9 @@ from byceps.services.ticketing import (
     ticket_service,
     ticket_user_management_service,
 )
+from byceps.services.ticketing.models.ticket import TicketSaleStats
+from byceps.util import fragment_cache
+from byceps.util.fragment_cache_invalidation import TICKETS
 from byceps.util.framework.blueprint import create_blueprint
 from byceps.util.framework.flash import flash_error, flash_success
 from byceps.util.framework.templating import templated
@@ -34,6 +39,11 @@ from . import (
 from .forms import SpecifyUserForm
 
 
+# Tickets can be created (and revoked) other than by selling them, which
+# does not invalidate the cache.
+TICKET_SALE_STATS_TTL = timedelta(minutes=1)
+
+
 blueprint = create_blueprint('ticketing', __name__)
 
 
@@ -45,13 +55,36 @@ def inject_ticket_sale_stats() -> dict[str, Any]:
     if g.site.is_intranet:
         return {}
 
-    ticket_sale_stats = ticket_service.get_ticket_sale_stats(g.party)
+    ticket_sale_stats = _get_ticket_sale_stats(g.party)
 
     return {
         'ticket_sale_stats': ticket_sale_stats,
     }
 
 
+def _get_ticket_sale_stats(party: Party) -> TicketSaleStats:
+    """Return the ticket sale stats for the party.
+
+    Counting the sold tickets on every page view is expensive, so the
+    number is cached.
+    """
+
+    def count_sold_tickets() -> str:
+        return str(ticket_service.count_sold_tickets_for_party(party.id))
+
+    tickets_sold = fragment_cache.get_or_render(
+        f'ticket_sale_stats:{party.id}:tickets_sold',
+        count_sold_tickets,
+        ttl=TICKET_SALE_STATS_TTL,
+        depends_on=[TICKETS],
+    )
+
+    return TicketSaleStats(
+        tickets_max=party.max_ticket_quantity,
+        tickets_sold=int(tickets_sold),
+    )
+
+
 @blueprint.get('/mine')
 @login_required
 @templated
@@ -65,3 +65,10 @@ class TicketBundle:
 class TicketSaleStats:
     tickets_max: int | None
     tickets_sold: int
+
+
+@dataclass(frozen=True, kw_only=True)
+class TicketCounts:
+    revoked: int
+    sold: int
+    checked_in: int
@@ -6,7 +6,8 @@ byceps.services.ticketing.ticket_code_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from random import sample
+from collections.abc import Set as AbstractSet
+from secrets import choice
 from string import ascii_uppercase, digits
 
 from byceps.util.result import Err, Ok, Result
@@ -16,12 +17,17 @@ from .models.ticket import TicketCode
 
 def generate_ticket_codes(
     requested_quantity: int,
+    *,
+    excluded_codes: AbstractSet[TicketCode] = frozenset(),
 ) -> Result[set[TicketCode], str]:
-    """Generate a number of ticket codes."""
+    """Generate a number of unique ticket codes.
+
+    Codes in `excluded_codes` (e.g. those already in use) are skipped.
+    """
     codes: set[TicketCode] = set()
 
     for _ in range(requested_quantity):
-        match _generate_ticket_code_not_in(codes):
+        match _generate_ticket_code_not_in(codes, excluded_codes):
             case Ok(code):
                 codes.add(code)
             case Err(e):
@@ -39,12 +45,15 @@ def generate_ticket_codes(
 
 
 def _generate_ticket_code_not_in(
-    codes: set[TicketCode], *, max_attempts: int = 4
+    codes: set[TicketCode],
+    excluded_codes: AbstractSet[TicketCode],
+    *,
+    max_attempts: int = 4,
 ) -> Result[TicketCode, str]:
-    """Generate ticket codes and return the first one not in the set."""
+    """Generate ticket codes and return the first one in neither set."""
     for _ in range(max_attempts):
         code = _generate_ticket_code()
-        if code not in codes:
+        if (code not in codes) and (code not in excluded_codes):
             return Ok(code)
 
     return Err(
@@ -59,9 +68,14 @@ _CODE_LENGTH = 5
 def _generate_ticket_code() -> TicketCode:
     """Generate a ticket code.
 
+    Symbols may repeat, which makes for 21^5 (about 4 million) possible
+    codes.
+
     Generated codes are not necessarily unique!
     """
-    return TicketCode(''.join(sample(_CODE_ALPHABET, _CODE_LENGTH)))
+    return TicketCode(
+        ''.join(choice(_CODE_ALPHABET) for _ in range(_CODE_LENGTH))
+    )
 
 
 _ALLOWED_CODE_SYMBOLS = frozenset(_CODE_ALPHABET + ascii_uppercase + digits)
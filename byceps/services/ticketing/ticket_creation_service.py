@@ -9,19 +9,21 @@ byceps.services.ticketing.ticket_creation_service
 from collections.abc import Iterator
 from datetime import datetime
 
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from tenacity import retry, retry_if_exception_type, stop_after_attempt
 
 from byceps.database import db
+from byceps.services.party.models import PartyID
 from byceps.services.shop.order.models.number import OrderNumber
 from byceps.services.ticketing.models.ticket import TicketID
 from byceps.services.user.models import User
-from byceps.util.result import Err, Ok
+from byceps.util.result import Err, Ok, Result
 from byceps.util.uuid import generate_uuid7
 
 from . import ticket_code_service
 from .dbmodels.ticket import DbTicket
-from .models.ticket import TicketBundleID, TicketCategory
+from .models.ticket import TicketBundleID, TicketCategory, TicketCode
 
 
 class TicketCreationFailedError(Exception):
@@ -94,7 +96,7 @@ def build_tickets(
     if quantity < 1:
         raise ValueError('Ticket quantity must be positive.')
 
-    match ticket_code_service.generate_ticket_codes(quantity):
+    match _generate_ticket_codes_unused_for_party(category.party_id, quantity):
         case Ok(codes):
             for code in codes:
                 ticket_id = TicketID(generate_uuid7())
@@ -112,3 +114,52 @@ def build_tickets(
                 )
         case Err(e):
             raise TicketCreationFailedError(e)
+
+
+def _generate_ticket_codes_unused_for_party(
+    party_id: PartyID, quantity: int, *, max_rounds: int = 4
+) -> Result[set[TicketCode], str]:
+    """Generate ticket codes that are not yet in use for the party.
+
+    Generated codes that turn out to be in use are looked up with a
+    single query per round and replaced in the next round.
+    """
+    codes: set[TicketCode] = set()
+    codes_in_use: set[TicketCode] = set()
+
+    for _ in range(max_rounds):
+        match ticket_code_service.generate_ticket_codes(
+            quantity - len(codes), excluded_codes=codes | codes_in_use
+        ):
+            case Ok(new_codes):
+                new_codes_in_use = _find_ticket_codes_in_use(
+                    party_id, new_codes
+                )
+                codes_in_use.update(new_codes_in_use)
+                codes.update(new_codes - new_codes_in_use)
+            case Err(e):
+                return Err(e)
+
+        if len(codes) == quantity:
+            return Ok(codes)
+
+    return Err(
+        f'Could not generate {quantity} unused ticket codes '
+        f'in {max_rounds} rounds.'
+    )
+
+
+def _find_ticket_codes_in_use(
+    party_id: PartyID, codes: set[TicketCode]
+) -> set[TicketCode]:
+    """Return those of the codes already in use for the party."""
+    if not codes:
+        return set()
+
+    codes_in_use = db.session.scalars(
+        select(DbTicket.code)
+        .filter_by(party_id=party_id)
+        .filter(DbTicket.code.in_(codes))
+    ).all()
+
+    return {TicketCode(code) for code in codes_in_use}
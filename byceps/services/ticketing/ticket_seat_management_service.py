@@ -12,6 +12,7 @@ from byceps.services.seating import seat_group_service, seat_service
 # Load `Seat.assignment` backref.
 from byceps.services.seating.dbmodels.seat_group import DbSeatGroup  # noqa: F401
 from byceps.services.seating.models import Seat, SeatID
+from byceps.services.user import user_service
 from byceps.services.user.models import User
 from byceps.util.result import Err, Ok, Result
 
@@ -121,6 +122,15 @@ def occupy_seat(
 
     db.session.commit()
 
+    if previous_seat_id is not None:
+        previous_seat = seat_service.find_seat(previous_seat_id)
+        if previous_seat is not None:
+            seat_service.update_cached_area_seat(previous_seat, None, None)
+
+    seat_service.update_cached_area_seat(
+        seat, db_ticket.id, _find_ticket_user(db_ticket)
+    )
+
     return Ok(None)
 
 
@@ -163,9 +173,18 @@ def release_seat(
 
     db.session.commit()
 
+    seat_service.update_cached_area_seat(seat, None, None)
+
     return Ok(None)
 
 
+def _find_ticket_user(db_ticket: DbTicket) -> User | None:
+    if db_ticket.used_by_id is None:
+        return None
+
+    return user_service.find_user(db_ticket.used_by_id, include_avatar=True)
+
+
 def _get_ticket(ticket_id: TicketID) -> Result[DbTicket, TicketIsRevokedError]:
     """Return the ticket with that ID.
 
@@ -27,6 +27,7 @@ from .log.dbmodels import DbTicketLogEntry
 from .models.ticket import (
     TicketCategoryID,
     TicketCode,
+    TicketCounts,
     TicketID,
     TicketSaleStats,
 )
@@ -360,6 +361,36 @@ def count_tickets_checked_in_for_party(party_id: PartyID) -> int:
     )
 
 
+def count_tickets_by_party(
+    party_ids: set[PartyID],
+) -> dict[PartyID, TicketCounts]:
+    """Return the numbers of revoked, "sold" and checked in tickets for
+    each of those parties.
+    """
+    rows = db.session.execute(
+        select(
+            DbTicket.party_id,
+            db.func.count(DbTicket.id).filter(DbTicket.revoked),
+            db.func.count(DbTicket.id).filter(db.not_(DbTicket.revoked)),
+            db.func.count(DbTicket.id).filter(DbTicket.user_checked_in),
+        )
+        .filter(DbTicket.party_id.in_(party_ids))
+        .group_by(DbTicket.party_id)
+    ).all()
+
+    counts_by_party_id = {
+        party_id: TicketCounts(revoked=0, sold=0, checked_in=0)
+        for party_id in party_ids
+    }
+
+    for party_id, revoked, sold, checked_in in rows:
+        counts_by_party_id[party_id] = TicketCounts(
+            revoked=revoked, sold=sold, checked_in=checked_in
+        )
+
+    return counts_by_party_id
+
+
 def get_ticket_sale_stats(party: Party) -> TicketSaleStats:
     """Return the number of maximum and sold tickets, respectively."""
     sold = count_sold_tickets_for_party(party.id)
@@ -7,10 +7,13 @@ byceps.services.ticketing.ticket_user_management_service
 """
 
 from byceps.database import db
+from byceps.services.seating import seat_service
+from byceps.services.user import user_service
 from byceps.services.user.models import User
 from byceps.util.result import Err, Ok, Result
 
 from . import ticket_service
+from .dbmodels.ticket import DbTicket
 from .errors import (
     TicketingError,
     TicketIsRevokedError,
@@ -104,6 +107,8 @@ def appoint_user(
 
     db.session.commit()
 
+    _update_cached_area_seat(db_ticket)
+
     return Ok(None)
 
 
@@ -135,4 +140,24 @@ def withdraw_user(
 
     db.session.commit()
 
+    _update_cached_area_seat(db_ticket)
+
     return Ok(None)
+
+
+def _update_cached_area_seat(db_ticket: DbTicket) -> None:
+    """Show the ticket's current user on the seat it occupies, if any."""
+    if db_ticket.occupied_seat_id is None:
+        return
+
+    seat = seat_service.find_seat(db_ticket.occupied_seat_id)
+    if seat is None:
+        return
+
+    user = (
+        user_service.find_user(db_ticket.used_by_id, include_avatar=True)
+        if db_ticket.used_by_id
+        else None
+    )
+
+    seat_service.update_cached_area_seat(seat, db_ticket.id, user)
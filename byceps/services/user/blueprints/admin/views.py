@@ -12,6 +12,7 @@ from flask import abort, g, request
 from flask_babel import gettext
 from secret_type import secret
 
+from byceps.database import KeysetPagination
 from byceps.services.authn.password import authn_password_service
 from byceps.services.authn.session import authn_session_service
 from byceps.services.authn import signals as authn_signals
@@ -38,6 +39,7 @@ from byceps.util.framework.flash import flash_error, flash_notice, flash_success
 from byceps.util.framework.templating import templated
 from byceps.util.result import Err, Ok
 from byceps.util.views import (
+    jsonified,
     permission_required,
     redirect_to,
     respond_no_content,
@@ -60,24 +62,38 @@ from .forms import (
 blueprint = create_blueprint('user_admin', __name__)
 
 
-@blueprint.get('/', defaults={'page': 1})
-@blueprint.get('/pages/<int:page>')
+AUTOCOMPLETE_LIMIT = 10
+SEARCH_RESULTS_LIMIT = 100
+
+
+@blueprint.get('/')
 @permission_required('user.view')
 @templated
-def index(page):
+def index():
     """List users."""
+    cursor = request.args.get('cursor')
     per_page = request.args.get('per_page', type=int, default=20)
     search_term = request.args.get('search_term', default='').strip()
     only = request.args.get('only')
 
     user_filter = UserFilter.__members__.get(only, UserFilter.none)
 
-    users = user_service.get_users_paginated(
-        page,
-        per_page,
-        search_term=search_term,
-        user_filter=user_filter,
-    )
+    if search_term:
+        # Show the best matches on a single page.
+        found_users = user_service.search_users(
+            search_term, user_filter=user_filter, limit=SEARCH_RESULTS_LIMIT
+        )
+        users = KeysetPagination(
+            items=found_users,
+            per_page=SEARCH_RESULTS_LIMIT,
+            total=len(found_users),
+            prev_cursor=None,
+            next_cursor=None,
+        )
+    else:
+        users = user_service.get_users_paginated_by_keyset(
+            cursor, per_page, user_filter=user_filter
+        )
 
     user_ids = {user.id for user in users.items}
     recent_login_datetimes_by_user_id = (
@@ -97,6 +113,29 @@ def index(page):
     }
 
 
+@blueprint.get('/autocomplete')
+@permission_required('user.view')
+@jsonified
+def autocomplete():
+    """Return users whose screen names start with the prefix as JSON."""
+    prefix = request.args.get('prefix', default='').strip()
+
+    users = user_service.get_users_by_screen_name_prefix(
+        prefix, limit=AUTOCOMPLETE_LIMIT
+    )
+
+    return {
+        'users': [
+            {
+                'id': user.id,
+                'screen_name': user.screen_name,
+                'avatar_url': user.avatar_url,
+            }
+            for user in users
+        ],
+    }
+
+
 @blueprint.get('/<uuid:user_id>')
 @permission_required('user.view')
 @templated
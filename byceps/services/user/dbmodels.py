@@ -80,6 +80,23 @@ class DbUser(db.Model):
     """A user."""
 
     __tablename__ = 'users'
+    __table_args__ = (
+        db.Index('ix_users_created_at_id', 'created_at', 'id'),
+        # Used to search for substrings (`ILIKE '%term%'`) and by
+        # similarity. Require the `pg_trgm` extension.
+        db.Index(
+            'ix_users_screen_name_trgm',
+            'screen_name',
+            postgresql_using='gin',
+            postgresql_ops={'screen_name': 'gin_trgm_ops'},
+        ),
+        db.Index(
+            'ix_users_email_address_trgm',
+            'email_address',
+            postgresql_using='gin',
+            postgresql_ops={'email_address': 'gin_trgm_ops'},
+        ),
+    )
 
     id: Mapped[UserID] = mapped_column(db.Uuid, primary_key=True)
     created_at: Mapped[datetime]
@@ -152,10 +169,38 @@ class DbUser(db.Model):
         )
 
 
+# Used to look up users by exact (case-insensitive) email address or
+# screen name, and by screen name prefix.
+db.Index(
+    'ix_users_email_address_lower',
+    db.func.lower(DbUser.email_address).label('email_address_lower'),
+    postgresql_ops={'email_address_lower': 'text_pattern_ops'},
+)
+db.Index(
+    'ix_users_screen_name_lower',
+    db.func.lower(DbUser.screen_name).label('screen_name_lower'),
+    postgresql_ops={'screen_name_lower': 'text_pattern_ops'},
+)
+
+
 class DbUserDetail(db.Model):
     """Detailed information about a specific user."""
 
     __tablename__ = 'user_details'
+    __table_args__ = (
+        db.Index(
+            'ix_user_details_first_name_trgm',
+            'first_name',
+            postgresql_using='gin',
+            postgresql_ops={'first_name': 'gin_trgm_ops'},
+        ),
+        db.Index(
+            'ix_user_details_last_name_trgm',
+            'last_name',
+            postgresql_using='gin',
+            postgresql_ops={'last_name': 'gin_trgm_ops'},
+        ),
+    )
 
     user_id: Mapped[UserID] = mapped_column(
         db.Uuid, db.ForeignKey('users.id'), primary_key=True
@@ -180,3 +225,20 @@ class DbUserDetail(db.Model):
     def full_name(self) -> str | None:
         names = [self.first_name, self.last_name]
         return ' '.join(filter(None, names)) or None
+
+
+class DbUserStateCount(db.Model):
+    """The number of user accounts in a state.
+
+    Maintained whenever an account is created or changes its state, but
+    only once the rows have been initialized.
+    """
+
+    __tablename__ = 'user_state_counts'
+
+    state: Mapped[str] = mapped_column(db.UnicodeText, primary_key=True)
+    count: Mapped[int]
+
+    def __init__(self, state: str, count: int) -> None:
+        self.state = state
+        self.count = count
@@ -108,3 +108,27 @@ UserFilter = Enum(
         'deleted',
     ],
 )
+
+
+# A user account is in exactly one of these states.
+UserState = Enum(
+    'UserState',
+    [
+        'active',
+        'uninitialized',
+        'suspended',
+        'deleted',
+    ],
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class UserStateCounts:
+    active: int
+    uninitialized: int
+    suspended: int
+    deleted: int
+
+    @property
+    def total(self) -> int:
+        return self.active + self.uninitialized + self.suspended + self.deleted
@@ -11,6 +11,7 @@ from typing import BinaryIO
 
 from byceps.byceps_app import get_current_byceps_app
 from byceps.database import db
+from byceps.services.authn.session import authn_session_service
 from byceps.services.user.log import user_log_service
 from byceps.util import upload
 from byceps.util.image.dimensions import determine_dimensions, Dimensions
@@ -75,6 +76,8 @@ def update_avatar_image(
 
     db.session.commit()
 
+    authn_session_service.evict_authenticated_user(user.id)
+
     return Ok((avatar, event))
 
 
@@ -105,6 +108,8 @@ def remove_avatar_image(
 
     db.session.commit()
 
+    authn_session_service.evict_authenticated_user(user.id)
+
     return event
 
 
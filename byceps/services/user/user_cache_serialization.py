@@ -0,0 +1,38 @@
+"""
+byceps.services.user.user_cache_serialization
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Serialization of users for caches that store them as JSON.
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from typing import Any
+from uuid import UUID
+
+from .models import User, UserID
+
+
+def serialize_user(user: User) -> dict[str, str | bool | None]:
+    """Serialize the user to a JSON-compatible dictionary."""
+    return {
+        'id': str(user.id),
+        'screen_name': user.screen_name,
+        'initialized': user.initialized,
+        'suspended': user.suspended,
+        'deleted': user.deleted,
+        'avatar_url': user.avatar_url,
+    }
+
+
+def deserialize_user(data: dict[str, Any]) -> User:
+    """Deserialize a user from a dictionary created by `serialize_user`."""
+    return User(
+        id=UserID(UUID(data['id'])),
+        screen_name=data['screen_name'],
+        initialized=data['initialized'],
+        suspended=data['suspended'],
+        deleted=data['deleted'],
+        avatar_url=data['avatar_url'],
+    )
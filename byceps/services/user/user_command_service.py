@@ -98,6 +98,8 @@ def suspend_account(
         event.user.id, suspended, db_log_entry
     )
 
+    authn_session_service.evict_authenticated_user(event.user.id)
+
     return event
 
 
@@ -137,6 +139,8 @@ def change_screen_name(
         event.user.id, event.new_screen_name, db_log_entry
     )
 
+    authn_session_service.evict_authenticated_user(event.user.id)
+
     return event
 
 
@@ -269,6 +273,8 @@ def delete_account(
 
     user_repository.delete_user(user, initiator, db_log_entry)
 
+    authz_service.invalidate_permissions_for_user(user.id)
+
     authn_session_service.delete_session_tokens_for_user(user.id)
     authn_password_service.delete_password_hash(user.id)
     verification_token_service.delete_tokens_for_user(user.id)
@@ -22,6 +22,7 @@ from . import (
     user_creation_domain_service,
     user_email_address_service,
     user_service,
+    user_stats_service,
 )
 from .dbmodels import DbUser, DbUserDetail
 from .errors import InvalidEmailAddressError, InvalidScreenNameError
@@ -108,6 +109,13 @@ def create_user(
     )
     db.session.add(db_detail)
 
+    user_stats_service.update_materialized_counts(
+        None,
+        user_stats_service.get_user_state(
+            db_user.initialized, db_user.suspended, db_user.deleted
+        ),
+    )
+
     try:
         db.session.commit()
     except Exception as exc:
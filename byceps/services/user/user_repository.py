@@ -10,12 +10,19 @@ from collections.abc import Sequence
 from datetime import date, datetime, timedelta
 
 from babel import Locale
-from sqlalchemy import select
-from sqlalchemy.sql import Select
-
-from byceps.database import db, paginate, Pagination
+from sqlalchemy import select, union
+from sqlalchemy.sql import CompoundSelect, Select
+
+from byceps.database import (
+    db,
+    KeysetPagination,
+    paginate,
+    paginate_by_keyset,
+    Pagination,
+)
 from byceps.services.user.log.dbmodels import DbUserLogEntry
 
+from . import user_stats_service
 from .dbmodels import DbUser, DbUserAvatar, DbUserDetail
 from .models import (
     User,
@@ -23,6 +30,7 @@ from .models import (
     UserFilter,
     UserForAdmin,
     UserForAdminDetail,
+    UserState,
     USER_DELETED_AVATAR_URL_PATH,
     USER_FALLBACK_AVATAR_URL_PATH,
 )
@@ -32,9 +40,14 @@ def update_initialized_flag(
     user_id: UserID, initialized: bool, db_log_entry: DbUserLogEntry
 ) -> None:
     db_user = get_db_user(user_id)
+    old_state = _get_state(db_user)
 
     db_user.initialized = initialized
 
+    user_stats_service.update_materialized_counts(
+        old_state, _get_state(db_user)
+    )
+
     db.session.add(db_log_entry)
 
     db.session.commit()
@@ -44,9 +57,14 @@ def update_suspended_flag(
     user_id: UserID, suspended: bool, db_log_entry: DbUserLogEntry
 ) -> None:
     db_user = get_db_user(user_id)
+    old_state = _get_state(db_user)
 
     db_user.suspended = suspended
 
+    user_stats_service.update_materialized_counts(
+        old_state, _get_state(db_user)
+    )
+
     db.session.add(db_log_entry)
 
     db.session.commit()
@@ -145,9 +163,14 @@ def delete_user(
 ) -> None:
     """Remove personal details from and mark user as deleted."""
     db_user = get_db_user(user.id)
+    old_state = _get_state(db_user)
 
     db_user.deleted = True
 
+    user_stats_service.update_materialized_counts(
+        old_state, _get_state(db_user)
+    )
+
     _anonymize_user(db_user)
 
     db.session.add(db_log_entry)
@@ -155,6 +178,12 @@ def delete_user(
     db.session.commit()
 
 
+def _get_state(db_user: DbUser) -> UserState:
+    return user_stats_service.get_user_state(
+        db_user.initialized, db_user.suspended, db_user.deleted
+    )
+
+
 def _anonymize_user(db_user: DbUser) -> None:
     """Remove user details from the account."""
     db_user.screen_name = None
@@ -611,6 +640,132 @@ def get_users_paginated(
     )
 
 
+def get_users_paginated_by_keyset(
+    cursor: str | None,
+    per_page: int,
+    *,
+    search_term: str | None = None,
+    user_filter: UserFilter | None = None,
+) -> KeysetPagination:
+    """Return the users to show on the page identified by the cursor,
+    optionally filtered by search term or flags.
+
+    The total number of users is estimated unless filtered, as the
+    estimate for a filtered selection can be far off.
+    """
+    stmt = select(DbUser).options(
+        db.joinedload(DbUser.detail).load_only(
+            DbUserDetail.first_name, DbUserDetail.last_name
+        ),
+        db.joinedload(DbUser.avatar),
+    )
+
+    stmt = _filter_users(stmt, user_filter)
+
+    if search_term:
+        stmt = _filter_by_search_term(stmt, search_term)
+
+    filtered = bool(search_term) or user_filter not in {None, UserFilter.none}
+
+    return paginate_by_keyset(
+        stmt,
+        [DbUser.created_at, DbUser.id],
+        cursor,
+        per_page,
+        item_mapper=_db_entity_to_user_for_admin,
+        estimate_total=not filtered,
+    )
+
+
+def search_users(
+    search_term: str,
+    *,
+    user_filter: UserFilter | None = None,
+    limit: int,
+) -> list[UserForAdmin]:
+    """Return the users that match the search term, most similar first.
+
+    If the search term is the email address or screen name of a user
+    (ignoring case), return only that user.
+    """
+    search_term = search_term.strip()
+    if not search_term:
+        return []
+
+    stmt = select(DbUser).options(
+        db.joinedload(DbUser.detail).load_only(
+            DbUserDetail.first_name, DbUserDetail.last_name
+        ),
+        db.joinedload(DbUser.avatar),
+    )
+
+    stmt = _filter_users(stmt, user_filter)
+
+    exact_match = (
+        db.session.scalars(
+            stmt.filter(
+                db.or_(
+                    db.func.lower(DbUser.email_address) == search_term.lower(),
+                    db.func.lower(DbUser.screen_name) == search_term.lower(),
+                )
+            ).limit(1)
+        )
+        .unique()
+        .one_or_none()
+    )
+
+    if exact_match is not None:
+        return [_db_entity_to_user_for_admin(exact_match)]
+
+    similarity = db.func.greatest(
+        db.func.similarity(DbUser.screen_name, search_term),
+        db.func.similarity(DbUser.email_address, search_term),
+        db.func.similarity(
+            db.func.concat_ws(
+                ' ', DbUserDetail.first_name, DbUserDetail.last_name
+            ),
+            search_term,
+        ),
+    )
+
+    stmt = (
+        _filter_by_search_term(stmt, search_term)
+        .join(DbUserDetail)
+        .order_by(similarity.desc(), DbUser.created_at.desc())
+        .limit(limit)
+    )
+
+    db_users = db.session.scalars(stmt).unique().all()
+
+    return [_db_entity_to_user_for_admin(db_user) for db_user in db_users]
+
+
+def get_users_by_screen_name_prefix(prefix: str, *, limit: int) -> list[User]:
+    """Return the non-deleted users whose screen names start with the
+    prefix (ignoring case), in alphabetical order.
+    """
+    if not prefix:
+        return []
+
+    pattern = _escape_like_pattern(prefix.lower()) + '%'
+
+    stmt = (
+        _get_user_stmt(include_avatar=True)
+        .filter(db.func.lower(DbUser.screen_name).like(pattern, escape='\\'))
+        .filter(DbUser.deleted == False)  # noqa: E712
+        .order_by(db.func.lower(DbUser.screen_name))
+        .limit(limit)
+    )
+
+    user_rows = db.session.execute(stmt).tuples().all()
+
+    return [_user_row_to_dto(user_row) for user_row in user_rows]
+
+
+def _escape_like_pattern(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
 def _filter_users(
     stmt: Select, user_filter: UserFilter | None = None
 ) -> Select:
@@ -636,18 +791,33 @@ def _filter_users(
 
 
 def _filter_by_search_term(stmt: Select, search_term: str) -> Select:
-    terms = search_term.split(' ')
-    clauses = map(_generate_search_clauses_for_term, terms)
+    for term in search_term.split():
+        stmt = stmt.filter(DbUser.id.in_(_select_user_ids_matching_term(term)))
+
+    return stmt
 
-    return stmt.join(DbUserDetail).filter(db.and_(*clauses))
 
+def _select_user_ids_matching_term(term: str) -> CompoundSelect:
+    """Select the IDs of the users whose email address, screen name,
+    first name, or last name contains the term (ignoring case).
 
-def _generate_search_clauses_for_term(search_term: str) -> Select:
-    ilike_pattern = f'%{search_term}%'
+    Each part of the union filters a single table, so the trigram
+    indexes on its columns can be used. An `OR` across the users table
+    and the joined user details table would rule them out.
+    """
+    ilike_pattern = f'%{term}%'
 
-    return db.or_(
-        DbUser.email_address.ilike(ilike_pattern),
-        DbUser.screen_name.ilike(ilike_pattern),
-        DbUserDetail.first_name.ilike(ilike_pattern),
-        DbUserDetail.last_name.ilike(ilike_pattern),
+    return union(
+        select(DbUser.id).filter(
+            db.or_(
+                DbUser.email_address.ilike(ilike_pattern),
+                DbUser.screen_name.ilike(ilike_pattern),
+            )
+        ),
+        select(DbUserDetail.user_id).filter(
+            db.or_(
+                DbUserDetail.first_name.ilike(ilike_pattern),
+                DbUserDetail.last_name.ilike(ilike_pattern),
+            )
+        ),
     )
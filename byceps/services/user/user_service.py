@@ -10,7 +10,7 @@ from datetime import timedelta
 
 from babel import Locale
 
-from byceps.database import Pagination
+from byceps.database import KeysetPagination, Pagination
 
 from . import user_repository
 from .dbmodels import DbUser
@@ -308,3 +308,43 @@ def get_users_paginated(
     return user_repository.get_users_paginated(
         page, per_page, search_term=search_term, user_filter=user_filter
     )
+
+
+def get_users_paginated_by_keyset(
+    cursor: str | None,
+    per_page: int,
+    *,
+    search_term: str | None = None,
+    user_filter: UserFilter | None = None,
+) -> KeysetPagination:
+    """Return the users to show on the page identified by the cursor,
+    optionally filtered by search term or flags.
+
+    The total number of users is estimated unless filtered.
+    """
+    return user_repository.get_users_paginated_by_keyset(
+        cursor, per_page, search_term=search_term, user_filter=user_filter
+    )
+
+
+def search_users(
+    search_term: str,
+    *,
+    user_filter: UserFilter | None = None,
+    limit: int,
+) -> list[UserForAdmin]:
+    """Return the users that match the search term, most similar first.
+
+    If the search term is the email address or screen name of a user
+    (ignoring case), return only that user.
+    """
+    return user_repository.search_users(
+        search_term, user_filter=user_filter, limit=limit
+    )
+
+
+def get_users_by_screen_name_prefix(prefix: str, *, limit: int) -> list[User]:
+    """Return the non-deleted users whose screen names start with the
+    prefix (ignoring case), in alphabetical order.
+    """
+    return user_repository.get_users_by_screen_name_prefix(prefix, limit=limit)
@@ -8,11 +8,13 @@ byceps.services.user.user_stats_service
 
 from datetime import datetime, timedelta
 
-from sqlalchemy import select
+from sqlalchemy import select, text, update
+from sqlalchemy.sql.elements import ColumnElement
 
-from byceps.database import db
+from byceps.database import db, execute_upsert
 
-from .dbmodels import DbUser
+from .dbmodels import DbUser, DbUserStateCount
+from .models import UserState, UserStateCounts
 
 
 def count_users() -> int:
@@ -86,3 +88,144 @@ def count_deleted_users() -> int:
         )
         or 0
     )
+
+
+def count_users_by_state() -> UserStateCounts:
+    """Return the number of user accounts in each state.
+
+    Read the materialized counts if they have been initialized.
+    Otherwise count all accounts in a single pass.
+    """
+    counts_by_state = _get_materialized_counts()
+    if counts_by_state is None:
+        counts_by_state = _count_users_by_state()
+
+    return _to_state_counts(counts_by_state)
+
+
+def _count_users_by_state() -> dict[UserState, int]:
+    states = list(UserState)
+
+    row = db.session.execute(
+        select(
+            *[
+                db.func.count(DbUser.id).filter(_get_state_clause(state))
+                for state in states
+            ]
+        )
+    ).one()
+
+    return dict(zip(states, row, strict=True))
+
+
+def _get_state_clause(state: UserState) -> ColumnElement[bool]:
+    match state:
+        case UserState.active:
+            return db.and_(
+                DbUser.initialized,
+                db.not_(DbUser.suspended),
+                db.not_(DbUser.deleted),
+            )
+        case UserState.uninitialized:
+            return db.and_(
+                db.not_(DbUser.initialized),
+                db.not_(DbUser.suspended),
+                db.not_(DbUser.deleted),
+            )
+        case UserState.suspended:
+            return db.and_(DbUser.suspended, db.not_(DbUser.deleted))
+        case UserState.deleted:
+            return DbUser.deleted
+
+
+def _get_materialized_counts() -> dict[UserState, int] | None:
+    rows = db.session.execute(
+        select(DbUserStateCount.state, DbUserStateCount.count)
+    ).all()
+
+    counts_by_state = {
+        UserState[state]: count
+        for state, count in rows
+        if state in UserState.__members__
+    }
+
+    if counts_by_state.keys() != set(UserState):
+        # not (fully) initialized
+        return None
+
+    return counts_by_state
+
+
+def _to_state_counts(counts_by_state: dict[UserState, int]) -> UserStateCounts:
+    return UserStateCounts(
+        active=counts_by_state[UserState.active],
+        uninitialized=counts_by_state[UserState.uninitialized],
+        suspended=counts_by_state[UserState.suspended],
+        deleted=counts_by_state[UserState.deleted],
+    )
+
+
+def get_user_state(
+    initialized: bool, suspended: bool, deleted: bool
+) -> UserState:
+    """Return the state of a user account with those flags."""
+    if deleted:
+        return UserState.deleted
+    elif suspended:
+        return UserState.suspended
+    elif not initialized:
+        return UserState.uninitialized
+    else:
+        return UserState.active
+
+
+def update_materialized_counts(
+    old_state: UserState | None, new_state: UserState
+) -> None:
+    """Reflect that a user account changed from the old to the new state
+    (or has been created, if there is no old state) in the materialized
+    counts.
+
+    Does not commit, so it can be part of the transaction that changes
+    the account.
+
+    Has no effect if the materialized counts have not been initialized.
+    """
+    if old_state == new_state:
+        return
+
+    if old_state is not None:
+        _add_to_materialized_count(old_state, -1)
+
+    _add_to_materialized_count(new_state, 1)
+
+
+def _add_to_materialized_count(state: UserState, delta: int) -> None:
+    db.session.execute(
+        update(DbUserStateCount)
+        .filter_by(state=state.name)
+        .values(count=DbUserStateCount.count + delta)
+    )
+
+
+def recount_materialized_counts() -> UserStateCounts:
+    """Count all user accounts by state, and store the results as the
+    materialized counts.
+
+    Initializes the materialized counts, or repairs them in case they
+    have drifted.
+    """
+    # Block changes to the counts until the recounted ones are stored.
+    db.session.execute(
+        text('LOCK TABLE user_state_counts IN SHARE ROW EXCLUSIVE MODE')
+    )
+
+    counts_by_state = _count_users_by_state()
+
+    table = DbUserStateCount.__table__
+    for state, count in counts_by_state.items():
+        execute_upsert(table, {'state': state.name}, {'count': count})
+
+    db.session.commit()
+
+    return _to_state_counts(counts_by_state)
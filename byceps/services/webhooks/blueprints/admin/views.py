@@ -12,7 +12,7 @@ import json
 from flask import abort, request
 from flask_babel import gettext
 
-from byceps.announce.announce import assemble_announcement_request, call_webhook
+from byceps.announce.delivery import assemble_announcement_request, call_webhook
 from byceps.services.webhooks import webhook_service
 from byceps.services.webhooks.models import (
     get_outgoing_webhook_format_label,
@@ -11,7 +11,7 @@ import pkgutil
 
 from flask_babel import LazyString
 
-from byceps.services.authz import authz_service
+from byceps.services.authz import authz_cache, authz_service
 from byceps.services.authz.models import Permission, PermissionID
 from byceps.services.user.models import UserID
 
@@ -42,8 +42,13 @@ def register_permissions(
 
 
 def get_permissions_for_user(user_id: UserID) -> frozenset[str]:
-    """Return the registered permissions this user has been granted."""
-    user_permission_ids = authz_service.get_permission_ids_for_user(user_id)
+    """Return the registered permissions this user has been granted.
+
+    Permissions are served from the cache as long as they are up to date.
+    """
+    user_permission_ids = authz_cache.get_permission_ids_for_user(
+        user_id, authz_service.get_permission_ids_for_user
+    )
 
     registered_user_permission_ids = (
         permission_registry.select_registered_permission_ids(
@@ -2,46 +2,89 @@
 byceps.util.export
 ~~~~~~~~~~~~~~~~~~
 
-Data export as CSV.
+Data export as CSV and JSON.
+
+Rows are serialized one at a time, so that an export can be streamed
+without holding the whole document in memory.
 
 :Copyright: 2014-2026 Jochen Kupperschmidt
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from collections.abc import Iterator, Sequence
+from collections.abc import Iterable, Iterator, Sequence
 import csv
 import io
+import json
+from typing import Any
 
 
 def serialize_dicts_to_csv(
     field_names: Sequence[str],
-    rows: Sequence[dict[str, str]],
+    rows: Iterable[dict[str, str]],
     *,
     delimiter=',',
 ) -> Iterator[str]:
     """Serialize the rows (must be dictionary objects) to CSV."""
-    with io.StringIO(newline='') as f:
-        writer = csv.DictWriter(
-            f, field_names, dialect=csv.excel, delimiter=delimiter
-        )
+    buffer = _LineBuffer()
+    writer = csv.DictWriter(
+        buffer, field_names, dialect=csv.excel, delimiter=delimiter
+    )
 
-        writer.writeheader()
-        writer.writerows(rows)
+    writer.writeheader()
+    yield buffer.pop()
 
-        f.seek(0)
-        yield from f
+    for row in rows:
+        writer.writerow(row)
+        yield buffer.pop()
 
 
 def serialize_tuples_to_csv(
-    rows: Sequence[tuple[str, ...]],
+    rows: Iterable[tuple[str, ...]],
     *,
     delimiter=',',
 ) -> Iterator[str]:
     """Serialize the rows (must be tuples) to CSV."""
-    with io.StringIO(newline='') as f:
-        writer = csv.writer(f, delimiter=delimiter)
+    buffer = _LineBuffer()
+    writer = csv.writer(buffer, delimiter=delimiter)
+
+    for row in rows:
+        writer.writerow(row)
+        yield buffer.pop()
+
+
+def serialize_dicts_to_json_array(
+    rows: Iterable[dict[str, Any]],
+) -> Iterator[str]:
+    """Serialize the rows (must be dictionary objects) to a JSON array."""
+    yield '['
+
+    separator = ''
+    for row in rows:
+        yield separator + json.dumps(row)
+        separator = ', '
+
+    yield ']'
+
+
+def serialize_dicts_to_ndjson(rows: Iterable[dict[str, Any]]) -> Iterator[str]:
+    """Serialize the rows (must be dictionary objects) to newline-delimited
+    JSON, i.e. one JSON object per line.
+    """
+    for row in rows:
+        yield json.dumps(row) + '\n'
+
+
+class _LineBuffer(io.StringIO):
+    """A buffer for the CSV writer to write a row to, to be taken out
+    right after.
+    """
 
-        writer.writerows(rows)
+    def __init__(self) -> None:
+        super().__init__(newline='')
 
-        f.seek(0)
-        yield from f
+    def pop(self) -> str:
+        """Return the buffered text, and empty the buffer."""
+        text = self.getvalue()
+        self.seek(0)
+        self.truncate()
+        return text
@@ -0,0 +1,107 @@
+"""
+byceps.util.fragment_cache
+~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Cache for rendered fragments (or whole pages) of sites, backed by Redis.
+
+Each fragment depends on one or more named dependencies (e.g. "news").
+Every dependency has a version, which is bumped to invalidate all
+fragments that depend on it. An entry is stamped with the versions of
+its dependencies that were current *before* it was rendered.
+
+A lookup fetches the entry and the current versions of its dependencies
+with a single `MGET`. An entry whose stamp does not match the current
+versions is outdated and gets replaced.
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from collections.abc import Callable, Iterable
+from datetime import timedelta
+import json
+
+from redis.exceptions import RedisError
+import structlog
+
+from byceps.byceps_app import get_current_byceps_app
+
+
+log = structlog.get_logger()
+
+
+KEY_PREFIX = 'fragment_cache'
+
+
+def get_or_render(
+    key: str,
+    render: Callable[[], str],
+    *,
+    ttl: timedelta,
+    depends_on: Iterable[str] = (),
+) -> str:
+    """Return the fragment from the cache, if available and up to date.
+
+    Otherwise call `render` to obtain it and put it into the cache.
+
+    The time to live limits how long the fragment is served if a change
+    affecting it does not invalidate any of its dependencies (e.g. news
+    items that are published at a later point in time).
+    """
+    redis_client = get_current_byceps_app().redis_client
+
+    dependencies = sorted(set(depends_on))
+    entry_key = _get_entry_key(key)
+    version_keys = [_get_version_key(dep) for dep in dependencies]
+
+    try:
+        entry_data, *versions = redis_client.mget(entry_key, *version_keys)
+    except RedisError as exc:
+        log.warning('Reading from fragment cache failed', exc_info=exc)
+        return render()
+
+    stamp = [_parse_version(version) for version in versions]
+
+    if entry_data is not None:
+        entry = json.loads(entry_data)
+        if entry['stamp'] == stamp:
+            return entry['value']
+
+    value = render()
+
+    entry_data = json.dumps({'stamp': stamp, 'value': value})
+
+    try:
+        redis_client.set(entry_key, entry_data, ex=ttl)
+    except RedisError as exc:
+        log.warning('Writing to fragment cache failed', exc_info=exc)
+
+    return value
+
+
+def invalidate(*dependencies: str) -> None:
+    """Invalidate all fragments that depend on any of the dependencies."""
+    if not dependencies:
+        return
+
+    redis_client = get_current_byceps_app().redis_client
+
+    try:
+        with redis_client.pipeline() as pipeline:
+            for dependency in dependencies:
+                pipeline.incr(_get_version_key(dependency))
+            pipeline.execute()
+    except RedisError as exc:
+        log.warning('Invalidating fragment cache failed', exc_info=exc)
+
+
+def _get_entry_key(key: str) -> str:
+    return f'{KEY_PREFIX}:entries:{key}'
+
+
+def _get_version_key(dependency: str) -> str:
+    return f'{KEY_PREFIX}:versions:{dependency}'
+
+
+def _parse_version(value: bytes | None) -> int:
+    return int(value) if value is not None else 0
@@ -0,0 +1,45 @@
+"""
+byceps.util.fragment_cache_invalidation
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Invalidate cached fragments when the data they show changes.
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.services.news.signals import item_published
+from byceps.services.snippet.signals import (
+    snippet_created,
+    snippet_deleted,
+    snippet_updated,
+)
+from byceps.services.ticketing.signals import tickets_sold
+
+from . import fragment_cache
+
+
+NEWS = 'news'
+SNIPPETS = 'snippets'
+TICKETS = 'tickets'
+
+
+def enable_fragment_cache_invalidation() -> None:
+    item_published.connect(_invalidate_news)
+
+    for signal in snippet_created, snippet_deleted, snippet_updated:
+        signal.connect(_invalidate_snippets)
+
+    tickets_sold.connect(_invalidate_tickets)
+
+
+def _invalidate_news(sender, **kwargs) -> None:
+    fragment_cache.invalidate(NEWS)
+
+
+def _invalidate_snippets(sender, **kwargs) -> None:
+    fragment_cache.invalidate(SNIPPETS)
+
+
+def _invalidate_tickets(sender, **kwargs) -> None:
+    fragment_cache.invalidate(TICKETS)
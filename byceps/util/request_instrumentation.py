@@ -0,0 +1,245 @@
+"""
+byceps.util.request_instrumentation
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Measure, per request, how many SQL statements are executed and how
+long they take, how long rendering templates takes, and how many round
+trips to Redis are made. The measurements are recorded per endpoint as
+metrics.
+
+In debug mode, SQL statements that are executed repeatedly during a
+single request are logged, as that hints at an N+1 query pattern (e.g.
+a relationship being lazy-loaded for each object in a loop).
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from collections import Counter
+from dataclasses import dataclass, field
+import re
+from time import perf_counter
+from typing import Any
+
+from flask import (
+    before_render_template,
+    current_app,
+    g,
+    has_app_context,
+    request,
+    template_rendered,
+)
+from redis import Redis, RedisError
+from redis.client import Pipeline
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+import structlog
+
+from byceps.byceps_app import BycepsApp
+from byceps.services.metrics import request_metrics_service
+
+
+log = structlog.get_logger()
+
+
+# A statement executed at least this often during a single request is
+# reported (in debug mode).
+REPEATED_STATEMENT_THRESHOLD = 5
+
+_STATS_KEY = 'request_instrumentation_stats'
+
+_QUERY_STARTED_AT_KEY = 'request_instrumentation_query_started_at'
+
+_PARAMETER_OR_LITERAL_PATTERN = re.compile(
+    r"%\(\w+\)s|'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b"
+)
+_PARAMETER_LIST_PATTERN = re.compile(r'\?(?:\s*,\s*\?)+')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+@dataclass(kw_only=True, slots=True)
+class RequestStats:
+    started_at: float
+    sql_statement_count: int = 0
+    sql_duration: float = 0.0
+    template_render_duration: float = 0.0
+    template_render_started_at: list[float] = field(default_factory=list)
+    redis_round_trip_count: int = 0
+    # Only collected in debug mode.
+    statement_fingerprints: Counter[str] | None = None
+
+
+def enable_request_instrumentation(app: BycepsApp) -> None:
+    """Measure the requests handled by the application."""
+    app.before_request(_start_measuring)
+    app.teardown_request(_stop_measuring)
+
+    before_render_template.connect(_on_before_render_template, app)
+    template_rendered.connect(_on_template_rendered, app)
+
+    # The listeners apply to all engines, so register them only once
+    # even if multiple applications are instrumented.
+    if not event.contains(
+        Engine, 'before_cursor_execute', _on_before_cursor_execute
+    ):
+        event.listen(Engine, 'before_cursor_execute', _on_before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', _on_after_cursor_execute)
+
+
+class InstrumentedRedis(Redis):
+    """A Redis client that counts round trips made during requests."""
+
+    def execute_command(self, *args, **options):
+        _count_redis_round_trip()
+        return super().execute_command(*args, **options)
+
+    def pipeline(self, transaction=True, shard_hint=None) -> Pipeline:
+        return InstrumentedPipeline(
+            self.connection_pool,
+            self.response_callbacks,
+            transaction,
+            shard_hint,
+        )
+
+
+class InstrumentedPipeline(Pipeline):
+    """A Redis pipeline that counts round trips made during requests."""
+
+    def execute(self, raise_on_error: bool = True) -> list[Any]:
+        if self.command_stack:
+            _count_redis_round_trip()
+        return super().execute(raise_on_error)
+
+
+def _start_measuring() -> None:
+    stats = RequestStats(started_at=perf_counter())
+    if current_app.debug:
+        stats.statement_fingerprints = Counter()
+
+    setattr(g, _STATS_KEY, stats)
+
+
+def _stop_measuring(exc: BaseException | None) -> None:
+    stats = g.pop(_STATS_KEY, None)
+    if stats is None:
+        return
+
+    endpoint = request.endpoint
+    if endpoint is None:
+        # No URL rule matched.
+        return
+
+    if stats.statement_fingerprints is not None:
+        _log_repeated_statements(endpoint, stats.statement_fingerprints)
+
+    try:
+        request_metrics_service.record_request(
+            endpoint,
+            duration=perf_counter() - stats.started_at,
+            sql_statement_count=stats.sql_statement_count,
+            sql_duration=stats.sql_duration,
+            template_render_duration=stats.template_render_duration,
+            redis_round_trip_count=stats.redis_round_trip_count,
+        )
+    except RedisError as e:
+        log.warning(
+            'Could not record request metrics', endpoint=endpoint, error=e
+        )
+
+
+def _log_repeated_statements(
+    endpoint: str, statement_fingerprints: Counter[str]
+) -> None:
+    for fingerprint, count in statement_fingerprints.most_common():
+        if count < REPEATED_STATEMENT_THRESHOLD:
+            break
+
+        log.warning(
+            'SQL statement executed repeatedly during request, '
+            'possibly an N+1 query pattern',
+            endpoint=endpoint,
+            count=count,
+            statement=fingerprint,
+        )
+
+
+def _get_current_stats() -> RequestStats | None:
+    if not has_app_context():
+        return None
+
+    return g.get(_STATS_KEY)
+
+
+# SQL statements
+
+
+def _on_before_cursor_execute(
+    conn, cursor, statement, parameters, context, executemany
+) -> None:
+    if _get_current_stats() is None:
+        return
+
+    conn.info.setdefault(_QUERY_STARTED_AT_KEY, []).append(perf_counter())
+
+
+def _on_after_cursor_execute(
+    conn, cursor, statement, parameters, context, executemany
+) -> None:
+    stats = _get_current_stats()
+    if stats is None:
+        return
+
+    started_at_stack = conn.info.get(_QUERY_STARTED_AT_KEY)
+    if not started_at_stack:
+        # Execution started outside of the request.
+        return
+
+    stats.sql_statement_count += 1
+    stats.sql_duration += perf_counter() - started_at_stack.pop()
+
+    if stats.statement_fingerprints is not None:
+        stats.statement_fingerprints[_get_fingerprint(statement)] += 1
+
+
+def _get_fingerprint(statement: str) -> str:
+    """Normalize the statement so that executions that only differ in
+    parameter values (or in the number of values in a list) match.
+    """
+    fingerprint = _PARAMETER_OR_LITERAL_PATTERN.sub('?', statement)
+    fingerprint = _PARAMETER_LIST_PATTERN.sub('?', fingerprint)
+    return _WHITESPACE_PATTERN.sub(' ', fingerprint).strip()
+
+
+# templates
+
+
+def _on_before_render_template(sender, template, context, **extra) -> None:
+    stats = _get_current_stats()
+    if stats is None:
+        return
+
+    stats.template_render_started_at.append(perf_counter())
+
+
+def _on_template_rendered(sender, template, context, **extra) -> None:
+    stats = _get_current_stats()
+    if stats is None or not stats.template_render_started_at:
+        return
+
+    started_at = stats.template_render_started_at.pop()
+
+    # Templates rendered while rendering another template are already
+    # accounted for by the outer one.
+    if not stats.template_render_started_at:
+        stats.template_render_duration += perf_counter() - started_at
+
+
+# Redis
+
+
+def _count_redis_round_trip() -> None:
+    stats = _get_current_stats()
+    if stats is None:
+        return
+
+    stats.redis_round_trip_count += 1
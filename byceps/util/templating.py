@@ -8,7 +8,11 @@ Templating utilities
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from collections import OrderedDict
+from collections.abc import Hashable
+from hashlib import sha256
 from pathlib import Path
+from threading import Lock
 from typing import Any
 
 from jinja2 import (
@@ -18,6 +22,7 @@ from jinja2 import (
     FunctionLoader,
     Template,
 )
+from jinja2.meta import find_undeclared_variables
 from jinja2.sandbox import ImmutableSandboxedEnvironment
 
 from byceps.services.site.models import SiteID
@@ -26,16 +31,109 @@ from byceps.services.site.models import SiteID
 SITES_PATH = Path('sites')
 
 
+# The maximum number of compiled templates to keep per process.
+TEMPLATE_CACHE_MAX_SIZE = 512
+
+# The maximum number of sandboxed environments (one per set of globals)
+# to keep per process.
+ENVIRONMENT_CACHE_MAX_SIZE = 32
+
+
+_GlobalsKey = frozenset[tuple[str, Hashable]]
+
+_cache_lock = Lock()
+_environments: OrderedDict[_GlobalsKey, Environment] = OrderedDict()
+_templates: OrderedDict[tuple[_GlobalsKey, bytes], Template] = OrderedDict()
+
+
 def load_template(
     source: str, *, template_globals: dict[str, Any] | None = None
 ) -> Template:
-    """Load a template from source, using the sandboxed environment."""
+    """Load a template from source, using the sandboxed environment.
+
+    Compiled templates are cached (least recently used ones are evicted
+    first), so that the same source with the same globals is parsed and
+    compiled only once.
+    """
+    globals_key = _get_globals_key(template_globals)
+    if globals_key is None:
+        # Globals that cannot be part of a cache key.
+        env = _create_sandboxed_environment_with_globals(template_globals)
+        return env.from_string(source)
+
+    cache_key = (globals_key, sha256(source.encode('utf-8')).digest())
+
+    with _cache_lock:
+        template = _get_cached(_templates, cache_key)
+        if template is not None:
+            return template
+
+        env = _get_cached(_environments, globals_key)
+        if env is None:
+            env = _create_sandboxed_environment_with_globals(template_globals)
+            _put_cached(
+                _environments, globals_key, env, ENVIRONMENT_CACHE_MAX_SIZE
+            )
+
+    # Compile outside of the lock. Should the same source be compiled
+    # concurrently, the last result wins, which is harmless.
+    template = env.from_string(source)
+
+    with _cache_lock:
+        _put_cached(_templates, cache_key, template, TEMPLATE_CACHE_MAX_SIZE)
+
+    return template
+
+
+def refers_to_variables(source: str) -> bool:
+    """Return `True` if the template source refers to any variables
+    (including functions) that would have to be provided to render it.
+
+    Raise an exception if the source is syntactically invalid.
+    """
+    env = create_sandboxed_environment()
+    ast = env.parse(source)
+    return bool(find_undeclared_variables(ast))
+
+
+def _get_globals_key(
+    template_globals: dict[str, Any] | None,
+) -> _GlobalsKey | None:
+    if not template_globals:
+        return frozenset()
+
+    try:
+        return frozenset(template_globals.items())
+    except TypeError:
+        return None
+
+
+def _create_sandboxed_environment_with_globals(
+    template_globals: dict[str, Any] | None,
+) -> Environment:
     env = create_sandboxed_environment()
 
     if template_globals is not None:
         env.globals.update(template_globals)
 
-    return env.from_string(source)
+    return env
+
+
+def _get_cached(cache: OrderedDict, key: Hashable) -> Any | None:
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+
+def _put_cached(
+    cache: OrderedDict, key: Hashable, value: Any, max_size: int
+) -> None:
+    cache[key] = value
+    cache.move_to_end(key)
+
+    while len(cache) > max_size:
+        cache.popitem(last=False)
 
 
 def create_sandboxed_environment(
@@ -77,19 +77,11 @@ def _find_user() -> User | None:
     except ValueError:
         return None
 
-    user = user_service.find_active_user(user_id, include_avatar=True)
-
-    if user is None:
-        return None
-
-    # Validate auth token.
-    if (auth_token is None) or not authn_session_service.is_session_valid(
-        user.id, auth_token
-    ):
-        # Bad auth token, not logging in.
+    if auth_token is None:
+        # No auth token, not logging in.
         return None
 
-    return user
+    return authn_session_service.find_authenticated_user(user_id, auth_token)
 
 
 def _get_session_locale() -> Locale | None:
@@ -132,6 +132,22 @@ def textified(f):
     return wrapper
 
 
+def streamed_as(mimetype: str):
+    """Stream the chunks of text yielded by the decorated function, with
+    the given MIME type.
+    """
+
+    def decorator(f):
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            chunks = f(*args, **kwargs)
+            return Response(stream_with_context(chunks), mimetype=mimetype)
+
+        return wrapper
+
+    return decorator
+
+
 def respond_created(f):
     """Send a ``201 Created`` response.
 
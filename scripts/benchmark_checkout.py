@@ -0,0 +1,375 @@
+"""Load-test the shop checkout with concurrent orders.
+
+Seeds a brand, shop, order number sequence, storefront, a product with
+limited stock, and some orderers. Then places orders for that product
+from a pool of processes, as happens when ticket sales open.
+
+Reports throughput, latency percentiles, deadlocks, and oversells (i.e.
+more units sold than were in stock).
+
+Do not run this against a production database. Either point
+``BYCEPS_CONFIG_FILE`` to a configuration with a disposable database,
+or pass ``--start-database`` to run a throwaway PostgreSQL container
+(requires Docker) for the duration of the benchmark:
+
+.. code-block:: console
+
+    $ uv run ./scripts/benchmark_checkout.py --start-database --orders 2000 --stock 1500
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from decimal import Decimal
+from multiprocessing import Pool
+import socket
+from statistics import quantiles
+import subprocess
+from time import perf_counter, sleep
+
+import click
+from dotenv import load_dotenv
+from moneyed import EUR, Money
+from psycopg.errors import DeadlockDetected
+from secret_type import secret
+from sqlalchemy import func, select
+from sqlalchemy.exc import OperationalError
+
+from byceps.application import create_cli_app
+from byceps.byceps_app import BycepsApp
+from byceps.cli.commands.create_database_tables import (
+    create_database_extensions,
+    load_dbmodels,
+)
+from byceps.config.integration import (
+    read_configuration_from_file_given_in_env_var,
+)
+from byceps.config.models import BycepsConfig, DatabaseConfig, ShopConfig
+from byceps.database import db
+from byceps.services.brand import brand_service
+from byceps.services.brand.models import BrandID
+from byceps.services.shop.cart.models import Cart
+from byceps.services.shop.order import (
+    order_checkout_service,
+    order_sequence_service,
+)
+from byceps.services.shop.order.dbmodels.order import DbLineItem
+from byceps.services.shop.order.models.order import Orderer
+from byceps.services.shop.product import product_service
+from byceps.services.shop.product.models import (
+    ProductID,
+    ProductNumber,
+    ProductType,
+)
+from byceps.services.shop.shop import shop_service
+from byceps.services.shop.storefront import storefront_service
+from byceps.services.shop.storefront.models import StorefrontID
+from byceps.services.user import user_creation_service, user_service
+from byceps.services.user.models import UserID
+from byceps.util.uuid import generate_uuid4
+
+
+DATABASE_CONTAINER_IMAGE = 'postgres:17'
+DATABASE_CREDENTIAL = 'byceps'  # noqa: S105
+
+
+@dataclass(frozen=True, kw_only=True)
+class Fixture:
+    storefront_id: StorefrontID
+    product_id: ProductID
+    orderer_user_ids: list[UserID]
+
+
+@dataclass(frozen=True, kw_only=True)
+class CheckoutOutcome:
+    result: str
+    latency: float
+
+
+@click.command()
+@click.option('--orders', default=2000, help='number of checkouts')
+@click.option('--processes', default=16)
+@click.option('--stock', default=1500, help='available product quantity')
+@click.option('--quantity', default=1, help='product quantity per order')
+@click.option('--orderers', default=20)
+@click.option('--order-number-block-size', default=1)
+@click.option('--start-database', is_flag=True)
+def execute(
+    orders: int,
+    processes: int,
+    stock: int,
+    quantity: int,
+    orderers: int,
+    order_number_block_size: int,
+    start_database: bool,
+) -> None:
+    load_dotenv()
+    config = read_configuration_from_file_given_in_env_var()
+    config = replace(
+        config,
+        shop=ShopConfig(
+            order_number_block_size=order_number_block_size,
+            release_unused_order_numbers=False,
+        ),
+    )
+
+    benchmark_args = (orders, processes, stock, quantity, orderers)
+
+    if start_database:
+        with _run_database_container() as database_config:
+            config = replace(config, database=database_config)
+            _run_benchmark(config, *benchmark_args)
+    else:
+        _run_benchmark(config, *benchmark_args)
+
+
+def _run_benchmark(
+    config: BycepsConfig,
+    orders: int,
+    processes: int,
+    stock: int,
+    quantity: int,
+    orderers: int,
+) -> None:
+    app = create_cli_app(config)
+
+    with app.app_context():
+        click.secho('Seeding ...', fg='yellow')
+        fixture = _seed(stock, orderers)
+
+    args = [
+        (fixture, fixture.orderer_user_ids[i % orderers], quantity)
+        for i in range(orders)
+    ]
+
+    click.secho(
+        f'Placing {orders:d} orders from {processes:d} processes ...',
+        fg='yellow',
+    )
+
+    started_at = perf_counter()
+    with Pool(processes, initializer=_init_worker, initargs=(config,)) as pool:
+        outcomes = pool.starmap(_check_out, args)
+    duration = perf_counter() - started_at
+
+    with app.app_context():
+        sold_quantity = _count_sold_quantity(fixture.product_id)
+
+    _report(outcomes, duration, stock, sold_quantity)
+
+
+@contextmanager
+def _run_database_container() -> Iterator[DatabaseConfig]:
+    port = _find_free_port()
+
+    container_id = subprocess.check_output(  # noqa: S603
+        [  # noqa: S607
+            'docker',
+            'run',
+            '--detach',
+            '--rm',
+            '--publish',
+            f'127.0.0.1:{port}:5432',
+            '--env',
+            f'POSTGRES_USER={DATABASE_CREDENTIAL}',
+            '--env',
+            f'POSTGRES_PASSWORD={DATABASE_CREDENTIAL}',
+            DATABASE_CONTAINER_IMAGE,
+        ],
+        text=True,
+    ).strip()
+
+    try:
+        _wait_for_database(container_id)
+
+        yield DatabaseConfig(
+            host='127.0.0.1',
+            port=port,
+            username=DATABASE_CREDENTIAL,
+            password=DATABASE_CREDENTIAL,
+            database=DATABASE_CREDENTIAL,
+        )
+    finally:
+        subprocess.run(  # noqa: S603
+            ['docker', 'stop', container_id],  # noqa: S607
+            capture_output=True,
+            check=False,
+        )
+
+
+def _find_free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _wait_for_database(container_id: str) -> None:
+    for _ in range(60):
+        result = subprocess.run(  # noqa: S603
+            [  # noqa: S607
+                'docker',
+                'exec',
+                container_id,
+                'pg_isready',
+                '--host',
+                '127.0.0.1',
+                '--username',
+                DATABASE_CREDENTIAL,
+            ],
+            capture_output=True,
+            check=False,
+        )
+        if result.returncode == 0:
+            return
+        sleep(1)
+
+    raise click.ClickException('Database container did not become ready.')
+
+
+def _seed(stock: int, orderer_count: int) -> Fixture:
+    create_database_extensions()
+    load_dbmodels()
+    db.create_all()
+
+    token = generate_uuid4().hex[:8]
+
+    brand = brand_service.create_brand(BrandID(f'bench-{token}'), token)
+    shop = shop_service.create_shop(brand, EUR)
+
+    sequence = order_sequence_service.create_order_number_sequence(
+        shop.id, f'BENCH-{token}-'
+    ).unwrap()
+
+    storefront = storefront_service.create_storefront(
+        StorefrontID(f'bench-{token}'), shop.id, sequence.id, closed=False
+    )
+
+    product = product_service.create_product(
+        shop.id,
+        ProductNumber(f'BENCH-{token}-TICKET'),
+        ProductType.other,
+        'Benchmark Ticket',
+        Money('35.00', EUR),
+        Decimal('0.19'),
+        stock,
+        10,
+        False,
+    )
+
+    orderer_user_ids = []
+    for i in range(orderer_count):
+        user, _ = user_creation_service.create_user(
+            f'bench-{token}-{i}',
+            f'bench-{token}-{i}@users.test',
+            secret(generate_uuid4().hex),
+        ).unwrap()
+        orderer_user_ids.append(user.id)
+
+    return Fixture(
+        storefront_id=storefront.id,
+        product_id=product.id,
+        orderer_user_ids=orderer_user_ids,
+    )
+
+
+@dataclass(slots=True)
+class _WorkerState:
+    app: BycepsApp | None = None
+
+
+# The application of the current worker process
+_worker_state = _WorkerState()
+
+
+def _init_worker(config: BycepsConfig) -> None:
+    _worker_state.app = create_cli_app(config)
+
+
+def _check_out(
+    fixture: Fixture, orderer_user_id: UserID, quantity: int
+) -> CheckoutOutcome:
+    with _worker_state.app.app_context():
+        storefront = storefront_service.get_storefront(fixture.storefront_id)
+        product = product_service.get_product(fixture.product_id)
+        orderer = Orderer(
+            user=user_service.get_user(orderer_user_id),
+            company=None,
+            first_name='Bench',
+            last_name='Mark',
+            country='Germany',
+            postal_code='31337',
+            city='Atrocity',
+            street='Elite Street 1337',
+        )
+
+        cart = Cart(EUR)
+        cart.add_item(product, quantity)
+
+        started_at = perf_counter()
+        try:
+            result = order_checkout_service.place_order(
+                storefront, orderer, cart
+            )
+            outcome = 'placed' if result.is_ok() else 'rejected'
+        except OperationalError as exc:
+            db.session.rollback()
+            if isinstance(exc.orig, DeadlockDetected):
+                outcome = 'deadlock'
+            else:
+                outcome = 'error'
+        latency = perf_counter() - started_at
+
+        return CheckoutOutcome(result=outcome, latency=latency)
+
+
+def _count_sold_quantity(product_id: ProductID) -> int:
+    return (
+        db.session.scalar(
+            select(func.sum(DbLineItem.quantity)).filter_by(
+                product_id=product_id
+            )
+        )
+        or 0
+    )
+
+
+def _report(
+    outcomes: list[CheckoutOutcome],
+    duration: float,
+    stock: int,
+    sold_quantity: int,
+) -> None:
+    counts = Counter(outcome.result for outcome in outcomes)
+    latencies = [outcome.latency for outcome in outcomes]
+    oversold_quantity = max(sold_quantity - stock, 0)
+
+    click.secho(f'Duration:   {duration:.2f} s')
+    click.secho(f'Throughput: {len(outcomes) / duration:.1f} checkouts/s')
+
+    # Computing percentiles requires at least two data points.
+    if len(latencies) >= 2:
+        percentiles = quantiles(latencies, n=100)
+        click.secho(f'Latency:    p50 {percentiles[49] * 1000:.1f} ms')
+        click.secho(f'            p99 {percentiles[98] * 1000:.1f} ms')
+    click.secho(
+        f'Outcomes:   {counts["placed"]:d} placed, '
+        f'{counts["rejected"]:d} rejected, '
+        f'{counts["deadlock"]:d} deadlocks, '
+        f'{counts["error"]:d} other errors'
+    )
+    click.secho(f'Sold:       {sold_quantity:d} of {stock:d} in stock')
+
+    if oversold_quantity > 0:
+        click.secho(f'Oversold:   {oversold_quantity:d}', fg='red')
+    elif counts['deadlock']:
+        click.secho('Deadlocks, but no oversells.', fg='yellow')
+    else:
+        click.secho('No deadlocks, no oversells.', fg='green')
+
+
+if __name__ == '__main__':
+    execute()
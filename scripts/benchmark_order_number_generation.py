@@ -0,0 +1,103 @@
+"""Measure order number generation throughput under parallel load.
+
+Creates a temporary order number sequence for the shop, lets a number
+of processes draw order numbers from it concurrently, reports the
+throughput, and deletes the sequence afterwards.
+
+Compare different block sizes to see the effect of block reservation:
+
+.. code-block:: console
+
+    $ uv run ./scripts/benchmark_order_number_generation.py --shop-id myshop --block-size 1
+    $ uv run ./scripts/benchmark_order_number_generation.py --shop-id myshop --block-size 50
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from dataclasses import replace
+from multiprocessing import Pool
+from time import perf_counter
+
+import click
+from dotenv import load_dotenv
+
+from byceps.application import create_cli_app
+from byceps.config.integration import (
+    read_configuration_from_file_given_in_env_var,
+)
+from byceps.config.models import ShopConfig
+from byceps.services.shop.order import order_sequence_service
+from byceps.services.shop.order.models.number import OrderNumberSequenceID
+from byceps.util.uuid import generate_uuid4
+
+from _util import call_with_app_context
+
+
+@click.command()
+@click.option('--shop-id', required=True)
+@click.option('--processes', default=8)
+@click.option('--orders-per-process', default=500)
+@click.option('--block-size', default=1)
+def execute(
+    shop_id, processes: int, orders_per_process: int, block_size: int
+) -> None:
+    prefix = f'BENCH-{generate_uuid4().hex[:8]}-'
+    sequence = order_sequence_service.create_order_number_sequence(
+        shop_id, prefix
+    ).unwrap()
+
+    try:
+        args = [(sequence.id, orders_per_process, block_size)] * processes
+
+        started_at = perf_counter()
+        with Pool(processes) as pool:
+            generated_order_number_lists = pool.starmap(_generate, args)
+        duration = perf_counter() - started_at
+    finally:
+        order_sequence_service.delete_order_number_sequence(sequence.id)
+
+    order_numbers = [
+        order_number
+        for order_numbers in generated_order_number_lists
+        for order_number in order_numbers
+    ]
+    total = len(order_numbers)
+    duplicates = total - len(set(order_numbers))
+
+    click.secho(
+        f'{total:d} order numbers in {duration:.2f} s '
+        f'({total / duration:.0f} per second) '
+        f'with {processes:d} processes and block size {block_size:d}.',
+        fg='green',
+    )
+
+    if duplicates:
+        click.secho(f'{duplicates:d} duplicate order numbers!', fg='red')
+
+
+def _generate(
+    sequence_id: OrderNumberSequenceID, quantity: int, block_size: int
+) -> list[str]:
+    load_dotenv()
+    config = read_configuration_from_file_given_in_env_var()
+    config = replace(
+        config,
+        shop=ShopConfig(
+            order_number_block_size=block_size,
+            release_unused_order_numbers=False,
+        ),
+    )
+    app = create_cli_app(config)
+
+    with app.app_context():
+        return [
+            order_sequence_service.generate_order_number(
+                sequence_id, block_size=block_size
+            ).unwrap()
+            for _ in range(quantity)
+        ]
+
+
+if __name__ == '__main__':
+    call_with_app_context(execute)
@@ -0,0 +1,153 @@
+"""Measure how long it takes to find the page a posting is on in a large
+topic.
+
+Creates a temporary topic with the given number of postings in the
+category, looks up the page number of its latest posting repeatedly,
+compares the result and duration with scanning all of the topic's
+postings, and deletes the topic afterwards.
+
+.. code-block:: console
+
+    $ uv run ./scripts/benchmark_posting_page_number.py --category-id 7c0bdd4c-bd8c-4aa9-8a5d-45e80cae6c8d --creator-id 2d8cd8b9-46b9-46a8-8a6c-f3b4e1e1c0f2
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import datetime, timedelta
+from time import perf_counter
+from uuid import UUID
+
+import click
+from sqlalchemy import insert, select
+
+from byceps.database import db
+from byceps.services.board import (
+    board_aggregation_service,
+    board_category_query_service,
+    board_posting_query_service,
+    board_topic_command_service,
+)
+from byceps.services.board.dbmodels.posting import DbPosting
+from byceps.services.board.models import BoardCategoryID, PostingID, TopicID
+from byceps.services.user import user_service
+from byceps.services.user.models import UserID
+from byceps.util.uuid import generate_uuid7
+
+from _util import call_with_app_context
+
+
+INSERT_BATCH_SIZE = 5_000
+
+
+@click.command()
+@click.option('--category-id', required=True)
+@click.option('--creator-id', required=True)
+@click.option('--postings', 'posting_quantity', default=50_000)
+@click.option('--postings-per-page', default=15)
+@click.option('--lookups', default=100)
+def execute(
+    category_id,
+    creator_id,
+    posting_quantity: int,
+    postings_per_page: int,
+    lookups: int,
+) -> None:
+    category = board_category_query_service.find_category_by_id(
+        BoardCategoryID(UUID(category_id))
+    )
+    if category is None:
+        raise click.BadParameter(f'Unknown category ID "{category_id}".')
+
+    creator = user_service.get_user(UserID(UUID(creator_id)))
+
+    topic, _ = board_topic_command_service.create_topic(
+        category.id, creator, 'Benchmark', 'Benchmark'
+    )
+
+    try:
+        click.echo(f'Seeding topic with {posting_quantity:d} postings ... ')
+        _seed_postings(topic.id, creator.id, posting_quantity)
+
+        db_posting = _get_latest_posting(topic.id)
+
+        started_at = perf_counter()
+        for _ in range(lookups):
+            page = board_posting_query_service.calculate_posting_page_number(
+                db_posting, False, postings_per_page
+            )
+        duration = perf_counter() - started_at
+
+        started_at = perf_counter()
+        page_by_scan = _calculate_page_number_by_scan(
+            db_posting, postings_per_page
+        )
+        scan_duration = perf_counter() - started_at
+    finally:
+        board_topic_command_service.delete_topic(topic.id)
+        board_aggregation_service.reconcile_board(category.board_id)
+
+    click.secho(
+        f'Page {page:d}: {duration / lookups * 1000:.2f} ms per lookup '
+        f'(average of {lookups:d}).',
+        fg='green',
+    )
+    click.echo(
+        f'Page {page_by_scan:d}: {scan_duration * 1000:.2f} ms '
+        'by scanning all postings.'
+    )
+
+    if page != page_by_scan:
+        click.secho('Page numbers differ!', fg='red')
+
+
+def _seed_postings(
+    topic_id: TopicID, creator_id: UserID, quantity: int
+) -> None:
+    started_at = datetime.utcnow()
+
+    for offset in range(0, quantity, INSERT_BATCH_SIZE):
+        rows = [
+            {
+                'id': PostingID(generate_uuid7()),
+                'topic_id': topic_id,
+                'created_at': started_at + timedelta(seconds=i),
+                'creator_id': creator_id,
+                'body': f'Posting #{i:d}',
+                'edit_count': 0,
+                'hidden': False,
+            }
+            for i in range(offset, min(offset + INSERT_BATCH_SIZE, quantity))
+        ]
+        db.session.execute(insert(DbPosting), rows)
+
+    db.session.commit()
+
+
+def _get_latest_posting(topic_id: TopicID) -> DbPosting:
+    return db.session.scalars(
+        select(DbPosting)
+        .filter_by(topic_id=topic_id)
+        .order_by(DbPosting.created_at.desc())
+        .limit(1)
+    ).one()
+
+
+def _calculate_page_number_by_scan(
+    db_posting: DbPosting, postings_per_page: int
+) -> int:
+    """Find the page as done before, by loading all postings."""
+    db_topic_postings = db.session.scalars(
+        select(DbPosting)
+        .filter_by(topic_id=db_posting.topic_id)
+        .filter_by(hidden=False)
+        .order_by(DbPosting.created_at.asc())
+    ).all()
+
+    index = db_topic_postings.index(db_posting)
+
+    return divmod(index, postings_per_page)[0] + 1
+
+
+if __name__ == '__main__':
+    call_with_app_context(execute)
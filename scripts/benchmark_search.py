@@ -0,0 +1,165 @@
+"""Measure how long full-text searches take on a large corpus, compared
+with `ILIKE` filters.
+
+Seeds the search index with the given number of generated documents,
+searches them repeatedly via the search service and via `ILIKE` on the
+raw texts, and rolls everything back afterwards.
+
+.. code-block:: console
+
+    $ uv run ./scripts/benchmark_search.py --documents 100000 --term lanparty
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from random import Random
+from time import perf_counter
+
+import click
+from sqlalchemy import text
+
+from byceps.database import db
+from byceps.services.search import search_service
+from byceps.services.search.models import SearchDocumentType
+
+from _util import call_with_app_context
+
+
+INSERT_BATCH_SIZE = 5_000
+
+SCOPE = 'benchmark'
+
+WORDS = [
+    'beamer',
+    'bracket',
+    'cable',
+    'catering',
+    'checkin',
+    'console',
+    'keyboard',
+    'match',
+    'monitor',
+    'network',
+    'party',
+    'seat',
+    'server',
+    'switch',
+    'team',
+    'ticket',
+    'tournament',
+]
+
+WORDS_PER_DOCUMENT = 60
+
+
+@click.command()
+@click.option('--documents', 'document_quantity', default=100_000)
+@click.option('--term', 'search_term', default='lanparty')
+@click.option('--matches', 'match_quantity', default=100)
+@click.option('--lookups', default=20)
+def execute(
+    document_quantity: int, search_term: str, match_quantity: int, lookups: int
+) -> None:
+    try:
+        click.echo(f'Seeding corpus with {document_quantity:d} documents ...')
+        _seed_corpus(document_quantity, search_term, match_quantity)
+
+        started_at = perf_counter()
+        for _ in range(lookups):
+            results = search_service.search(
+                search_term,
+                SearchDocumentType.snippet,
+                scopes=[SCOPE],
+                limit=document_quantity,
+            )
+        duration = perf_counter() - started_at
+
+        started_at = perf_counter()
+        for _ in range(lookups):
+            ilike_match_count = _search_with_ilike(search_term)
+        ilike_duration = perf_counter() - started_at
+    finally:
+        # Nothing of this has been committed.
+        db.session.rollback()
+
+    click.secho(
+        f'{len(results):d} matches: {duration / lookups * 1000:.2f} ms '
+        f'per full-text search (average of {lookups:d}).',
+        fg='green',
+    )
+    click.echo(
+        f'{ilike_match_count:d} matches: '
+        f'{ilike_duration / lookups * 1000:.2f} ms per ILIKE search '
+        f'(average of {lookups:d}).'
+    )
+
+
+def _seed_corpus(quantity: int, search_term: str, match_quantity: int) -> None:
+    """Insert generated texts into a temporary table, and index them.
+
+    Every n-th text contains the search term.
+    """
+    db.session.execute(
+        text(
+            'CREATE TEMPORARY TABLE benchmark_search_corpus '
+            '(id text PRIMARY KEY, body text NOT NULL) ON COMMIT DROP'
+        )
+    )
+
+    # Generate the same corpus on every run.
+    random = Random(0)  # noqa: S311
+    match_interval = max(quantity // max(match_quantity, 1), 1)
+
+    for offset in range(0, quantity, INSERT_BATCH_SIZE):
+        rows = []
+        for i in range(offset, min(offset + INSERT_BATCH_SIZE, quantity)):
+            words = random.choices(WORDS, k=WORDS_PER_DOCUMENT)
+            if i % match_interval == 0:
+                words[random.randrange(len(words))] = search_term
+            rows.append({'id': str(i), 'body': ' '.join(words)})
+
+        db.session.execute(
+            text(
+                'INSERT INTO benchmark_search_corpus (id, body) '
+                'VALUES (:id, :body)'
+            ),
+            rows,
+        )
+
+    config = search_service.get_text_search_config('en')
+
+    db.session.execute(
+        text(
+            'INSERT INTO search_documents '
+            '(document_type, document_id, scope, text_search_config, title, '
+            'tsv, indexed_at) '
+            "SELECT :document_type, id, :scope, :config, '', "
+            "setweight(to_tsvector(CAST(:config AS regconfig), body), 'B'), "
+            'now() '
+            'FROM benchmark_search_corpus'
+        ),
+        {
+            'document_type': SearchDocumentType.snippet.name,
+            'scope': SCOPE,
+            'config': config,
+        },
+    )
+
+    db.session.execute(text('ANALYZE benchmark_search_corpus'))
+    db.session.execute(text('ANALYZE search_documents'))
+
+
+def _search_with_ilike(search_term: str) -> int:
+    """Search as done before, by scanning all texts."""
+    return db.session.scalar(
+        text(
+            'SELECT count(*) FROM benchmark_search_corpus '
+            'WHERE body ILIKE :pattern'
+        ),
+        {'pattern': f'%{search_term}%'},
+    )
+
+
+if __name__ == '__main__':
+    call_with_app_context(execute)
@@ -16,6 +16,10 @@ from byceps.services.authz.dbmodels import DbUserRole
 from byceps.services.board.dbmodels.category import (
     DbLastCategoryView as DbBoardLastCategoryView,
 )
+from byceps.services.board.dbmodels.read_watermark import (
+    DbBoardReadWatermark,
+    DbCategoryReadWatermark as DbBoardCategoryReadWatermark,
+)
 from byceps.services.board.dbmodels.topic import (
     DbLastTopicView as DbBoardLastTopicView,
 )
@@ -53,6 +57,11 @@ def execute(dry_run, user_ids) -> None:
     delete('authorization role assignments', delete_authz_user_roles)
     delete('board category view marks', delete_board_category_lastviews)
     delete('board topic view marks', delete_board_topic_lastviews)
+    delete('board read watermarks', delete_board_read_watermarks)
+    delete(
+        'board category read watermarks',
+        delete_board_category_read_watermarks,
+    )
     delete('consents', delete_consents)
     delete('newsletter subscriptions', delete_newsletter_subscriptions)
     delete(
@@ -115,6 +124,18 @@ def delete_board_topic_lastviews(user_ids: set[UserID]) -> int:
     return _execute_delete_for_users_query(DbBoardLastTopicView, user_ids)
 
 
+def delete_board_read_watermarks(user_ids: set[UserID]) -> int:
+    """Delete board read watermarks for the given users."""
+    return _execute_delete_for_users_query(DbBoardReadWatermark, user_ids)
+
+
+def delete_board_category_read_watermarks(user_ids: set[UserID]) -> int:
+    """Delete board category read watermarks for the given users."""
+    return _execute_delete_for_users_query(
+        DbBoardCategoryReadWatermark, user_ids
+    )
+
+
 def delete_consents(user_ids: set[UserID]) -> int:
     """Delete consents from the given users."""
     return _execute_delete_for_users_query(DbConsent, user_ids)
@@ -0,0 +1,34 @@
+"""Add all board postings, news items, pages and snippets to the search
+index.
+
+The index is maintained on every write, so this is needed only to fill
+it initially, or to repair it.
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import click
+
+from byceps.services.board import board_posting_command_service
+from byceps.services.news import news_item_service
+from byceps.services.page import page_service
+from byceps.services.snippet import snippet_service
+
+from _util import call_with_app_context
+
+
+@click.command()
+def execute() -> None:
+    for label, reindex in [
+        ('board postings', board_posting_command_service.reindex_all_postings),
+        ('news items', news_item_service.reindex_all_items),
+        ('pages', page_service.reindex_all_pages),
+        ('snippets', snippet_service.reindex_all_snippets),
+    ]:
+        count = reindex()
+        click.secho(f'Indexed {count:d} {label}.', fg='green')
+
+
+if __name__ == '__main__':
+    call_with_app_context(execute)
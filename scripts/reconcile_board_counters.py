@@ -0,0 +1,44 @@
+"""Recount the topics and postings of a board's categories and topics,
+and fix those counts (and latest posting fields) that have drifted.
+
+They are maintained incrementally on every write, so this is meant to be
+run periodically (e.g. daily via cron) as a safety net.
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import click
+
+from byceps.services.board import board_aggregation_service, board_service
+from byceps.services.board.models import Board, BoardID
+
+from _util import call_with_app_context
+
+
+def validate_board(ctx, param, board_id_value: str) -> Board:
+    board = board_service.find_board(BoardID(board_id_value))
+
+    if not board:
+        raise click.BadParameter(f'Unknown board ID "{board_id_value}".')
+
+    return board
+
+
+@click.command()
+@click.argument('board', metavar='BOARD_ID', callback=validate_board)
+def execute(board: Board) -> None:
+    fixed_count = board_aggregation_service.reconcile_board(board.id)
+
+    if fixed_count:
+        click.secho(
+            f'Fixed {fixed_count:d} drifted categories and topics '
+            f'in board "{board.id}".',
+            fg='yellow',
+        )
+    else:
+        click.secho(f'No drift found in board "{board.id}".', fg='green')
+
+
+if __name__ == '__main__':
+    call_with_app_context(execute)
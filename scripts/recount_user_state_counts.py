@@ -0,0 +1,34 @@
+"""Count user accounts by state, and store the results as the
+materialized counts that are read for metrics and the admin dashboard.
+
+Run this once to start maintaining the materialized counts. Afterwards,
+run it in case they have drifted (e.g. after manual changes to the
+database).
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import click
+
+from byceps.services.user import user_stats_service
+
+from _util import call_with_app_context
+
+
+@click.command()
+def execute() -> None:
+    counts = user_stats_service.recount_materialized_counts()
+
+    click.secho(
+        f'{counts.total:d} user accounts: '
+        f'{counts.active:d} active, '
+        f'{counts.uninitialized:d} uninitialized, '
+        f'{counts.suspended:d} suspended, '
+        f'{counts.deleted:d} deleted.',
+        fg='green',
+    )
+
+
+if __name__ == '__main__':
+    call_with_app_context(execute)
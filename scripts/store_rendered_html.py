@@ -0,0 +1,34 @@
+"""Store the HTML rendered from the current versions of all news items,
+pages and snippets.
+
+HTML is stored whenever a version is created, so this is needed only
+for versions created before HTML was stored, or after a renderer
+version has been increased. Until then, those versions are rendered
+live.
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import click
+
+from byceps.services.news import news_item_service
+from byceps.services.page import page_service
+from byceps.services.snippet import snippet_service
+
+from _util import call_with_app_context
+
+
+@click.command()
+def execute() -> None:
+    for label, store_html in [
+        ('news items', news_item_service.store_html_for_all_items),
+        ('pages', page_service.store_html_for_all_pages),
+        ('snippets', snippet_service.store_html_for_all_snippets),
+    ]:
+        count = store_html()
+        click.secho(f'Processed {count:d} {label}.', fg='green')
+
+
+if __name__ == '__main__':
+    call_with_app_context(execute)
@@ -56,6 +56,23 @@ def test_export_subscribers(newsletter_list, subscribers, client):
     assert response.json == expected_data
 
 
+def test_export_subscribers_as_ndjson(newsletter_list, subscribers, client):
+    expected_lines = [
+        # See above for why some users are excluded.
+        b'{"screen_name": "User-1", "email_address": "user001@users.test"}',
+        b'{"screen_name": "User-5", "email_address": "user005@users.test"}',
+        b'{"screen_name": "User-7", "email_address": "user007@users.test"}',
+        b'{"screen_name": "User-10", "email_address": "user010@users.test"}',
+    ]
+
+    url = f'{BASE_URL}/newsletter/lists/{newsletter_list.id}/subscriptions/export/ndjson'
+    response = client.get(url)
+
+    assert response.status_code == 200
+    assert response.mimetype == 'application/x-ndjson'
+    assert response.get_data().splitlines() == expected_lines
+
+
 def test_export_subscriber_email_addresses(
     newsletter_list, subscribers, client
 ):
@@ -98,3 +98,20 @@ def test_view_events(user_admin_client, user):
     url = f'{BASE_URL}/users/{user.id}/events'
     response = user_admin_client.get(url)
     assert response.status_code == 200
+
+
+def test_index_with_search_term(user_admin_client, user):
+    url = f'{BASE_URL}/users/?search_term={user.screen_name}'
+    response = user_admin_client.get(url)
+    assert response.status_code == 200
+
+
+def test_autocomplete(user_admin_client, user):
+    url = f'{BASE_URL}/users/autocomplete?prefix={user.screen_name[:3]}'
+    response = user_admin_client.get(url)
+    assert response.status_code == 200
+    assert {
+        'id': str(user.id),
+        'screen_name': user.screen_name,
+        'avatar_url': user.avatar_url,
+    } in response.json['users']
@@ -49,3 +49,49 @@ def test_disabled_metrics(client):
     response = client.get(URL)
 
     assert response.status_code == 404
+
+
+@pytest.mark.parametrize('metrics_enabled', [True])
+def test_metrics_snapshot_age_and_collection_durations(client):
+    response = client.get(URL)
+
+    assert response.status_code == 200
+
+    data = response.get_data(as_text=True)
+    assert re.search('^metrics_snapshot_age_seconds [\\d.]+$', data, re.M)
+    assert re.search(
+        '^metrics_collection_duration_seconds_count{family="user"} \\d+$',
+        data,
+        re.M,
+    )
+
+
+def test_request_metrics(make_admin_app):
+    server_name = 'admin-for-request-metrics.acmecon.test'
+    url = f'http://{server_name}/metrics/'
+
+    app = make_admin_app(
+        server_name, metrics_enabled=True, request_instrumentation_enabled=True
+    )
+
+    with app.app_context():
+        client = app.test_client()
+
+        # Requests are recorded after they have been handled, so the
+        # first one shows up in the response to the second one.
+        client.get(url)
+        response = client.get(url)
+
+    assert response.status_code == 200
+
+    data = response.get_data(as_text=True)
+    for name in [
+        'http_request_duration_seconds',
+        'http_request_sql_statements',
+        'http_request_sql_duration_seconds',
+        'http_request_template_render_duration_seconds',
+        'http_request_redis_round_trips',
+    ]:
+        assert re.search(
+            f'^{name}_count{{endpoint="metrics.metrics"}} \\d+$', data, re.M
+        )
@@ -0,0 +1,109 @@
+"""
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.database import db
+from byceps.services.board import (
+    board_aggregation_service,
+    board_posting_command_service,
+    board_topic_command_service,
+)
+from byceps.services.board.dbmodels.category import DbBoardCategory
+from byceps.services.board.dbmodels.topic import DbTopic
+
+from .helpers import create_category, create_posting, create_topic
+
+
+def test_counts_follow_postings(site_app, board, board_poster, moderator):
+    category = create_category(board.id)
+
+    topic = create_topic(category.id, board_poster)
+    assert get_topic_posting_count(topic.id) == 1
+    assert get_category_counts(category.id) == (1, 1)
+
+    posting = create_posting(topic.id, board_poster)
+    assert get_topic_posting_count(topic.id) == 2
+    assert get_category_counts(category.id) == (1, 2)
+    assert get_category_last_posting_updated_at(category.id) == (
+        posting.created_at
+    )
+
+    board_posting_command_service.hide_posting(posting.id, moderator)
+    assert get_topic_posting_count(topic.id) == 1
+    assert get_category_counts(category.id) == (1, 1)
+    assert get_category_last_posting_updated_at(category.id) == (
+        topic.created_at
+    )
+
+    # Hiding again must not count the posting twice.
+    board_posting_command_service.hide_posting(posting.id, moderator)
+    assert get_topic_posting_count(topic.id) == 1
+    assert get_category_counts(category.id) == (1, 1)
+
+    board_posting_command_service.unhide_posting(posting.id, moderator)
+    assert get_topic_posting_count(topic.id) == 2
+    assert get_category_counts(category.id) == (1, 2)
+    assert get_category_last_posting_updated_at(category.id) == (
+        posting.created_at
+    )
+
+
+def test_counts_follow_topics(site_app, board, board_poster, moderator):
+    category1 = create_category(board.id)
+    category2 = create_category(board.id)
+
+    topic = create_topic(category1.id, board_poster)
+    create_posting(topic.id, board_poster)
+    assert get_category_counts(category1.id) == (1, 2)
+
+    board_topic_command_service.hide_topic(topic.id, moderator)
+    assert get_category_counts(category1.id) == (0, 0)
+    assert get_category_last_posting_updated_at(category1.id) is None
+
+    board_topic_command_service.unhide_topic(topic.id, moderator)
+    assert get_category_counts(category1.id) == (1, 2)
+
+    board_topic_command_service.move_topic(topic.id, category2.id, moderator)
+    assert get_category_counts(category1.id) == (0, 0)
+    assert get_category_counts(category2.id) == (1, 2)
+
+
+def test_reconcile_board(site_app, board, board_poster):
+    category = create_category(board.id)
+    topic = create_topic(category.id, board_poster)
+    create_posting(topic.id, board_poster)
+
+    db_category = db.session.get(DbBoardCategory, category.id)
+    db_category.topic_count = 7
+    db_category.posting_count = 99
+    db_topic = db.session.get(DbTopic, topic.id)
+    db_topic.posting_count = 0
+    db.session.commit()
+
+    fixed_count = board_aggregation_service.reconcile_board(board.id)
+
+    assert fixed_count >= 2
+    assert get_category_counts(category.id) == (1, 2)
+    assert get_topic_posting_count(topic.id) == 2
+
+
+# helpers
+
+
+def get_category_counts(category_id) -> tuple[int, int]:
+    db.session.expire_all()
+    db_category = db.session.get(DbBoardCategory, category_id)
+    return db_category.topic_count, db_category.posting_count
+
+
+def get_category_last_posting_updated_at(category_id):
+    db.session.expire_all()
+    db_category = db.session.get(DbBoardCategory, category_id)
+    return db_category.last_posting_updated_at
+
+
+def get_topic_posting_count(topic_id) -> int:
+    db.session.expire_all()
+    db_topic = db.session.get(DbTopic, topic_id)
+    return db_topic.posting_count
@@ -0,0 +1,59 @@
+"""
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.services.board import (
+    board_topic_command_service,
+    board_topic_query_service,
+)
+
+from .helpers import create_category, create_topic
+
+
+def test_mark_all_topics_in_board_as_viewed(
+    site_app, board, board_poster, make_user
+):
+    user = make_user()
+    category = create_category(board.id)
+    topic1 = create_topic(category.id, board_poster, number=1)
+    topic2 = create_topic(category.id, board_poster, number=2)
+
+    assert find_last_viewed_at(topic1, user) is None
+    assert find_last_viewed_at(topic2, user) is None
+
+    board_topic_command_service.mark_all_topics_as_viewed(board.id, user.id)
+
+    last_viewed_at1 = find_last_viewed_at(topic1, user)
+    last_viewed_at2 = find_last_viewed_at(topic2, user)
+    assert last_viewed_at1 is not None
+    assert last_viewed_at1 == last_viewed_at2
+    assert last_viewed_at1 >= topic2.created_at
+
+    # A later view of a single topic takes precedence.
+    board_topic_command_service.mark_topic_as_just_viewed(topic1.id, user.id)
+
+    assert find_last_viewed_at(topic1, user) > last_viewed_at2
+
+
+def test_mark_all_topics_in_category_as_viewed(
+    site_app, board, board_poster, make_user
+):
+    user = make_user()
+    category1 = create_category(board.id)
+    category2 = create_category(board.id)
+    topic1 = create_topic(category1.id, board_poster)
+    topic2 = create_topic(category2.id, board_poster)
+
+    board_topic_command_service.mark_all_topics_in_category_as_viewed(
+        category1.id, user.id
+    )
+
+    assert find_last_viewed_at(topic1, user) is not None
+    assert find_last_viewed_at(topic2, user) is None
+
+
+def find_last_viewed_at(topic, user):
+    return board_topic_query_service.find_topic_last_viewed_at(
+        topic.id, user.id
+    )
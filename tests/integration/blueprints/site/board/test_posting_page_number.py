@@ -0,0 +1,40 @@
+"""
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.services.board import (
+    board_posting_command_service,
+    board_posting_query_service,
+)
+
+from .helpers import create_category, create_posting, create_topic, find_posting
+
+
+def test_calculate_posting_page_number(
+    site_app, board, board_poster, moderator
+):
+    category = create_category(board.id)
+    topic = create_topic(category.id, board_poster)
+    postings = [
+        create_posting(topic.id, board_poster, number=number)
+        for number in range(1, 6)
+    ]
+
+    # The topic's initial posting plus five more, two per page
+    assert get_page_number(postings[0], include_hidden=False) == 1
+    assert get_page_number(postings[1], include_hidden=False) == 2
+    assert get_page_number(postings[2], include_hidden=False) == 2
+    assert get_page_number(postings[4], include_hidden=False) == 3
+
+    board_posting_command_service.hide_posting(postings[0].id, moderator)
+
+    assert get_page_number(postings[1], include_hidden=False) == 1
+    assert get_page_number(postings[1], include_hidden=True) == 2
+
+
+def get_page_number(posting, *, include_hidden: bool) -> int:
+    db_posting = find_posting(posting.id)
+    return board_posting_query_service.calculate_posting_page_number(
+        db_posting, include_hidden, 2
+    )
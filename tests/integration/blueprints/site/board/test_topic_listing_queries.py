@@ -0,0 +1,101 @@
+"""
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+from byceps.database import db
+from byceps.services.authn.session.models import CurrentUser
+from byceps.services.board import (
+    board_topic_command_service,
+    board_topic_query_service,
+)
+
+from .helpers import create_category, create_topic
+
+
+def test_topic_page_is_loaded_with_constant_number_of_queries(
+    site_app, board, board_poster, make_user
+):
+    category = create_category(board.id)
+    for number in range(1, 11):
+        create_topic(category.id, make_user(), number=number)
+
+    current_user = CurrentUser.create_authenticated(
+        board_poster, None, frozenset()
+    )
+
+    for per_page in 2, 10:
+        with count_queries() as statements:
+            pagination = board_topic_query_service.paginate_topics_of_category(
+                category.id, 1, per_page, current_user
+            )
+
+        assert len(pagination.items) == per_page
+        assert pagination.total == 10
+
+        # one for topics, categories, last views and the total,
+        # one for creators and last updaters
+        assert len(statements) == 2
+
+
+def test_topic_page_contains_unread_state(
+    site_app, board, board_poster, make_user
+):
+    category = create_category(board.id)
+    topic1 = create_topic(category.id, board_poster, number=1)
+    topic2 = create_topic(category.id, board_poster, number=2)
+
+    user = make_user()
+    current_user = CurrentUser.create_authenticated(user, None, frozenset())
+
+    board_topic_command_service.mark_topic_as_just_viewed(topic1.id, user.id)
+
+    pagination = board_topic_query_service.paginate_topics_of_category(
+        category.id, 1, 10, current_user
+    )
+
+    contains_unseen_postings_by_topic_id = {
+        summary.id: summary.contains_unseen_postings
+        for summary in pagination.items
+    }
+    assert contains_unseen_postings_by_topic_id == {
+        topic1.id: False,
+        topic2.id: True,
+    }
+
+
+def test_topic_page_beyond_last_page(site_app, board, board_poster):
+    category = create_category(board.id)
+    create_topic(category.id, board_poster)
+
+    current_user = CurrentUser.create_anonymous(None)
+
+    pagination = board_topic_query_service.paginate_topics_of_category(
+        category.id, 3, 10, current_user
+    )
+
+    assert pagination.items == []
+    assert pagination.total == 1
+
+
+# helpers
+
+
+@contextmanager
+def count_queries():
+    statements = []
+
+    def before_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany
+    ):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
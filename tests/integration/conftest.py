@@ -29,6 +29,7 @@ from byceps.config.models import (
     MetricsConfig,
     PaymentGatewaysConfig,
     RedisConfig,
+    ShopConfig,
     SiteWebAppConfig,
     SmtpConfig,
     WebAppsConfig,
@@ -114,6 +115,7 @@ def build_byceps_config(
     redis_config: RedisConfig,
     *,
     metrics_enabled: bool = False,
+    request_instrumentation_enabled: bool = False,
     style_guide_enabled: bool = False,
 ) -> BycepsConfig:
     return BycepsConfig(
@@ -135,12 +137,17 @@ def build_byceps_config(
         ),
         metrics=MetricsConfig(
             enabled=metrics_enabled,
+            request_instrumentation_enabled=request_instrumentation_enabled,
         ),
         payment_gateways=PaymentGatewaysConfig(
             paypal=None,
             stripe=None,
         ),
         redis=redis_config,
+        shop=ShopConfig(
+            order_number_block_size=1,
+            release_unused_order_numbers=False,
+        ),
         smtp=SmtpConfig(
             host='127.0.0.1',
             port=25,
@@ -190,10 +197,12 @@ def make_admin_app(make_byceps_config):
         server_name: str,
         *,
         metrics_enabled: bool = False,
+        request_instrumentation_enabled: bool = False,
         style_guide_enabled: bool = False,
     ) -> BycepsApp:
         byceps_config = make_byceps_config(
             metrics_enabled=metrics_enabled,
+            request_instrumentation_enabled=request_instrumentation_enabled,
             style_guide_enabled=style_guide_enabled,
         )
 
@@ -261,6 +270,7 @@ def make_byceps_config(
     def _wrapper(
         *,
         metrics_enabled: bool = False,
+        request_instrumentation_enabled: bool = False,
         style_guide_enabled: bool = False,
     ) -> BycepsConfig:
         return build_byceps_config(
@@ -268,6 +278,7 @@ def make_byceps_config(
             database_config,
             redis_config,
             metrics_enabled=metrics_enabled,
+            request_instrumentation_enabled=request_instrumentation_enabled,
             style_guide_enabled=style_guide_enabled,
         )
 
@@ -3,7 +3,10 @@
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from byceps.cli.commands.create_database_tables import _load_dbmodels
+from byceps.cli.commands.create_database_tables import (
+    create_database_extensions,
+    load_dbmodels,
+)
 from byceps.database import db
 from byceps.services.authz import authz_service
 from byceps.services.authz.models import RoleID
@@ -11,9 +14,10 @@ from byceps.services.language import language_service
 
 
 def set_up_database() -> None:
-    _load_dbmodels()
+    load_dbmodels()
 
     db.drop_all()
+    create_database_extensions()
     db.create_all()
 
 
@@ -0,0 +1,60 @@
+"""
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.services.authn.session import authn_session_service
+from byceps.services.user import user_command_service
+
+
+def test_authenticated_user_is_found(admin_app, make_user):
+    user = make_user()
+    auth_token, _ = authn_session_service.log_in_user_to_admin(user, None)
+
+    # First lookup fills the cache, second one is served from it.
+    for _ in range(2):
+        actual = authn_session_service.find_authenticated_user(
+            user.id, auth_token
+        )
+        assert actual is not None
+        assert actual.id == user.id
+        assert actual.screen_name == user.screen_name
+
+
+def test_wrong_auth_token_is_rejected(admin_app, make_user):
+    user = make_user()
+    auth_token, _ = authn_session_service.log_in_user_to_admin(user, None)
+
+    # Fill cache.
+    authn_session_service.find_authenticated_user(user.id, auth_token)
+
+    actual = authn_session_service.find_authenticated_user(
+        user.id, 'wrong-token'
+    )
+    assert actual is None
+
+
+def test_cached_user_is_evicted_on_token_deletion(admin_app, make_user):
+    user = make_user()
+    auth_token, _ = authn_session_service.log_in_user_to_admin(user, None)
+
+    # Fill cache.
+    authn_session_service.find_authenticated_user(user.id, auth_token)
+
+    authn_session_service.delete_session_tokens_for_user(user.id)
+
+    actual = authn_session_service.find_authenticated_user(user.id, auth_token)
+    assert actual is None
+
+
+def test_cached_user_is_evicted_on_suspension(admin_app, make_user, admin_user):
+    user = make_user()
+    auth_token, _ = authn_session_service.log_in_user_to_admin(user, None)
+
+    # Fill cache.
+    authn_session_service.find_authenticated_user(user.id, auth_token)
+
+    user_command_service.suspend_account(user, admin_user, 'Troublemaker')
+
+    actual = authn_session_service.find_authenticated_user(user.id, auth_token)
+    assert actual is None
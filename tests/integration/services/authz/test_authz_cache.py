@@ -0,0 +1,81 @@
+"""
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import pytest
+
+from byceps.services.authz import authz_cache, authz_service
+from byceps.services.authz.models import PermissionID
+
+from tests.helpers import generate_token
+
+
+def test_cached_permissions_follow_role_assignment(
+    admin_app, user, admin_user, role
+):
+    permission_id = PermissionID(generate_token())
+    authz_service.assign_permission_to_role(permission_id, role.id)
+
+    assert permission_id not in get_permission_ids(user)
+
+    authz_service.assign_role_to_user(role.id, user, initiator=admin_user)
+
+    assert permission_id in get_permission_ids(user)
+
+    authz_service.deassign_role_from_user(role.id, user, initiator=admin_user)
+
+    assert permission_id not in get_permission_ids(user)
+
+
+def test_cached_permissions_follow_permission_assignment(
+    admin_app, user, admin_user, role
+):
+    permission_id = PermissionID(generate_token())
+
+    authz_service.assign_role_to_user(role.id, user, initiator=admin_user)
+
+    assert permission_id not in get_permission_ids(user)
+
+    authz_service.assign_permission_to_role(permission_id, role.id)
+
+    assert permission_id in get_permission_ids(user)
+
+    authz_service.deassign_permission_from_role(permission_id, role.id)
+
+    assert permission_id not in get_permission_ids(user)
+
+
+def test_cached_permissions_are_served_without_loading(admin_app, user):
+    loaded_user_ids = []
+
+    def load(user_id):
+        loaded_user_ids.append(user_id)
+        return authz_service.get_permission_ids_for_user(user_id)
+
+    authz_cache.invalidate_for_user(user.id)
+
+    authz_cache.get_permission_ids_for_user(user.id, load)
+    authz_cache.get_permission_ids_for_user(user.id, load)
+    assert loaded_user_ids == [user.id]
+
+    authz_cache.invalidate_all()
+
+    authz_cache.get_permission_ids_for_user(user.id, load)
+    assert loaded_user_ids == [user.id, user.id]
+
+
+@pytest.fixture()
+def user(make_user):
+    return make_user()
+
+
+@pytest.fixture()
+def role(make_role):
+    return make_role()
+
+
+def get_permission_ids(user):
+    return authz_cache.get_permission_ids_for_user(
+        user.id, authz_service.get_permission_ids_for_user
+    )
@@ -0,0 +1,89 @@
+"""
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from pathlib import Path
+
+from PIL import Image
+import pytest
+
+from byceps.services.brand.models import Brand
+from byceps.services.gallery import gallery_import_service, gallery_service
+from byceps.services.gallery.models import (
+    Gallery,
+    GalleryImportProgress,
+    GalleryImportState,
+)
+from byceps.util.image.dimensions import Dimensions, read_dimensions
+
+
+@pytest.fixture(scope='module')
+def gallery(admin_app, brand: Brand) -> Gallery:
+    return gallery_service.create_gallery(
+        brand.id,
+        'import-gallery',
+        'Import Gallery',
+        False,
+    )
+
+
+@pytest.fixture(scope='module')
+def gallery_path(admin_app, gallery: Gallery) -> Path:
+    path = (
+        admin_app.byceps_config.data_path
+        / 'brands'
+        / gallery.brand_id
+        / 'galleries'
+        / gallery.slug
+    )
+    path.mkdir(parents=True)
+    return path
+
+
+def test_import_generates_missing_previews(
+    admin_app, gallery: Gallery, gallery_path: Path
+) -> None:
+    for number in 1, 2, 3:
+        Image.new('RGB', (1600, 1200)).save(gallery_path / f'{number:03d}.jpg')
+
+    # Only the second image comes with a preview.
+    Image.new('RGB', (200, 150)).save(gallery_path / '002_preview.jpg')
+
+    assert gallery_import_service.start_import(gallery).is_ok()
+
+    # Jobs are not processed asynchronously in tests, so the import
+    # has already happened.
+    assert gallery_import_service.get_import_progress(
+        gallery.id
+    ) == GalleryImportProgress(
+        state=GalleryImportState.finished,
+        image_count=3,
+        missing_preview_count=2,
+        generated_preview_count=2,
+    )
+
+    for filename, expected_dimensions in [
+        ('001_preview.jpg', Dimensions(400, 300)),
+        ('002_preview.jpg', Dimensions(200, 150)),
+        ('003_preview.jpg', Dimensions(400, 300)),
+    ]:
+        actual_dimensions = read_dimensions(str(gallery_path / filename))
+        assert actual_dimensions == expected_dimensions
+
+    gallery_with_images = gallery_service.find_gallery_by_slug_with_images(
+        gallery.brand_id, gallery.slug
+    )
+    assert gallery_with_images is not None
+
+    assert [
+        (image.position, image.filename_full, image.filename_preview)
+        for image in gallery_with_images.images
+    ] == [
+        (1, '001.jpg', '001_preview.jpg'),
+        (2, '002.jpg', '002_preview.jpg'),
+        (3, '003.jpg', '003_preview.jpg'),
+    ]
+
+    assert gallery_with_images.title_image is not None
+    assert gallery_with_images.title_image.filename_full == '001.jpg'
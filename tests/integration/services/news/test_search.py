@@ -0,0 +1,54 @@
+"""
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import pytest
+
+from byceps.services.news import news_item_service
+from byceps.services.news.models import BodyFormat, NewsChannel
+
+from tests.helpers import generate_token
+
+
+def test_published_item_found_among_many_unpublished_ones(
+    admin_app, channel, editor
+):
+    for _ in range(55):
+        create_item(channel, editor, 'Draft about the tournament')
+
+    published_item = create_item(channel, editor, 'Report on the tournament')
+    news_item_service.publish_item(published_item.id).unwrap()
+
+    headlines = news_item_service.search_headlines('tournament', {channel.id})
+
+    assert [headline.slug for headline in headlines] == [published_item.slug]
+
+
+# helpers
+
+
+@pytest.fixture(scope='module')
+def editor(make_user):
+    return make_user()
+
+
+@pytest.fixture(scope='module')
+def brand(make_brand):
+    return make_brand()
+
+
+@pytest.fixture()
+def channel(brand, make_news_channel) -> NewsChannel:
+    return make_news_channel(brand)
+
+
+def create_item(channel, editor, body):
+    return news_item_service.create_item(
+        channel,
+        generate_token(),
+        editor,
+        'the title',
+        body,
+        BodyFormat.markdown,
+    ).unwrap()
@@ -0,0 +1,92 @@
+"""
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import dataclasses
+
+import pytest
+
+from byceps.services.news import news_html_service, news_item_service
+from byceps.services.news.models import BodyFormat, NewsChannel
+from byceps.services.rendered_html import rendered_html_service
+
+from tests.helpers import generate_token
+
+
+def test_body_html_is_stored_on_creation(admin_app, channel, editor):
+    item = create_item(channel, editor, '**bold**')
+
+    version_id = news_item_service.get_current_item_version(item.id).id
+
+    assert find_stored_body_html(version_id) == '<p><strong>bold</strong></p>\n'
+
+
+def test_stored_body_html_is_served(admin_app, channel, editor):
+    item = create_item(channel, editor, 'original')
+    version_id = news_item_service.get_current_item_version(item.id).id
+
+    rendered_item = news_item_service.render_html(item, version_id=version_id)
+    assert rendered_item.body_html.unwrap() == '<p>original</p>\n'
+
+    # The stored HTML is served instead of rendering the source again.
+    changed_item = dataclasses.replace(item, body='changed')
+    rendered_item = news_item_service.render_html(
+        changed_item, version_id=version_id
+    )
+    assert rendered_item.body_html.unwrap() == '<p>original</p>\n'
+
+
+def test_body_html_embedding_images_is_not_stored(admin_app, channel, editor):
+    item = create_item(channel, editor, '{{ render_image(1) }}')
+
+    version_id = news_item_service.get_current_item_version(item.id).id
+
+    assert find_stored_body_html(version_id) is None
+
+
+def test_find_body_htmls(admin_app, channel, editor):
+    item1 = create_item(channel, editor, 'first')
+    item2 = create_item(channel, editor, '{{ render_image(1) }}')
+
+    version_id1 = news_item_service.get_current_item_version(item1.id).id
+    version_id2 = news_item_service.get_current_item_version(item2.id).id
+
+    assert news_html_service.find_body_htmls([version_id1, version_id2]) == {
+        version_id1: '<p>first</p>\n',
+    }
+
+
+# helpers
+
+
+@pytest.fixture(scope='module')
+def editor(make_user):
+    return make_user()
+
+
+@pytest.fixture(scope='module')
+def brand(make_brand):
+    return make_brand()
+
+
+@pytest.fixture()
+def channel(brand, make_news_channel) -> NewsChannel:
+    return make_news_channel(brand)
+
+
+def create_item(channel, editor, body):
+    return news_item_service.create_item(
+        channel,
+        generate_token(),
+        editor,
+        'the title',
+        body,
+        BodyFormat.markdown,
+    ).unwrap()
+
+
+def find_stored_body_html(version_id):
+    return rendered_html_service.find_html(
+        version_id, 'body', news_html_service.BODY_RENDERER_VERSION
+    )
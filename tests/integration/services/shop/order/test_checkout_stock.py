@@ -0,0 +1,76 @@
+"""
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import pytest
+
+from byceps.byceps_app import BycepsApp
+from byceps.services.shop.cart.models import Cart
+from byceps.services.shop.order import order_checkout_service, order_service
+from byceps.services.shop.order.models.order import Orderer
+from byceps.services.shop.product import product_service
+from byceps.services.shop.shop.models import Shop
+from byceps.services.shop.storefront.models import Storefront
+
+
+@pytest.fixture()
+def orderer(make_user, make_orderer) -> Orderer:
+    user = make_user()
+    return make_orderer(user)
+
+
+def test_place_order_reduces_stock_of_all_products(
+    admin_app: BycepsApp,
+    shop: Shop,
+    storefront: Storefront,
+    make_product,
+    orderer: Orderer,
+):
+    product1 = make_product(shop.id, total_quantity=10)
+    product2 = make_product(shop.id, total_quantity=5)
+
+    cart = Cart(shop.currency)
+    cart.add_item(product1, 3)
+    cart.add_item(product2, 5)
+
+    result = order_checkout_service.place_order(storefront, orderer, cart)
+
+    assert result.is_ok()
+    assert get_quantity(product1) == 7
+    assert get_quantity(product2) == 0
+
+
+def test_place_order_fails_atomically_on_insufficient_stock(
+    admin_app: BycepsApp,
+    shop: Shop,
+    storefront: Storefront,
+    make_product,
+    orderer: Orderer,
+):
+    product1 = make_product(shop.id, total_quantity=10)
+    product2 = make_product(shop.id, total_quantity=2)
+
+    cart = Cart(shop.currency)
+    cart.add_item(product1, 3)
+    cart.add_item(product2, 3)
+
+    result = order_checkout_service.place_order(storefront, orderer, cart)
+
+    assert result.is_err()
+
+    # Neither product's stock must have been reduced.
+    assert get_quantity(product1) == 10
+    assert get_quantity(product2) == 2
+
+    # No order must have been created.
+    assert not order_service.has_user_ordered_product(
+        orderer.user.id, product1.id
+    )
+
+
+# helpers
+
+
+def get_quantity(product) -> int:
+    return product_service.get_product(product.id).quantity
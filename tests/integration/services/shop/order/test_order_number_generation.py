@@ -44,3 +44,36 @@ def test_generate_order_number_custom(admin_app, shop2):
     actual = order_sequence_service.generate_order_number(sequence.id).unwrap()
 
     assert actual == 'LOL-03-B00207'
+
+
+def test_generate_order_numbers_from_reserved_block(admin_app, shop1):
+    shop = shop1
+
+    sequence = order_sequence_service.create_order_number_sequence(
+        shop.id, 'BLK-01-B'
+    ).unwrap()
+
+    actual = [
+        order_sequence_service.generate_order_number(
+            sequence.id, block_size=3
+        ).unwrap()
+        for _ in range(4)
+    ]
+
+    assert actual == [
+        'BLK-01-B00001',
+        'BLK-01-B00002',
+        'BLK-01-B00003',
+        'BLK-01-B00004',
+    ]
+
+    # The second block has been reserved as a whole.
+    assert get_sequence_value(sequence.id) == 6
+
+    # The unused remainder of the second block can be handed back.
+    assert order_sequence_service.release_unused_order_numbers() == 2
+    assert get_sequence_value(sequence.id) == 4
+
+
+def get_sequence_value(sequence_id):
+    return order_sequence_service.get_order_number_sequence(sequence_id).value
@@ -0,0 +1,68 @@
+"""
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import pytest
+
+from byceps.services.snippet import snippet_service
+from byceps.services.snippet.models import SnippetScope
+
+
+@pytest.fixture(scope='module')
+def scope(make_party, brand):
+    party = make_party(brand, 'searchfest-2026', 'Searchfest 2026')
+    return SnippetScope.for_site(party.id)
+
+
+def test_search_is_ranked_and_stemmed(scope, make_user):
+    creator = make_user()
+
+    version1 = create_snippet(
+        scope, 'rules', creator, 'No tournaments take place at night.'
+    )
+    version2 = create_snippet(
+        scope, 'tournament', creator, 'Sign up for the tournament now!'
+    )
+    version3 = create_snippet(scope, 'catering', creator, 'Pizza for all.')
+
+    # Matches in the name rank higher. The English stemmer reduces
+    # "tournaments" to the same word stem as "tournament".
+    assert snippet_service.search_snippets('tournaments', scope) == [
+        version2,
+        version1,
+    ]
+
+    assert snippet_service.search_snippets('pizza -pasta', scope) == [version3]
+
+    for version in version1, version2, version3:
+        snippet_service.delete_snippet(version.snippet_id)
+
+
+def test_search_reflects_updates_and_deletions(scope, make_user):
+    creator = make_user()
+
+    version = create_snippet(scope, 'faq', creator, 'Bring your own cable.')
+
+    assert snippet_service.search_snippets('cable', scope) == [version]
+
+    updated_version, _ = snippet_service.update_snippet(
+        version.snippet_id, creator, 'Bring your own chair.'
+    )
+
+    assert snippet_service.search_snippets('cable', scope) == []
+    assert snippet_service.search_snippets('chair', scope) == [updated_version]
+
+    snippet_service.delete_snippet(version.snippet_id)
+
+    assert snippet_service.search_snippets('chair', scope) == []
+
+
+# helpers
+
+
+def create_snippet(scope: SnippetScope, name, creator, body):
+    version, _ = snippet_service.create_snippet(
+        scope, name, 'en', creator, body
+    )
+    return version
@@ -0,0 +1,111 @@
+"""
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import pytest
+
+from byceps.services.seating import seat_service, seating_area_service
+
+# Import models to ensure the corresponding tables are created so
+# `Seat.assignment` is available.
+import byceps.services.seating.dbmodels.seat_group  # noqa: F401
+from byceps.services.ticketing import (
+    ticket_creation_service,
+    ticket_seat_management_service,
+    ticket_user_management_service,
+)
+
+from tests.helpers import generate_token
+
+
+@pytest.fixture()
+def area(party):
+    token = generate_token()
+    return seating_area_service.create_area(party.id, token, token)
+
+
+@pytest.fixture()
+def seat1(area, category):
+    return seat_service.create_seat(area.id, 0, 1, category.id)
+
+
+@pytest.fixture()
+def seat2(area, category):
+    return seat_service.create_seat(area.id, 0, 2, category.id)
+
+
+@pytest.fixture()
+def ticket(admin_app, category, ticket_owner):
+    return ticket_creation_service.create_ticket(category, ticket_owner)
+
+
+def test_cached_area_seats_follow_occupancy(
+    admin_app, area, seat1, seat2, ticket, ticket_owner
+):
+    area_seats = seat_service.get_cached_area_seats(area.id)
+    assert get_occupancy(area_seats) == {seat1.id: None, seat2.id: None}
+
+    # Unchanged seats keep their version.
+    version = area_seats.version
+    assert seat_service.get_cached_area_seats(area.id).version == version
+
+    ticket_seat_management_service.occupy_seat(
+        ticket.id, seat1.id, ticket_owner
+    ).unwrap()
+
+    area_seats = seat_service.get_cached_area_seats(area.id)
+    assert area_seats.version > version
+    assert get_occupancy(area_seats) == {seat1.id: ticket.id, seat2.id: None}
+
+    ticket_seat_management_service.occupy_seat(
+        ticket.id, seat2.id, ticket_owner
+    ).unwrap()
+
+    area_seats = seat_service.get_cached_area_seats(area.id)
+    assert get_occupancy(area_seats) == {seat1.id: None, seat2.id: ticket.id}
+
+    ticket_user_management_service.appoint_user(
+        ticket.id, ticket_owner, ticket_owner
+    ).unwrap()
+
+    area_seats = seat_service.get_cached_area_seats(area.id)
+    assert get_seat(area_seats, seat2.id).occupied_by_user.id == ticket_owner.id
+
+    ticket_seat_management_service.release_seat(
+        ticket.id, ticket_owner
+    ).unwrap()
+
+    area_seats = seat_service.get_cached_area_seats(area.id)
+    assert get_occupancy(area_seats) == {seat1.id: None, seat2.id: None}
+
+    # The incrementally updated seats match freshly loaded ones.
+    assert sorted_seats(area_seats.seats) == sorted_seats(
+        seat_service.get_area_seats(area.id)
+    )
+
+
+def test_cached_area_seats_follow_seat_creation(admin_app, area, category):
+    area_seats_before = seat_service.get_cached_area_seats(area.id)
+    assert area_seats_before.seats == []
+
+    seat = seat_service.create_seat(area.id, 0, 3, category.id)
+
+    area_seats_after = seat_service.get_cached_area_seats(area.id)
+    assert area_seats_after.version > area_seats_before.version
+    assert [area_seat.id for area_seat in area_seats_after.seats] == [seat.id]
+
+
+# helpers
+
+
+def get_occupancy(area_seats):
+    return {seat.id: seat.occupied_by_ticket_id for seat in area_seats.seats}
+
+
+def get_seat(area_seats, seat_id):
+    return next(seat for seat in area_seats.seats if seat.id == seat_id)
+
+
+def sorted_seats(seats):
+    return sorted(seats, key=lambda seat: str(seat.id))
@@ -28,11 +28,34 @@ def test_create_ticket_with_existing_code(
     )
     assert existing_ticket.code == 'TAKEN'
 
+    # The code already in use is detected before the insert is
+    # attempted, and no other code can be generated.
     with pytest.raises(
-        ticket_creation_service.TicketCreationFailedWithConflictError
-    ):
+        ticket_creation_service.TicketCreationFailedError
+    ) as excinfo:
         ticket_creation_service.create_ticket(category, ticket_owner)
 
+    assert (
+        excinfo.value.args[0]
+        == 'Could not generate unique ticket code after 4 attempts.'
+    )
+
+
+@patch('byceps.services.ticketing.ticket_code_service._generate_ticket_code')
+def test_create_ticket_replaces_code_in_use(
+    generate_ticket_code_mock, admin_app, category, ticket_owner
+):
+    generate_ticket_code_mock.return_value = 'INUSE'
+    existing_ticket = ticket_creation_service.create_ticket(
+        category, ticket_owner
+    )
+    assert existing_ticket.code == 'INUSE'
+
+    generate_ticket_code_mock.return_value = None
+    generate_ticket_code_mock.side_effect = ['INUSE', 'FRESH']
+    ticket = ticket_creation_service.create_ticket(category, ticket_owner)
+    assert ticket.code == 'FRESH'
+
 
 def test_create_tickets(admin_app, category, ticket_owner):
     quantity = 3
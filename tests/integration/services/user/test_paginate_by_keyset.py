@@ -0,0 +1,82 @@
+"""
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from sqlalchemy import select
+
+from byceps.database import estimate_count, paginate_by_keyset
+from byceps.services.user.dbmodels import DbUser
+
+
+def test_paginate_forward_and_backward(admin_app, make_user):
+    user_ids = [make_user().id for _ in range(5)]
+    stmt = select(DbUser).filter(DbUser.id.in_(user_ids))
+
+    # newest first
+    expected_user_ids = list(reversed(user_ids))
+
+    page1 = paginate(stmt, None)
+    assert get_user_ids(page1) == expected_user_ids[0:2]
+    assert page1.total == 5
+    assert not page1.total_estimated
+    assert not page1.has_prev
+    assert page1.has_next
+
+    page2 = paginate(stmt, page1.next_cursor)
+    assert get_user_ids(page2) == expected_user_ids[2:4]
+    assert page2.has_prev
+    assert page2.has_next
+
+    page3 = paginate(stmt, page2.next_cursor)
+    assert get_user_ids(page3) == expected_user_ids[4:5]
+    assert page3.has_prev
+    assert not page3.has_next
+
+    page2_again = paginate(stmt, page3.prev_cursor)
+    assert get_user_ids(page2_again) == expected_user_ids[2:4]
+
+    page1_again = paginate(stmt, page2_again.prev_cursor)
+    assert get_user_ids(page1_again) == expected_user_ids[0:2]
+    assert not page1_again.has_prev
+    assert page1_again.has_next
+
+
+def test_invalid_cursor_returns_first_page(admin_app, make_user):
+    user_ids = [make_user().id for _ in range(3)]
+    stmt = select(DbUser).filter(DbUser.id.in_(user_ids))
+
+    page = paginate(stmt, 'not-a-cursor')
+
+    assert get_user_ids(page) == list(reversed(user_ids))[0:2]
+    assert not page.has_prev
+
+
+def test_estimate_total(admin_app, make_user):
+    user_ids = [make_user().id for _ in range(3)]
+    stmt = select(DbUser).filter(DbUser.id.in_(user_ids))
+
+    page = paginate_by_keyset(
+        stmt, [DbUser.created_at, DbUser.id], None, 2, estimate_total=True
+    )
+
+    assert isinstance(page.total, int)
+    assert page.total_estimated
+
+
+def test_estimate_count_with_in_list(admin_app, make_user):
+    screen_names = [make_user().screen_name for _ in range(3)]
+    stmt = select(DbUser).filter(DbUser.screen_name.in_(screen_names))
+
+    assert estimate_count(stmt) >= 1
+
+
+# helpers
+
+
+def paginate(stmt, cursor):
+    return paginate_by_keyset(stmt, [DbUser.created_at, DbUser.id], cursor, 2)
+
+
+def get_user_ids(pagination):
+    return [db_user.id for db_user in pagination.items]
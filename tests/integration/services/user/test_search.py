@@ -0,0 +1,87 @@
+"""
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from sqlalchemy import select
+
+from byceps.database import db
+from byceps.services.user import user_repository, user_service
+from byceps.services.user.dbmodels import DbUser
+
+from tests.helpers import generate_token
+
+
+def test_exact_screen_name_match_is_returned_alone(admin_app, make_user):
+    token = generate_token()
+    user = make_user(f'Gamer{token}')
+    make_user(f'Gamer{token}2000')
+
+    actual = user_service.search_users(f'gamer{token}', limit=10)
+
+    assert [user.id for user in actual] == [user.id]
+
+
+def test_exact_email_address_match_is_returned_alone(admin_app, make_user):
+    token = generate_token()
+    user = make_user(email_address=f'gamer{token}@users.test')
+    make_user(email_address=f'gamer{token}2000@users.test')
+
+    actual = user_service.search_users(f'GAMER{token}@users.test', limit=10)
+
+    assert [user.id for user in actual] == [user.id]
+
+
+def test_matches_are_ranked_by_similarity(admin_app, make_user):
+    token = generate_token()
+    user1 = make_user(f'{token}Frag-Master-Supreme')
+    user2 = make_user(f'{token}Frag')
+    user3 = make_user(f'{token}Frag-Master')
+    make_user(f'{token}Camper')
+
+    actual = user_service.search_users(f'{token}fra', limit=10)
+
+    assert [user.id for user in actual] == [user2.id, user3.id, user1.id]
+
+
+def test_search_term_filter_can_use_trigram_indexes(admin_app):
+    stmt = user_repository._filter_by_search_term(
+        select(DbUser.id), 'frag master'
+    )
+
+    connection = db.session.connection()
+    compiled = stmt.compile(dialect=connection.dialect)
+
+    # Make the planner use the indexes, if possible, even though the
+    # tables are small.
+    connection.exec_driver_sql('SET enable_seqscan = off')
+    try:
+        plan = '\n'.join(
+            connection.exec_driver_sql(
+                f'EXPLAIN {compiled}', compiled.params
+            ).scalars()
+        )
+    finally:
+        connection.exec_driver_sql('RESET enable_seqscan')
+
+    for index_name in [
+        'ix_users_email_address_trgm',
+        'ix_users_screen_name_trgm',
+        'ix_user_details_first_name_trgm',
+        'ix_user_details_last_name_trgm',
+    ]:
+        assert index_name in plan
+
+
+def test_get_users_by_screen_name_prefix(admin_app, make_user):
+    token = generate_token()
+    user1 = make_user(f'{token}_beta')
+    user2 = make_user(f'{token}_Alpha')
+    make_user(f'{token}Gamma')
+    make_user(f'{token}_Delta', deleted=True)
+
+    actual = user_service.get_users_by_screen_name_prefix(
+        f'{token.upper()}_', limit=10
+    )
+
+    assert [user.id for user in actual] == [user2.id, user1.id]
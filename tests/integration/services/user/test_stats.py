@@ -0,0 +1,60 @@
+"""
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import dataclasses
+
+from sqlalchemy import delete
+
+from byceps.database import db
+from byceps.services.user import user_command_service, user_stats_service
+from byceps.services.user.dbmodels import DbUserStateCount
+from byceps.services.user.models import UserStateCounts
+
+
+def test_count_users_by_state(admin_app, make_user):
+    make_user()
+    make_user(initialized=False)
+
+    expected = UserStateCounts(
+        active=user_stats_service.count_active_users(),
+        uninitialized=user_stats_service.count_uninitialized_users(),
+        suspended=user_stats_service.count_suspended_users(),
+        deleted=user_stats_service.count_deleted_users(),
+    )
+
+    actual = user_stats_service.count_users_by_state()
+
+    assert actual == expected
+    assert actual.total == user_stats_service.count_users()
+
+
+def test_materialized_counts_follow_account_lifecycle(admin_app, make_user):
+    initiator = make_user()
+
+    counts = user_stats_service.recount_materialized_counts()
+
+    try:
+        user = make_user()
+        counts = dataclasses.replace(counts, active=counts.active + 1)
+        assert user_stats_service.count_users_by_state() == counts
+
+        user_command_service.suspend_account(user, initiator, 'Cheating')
+        counts = dataclasses.replace(
+            counts, active=counts.active - 1, suspended=counts.suspended + 1
+        )
+        assert user_stats_service.count_users_by_state() == counts
+
+        user_command_service.delete_account(user, initiator, 'Requested')
+        counts = dataclasses.replace(
+            counts, suspended=counts.suspended - 1, deleted=counts.deleted + 1
+        )
+        assert user_stats_service.count_users_by_state() == counts
+
+        assert user_stats_service.recount_materialized_counts() == counts
+    finally:
+        # Other tests change account flags directly, which would make
+        # the materialized counts drift.
+        db.session.execute(delete(DbUserStateCount))
+        db.session.commit()
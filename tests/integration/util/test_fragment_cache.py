@@ -0,0 +1,69 @@
+"""
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import timedelta
+
+from byceps.services.news.signals import item_published
+from byceps.util import fragment_cache
+from byceps.util.fragment_cache_invalidation import NEWS
+
+from tests.helpers import generate_token
+
+
+TTL = timedelta(minutes=1)
+
+
+def test_fragment_is_rendered_only_once(admin_app):
+    key = generate_token()
+    renderer = CountingRenderer()
+
+    html1 = fragment_cache.get_or_render(key, renderer, ttl=TTL)
+    html2 = fragment_cache.get_or_render(key, renderer, ttl=TTL)
+
+    assert html1 == html2 == '<p>1</p>'
+    assert renderer.calls == 1
+
+
+def test_fragment_is_rendered_again_after_invalidation(admin_app):
+    key = generate_token()
+    dependency = generate_token()
+    renderer = CountingRenderer()
+
+    assert get(key, renderer, dependency) == '<p>1</p>'
+    assert get(key, renderer, dependency) == '<p>1</p>'
+
+    fragment_cache.invalidate(dependency)
+
+    assert get(key, renderer, dependency) == '<p>2</p>'
+    assert renderer.calls == 2
+
+
+def test_fragment_is_invalidated_by_signal(admin_app):
+    key = generate_token()
+    renderer = CountingRenderer()
+
+    assert get(key, renderer, NEWS) == '<p>1</p>'
+
+    item_published.send(None, event=None)
+
+    assert get(key, renderer, NEWS) == '<p>2</p>'
+
+
+# helpers
+
+
+def get(key, renderer, dependency):
+    return fragment_cache.get_or_render(
+        key, renderer, ttl=TTL, depends_on=[dependency]
+    )
+
+
+class CountingRenderer:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self) -> str:
+        self.calls += 1
+        return f'<p>{self.calls:d}</p>'
@@ -0,0 +1,66 @@
+"""
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.announce.delivery import build_batched_announcement_requests
+from byceps.services.webhooks.models import (
+    OutgoingWebhook,
+    OutgoingWebhookFormat,
+    WebhookID,
+)
+
+from tests.helpers import generate_uuid
+
+
+def test_texts_combined_into_single_message():
+    webhook = build_webhook(OutgoingWebhookFormat.discord)
+
+    actual = build_batched_announcement_requests(webhook, ['one', 'two'])
+
+    assert [request.data for request in actual] == [
+        {'content': '[Test] one\n[Test] two'},
+    ]
+
+
+def test_texts_split_at_maximum_message_length():
+    webhook = build_webhook(OutgoingWebhookFormat.discord)
+    long_text = 'x' * 1500
+
+    actual = build_batched_announcement_requests(
+        webhook, [long_text, 'short', long_text]
+    )
+
+    assert [request.data for request in actual] == [
+        {'content': f'[Test] {long_text}\n[Test] short'},
+        {'content': f'[Test] {long_text}'},
+    ]
+
+
+def test_texts_sent_separately_for_irc():
+    webhook = build_webhook(
+        OutgoingWebhookFormat.weitersager, extra_fields={'channel': '#test'}
+    )
+
+    actual = build_batched_announcement_requests(webhook, ['one', 'two'])
+
+    assert [request.data for request in actual] == [
+        {'channel': '#test', 'text': '[Test] one'},
+        {'channel': '#test', 'text': '[Test] two'},
+    ]
+
+
+def build_webhook(
+    format_: OutgoingWebhookFormat, *, extra_fields=None
+) -> OutgoingWebhook:
+    return OutgoingWebhook(
+        id=WebhookID(generate_uuid()),
+        event_types=set(),
+        event_filters={},
+        format=format_,
+        text_prefix='[Test] ',
+        extra_fields=extra_fields or {},
+        url='https://webhooks.test/',
+        description=None,
+        enabled=True,
+    )
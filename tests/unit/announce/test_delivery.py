@@ -0,0 +1,199 @@
+"""
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import timedelta
+from http import HTTPStatus
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from byceps.announce import delivery
+from byceps.announce.delivery import deliver, WebhookError
+from byceps.services.webhooks.models import AnnouncementRequest, WebhookID
+
+from tests.helpers import generate_uuid
+
+
+WEBHOOK_ID = WebhookID(generate_uuid())
+
+
+@patch('byceps.announce.delivery.enqueue_at')
+@patch('byceps.announce.delivery._pause_webhook')
+@patch('byceps.announce.delivery._get_remaining_pause', return_value=None)
+def test_all_requests_sent(
+    get_remaining_pause_mock, pause_webhook_mock, enqueue_at_mock
+):
+    sent_texts = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        sent_texts.append(json.loads(request.content)['content'])
+        return httpx.Response(HTTPStatus.NO_CONTENT)
+
+    requests = [build_request('one'), build_request('two')]
+
+    with patch_http_client(handle):
+        deliver(requests)
+
+    assert sent_texts == ['one', 'two']
+    pause_webhook_mock.assert_not_called()
+    enqueue_at_mock.assert_not_called()
+
+
+@patch('byceps.announce.delivery.enqueue_at')
+@patch('byceps.announce.delivery._pause_webhook')
+@patch('byceps.announce.delivery._get_remaining_pause', return_value=None)
+def test_rate_limit_with_retry_after(
+    get_remaining_pause_mock, pause_webhook_mock, enqueue_at_mock
+):
+    def handle(request: httpx.Request) -> httpx.Response:
+        if json.loads(request.content)['content'] == 'one':
+            return httpx.Response(HTTPStatus.NO_CONTENT)
+
+        return httpx.Response(
+            HTTPStatus.TOO_MANY_REQUESTS, headers={'Retry-After': '7.5'}
+        )
+
+    requests = [build_request('one'), build_request('two')]
+
+    with patch_http_client(handle):
+        deliver(requests)
+
+    expected_delay = timedelta(seconds=7.5)
+    pause_webhook_mock.assert_called_once_with(WEBHOOK_ID, expected_delay)
+    assert_delivery_rescheduled(enqueue_at_mock, requests[1:], 2)
+
+
+@pytest.mark.parametrize(
+    ('attempt', 'expected_delay'),
+    [
+        (1, timedelta(seconds=2)),
+        (2, timedelta(seconds=4)),
+        (4, timedelta(seconds=16)),
+    ],
+)
+@patch('byceps.announce.delivery.enqueue_at')
+@patch('byceps.announce.delivery._pause_webhook')
+@patch('byceps.announce.delivery._get_remaining_pause', return_value=None)
+def test_exponential_backoff_on_server_error(
+    get_remaining_pause_mock,
+    pause_webhook_mock,
+    enqueue_at_mock,
+    attempt,
+    expected_delay,
+):
+    def handle(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(HTTPStatus.SERVICE_UNAVAILABLE)
+
+    requests = [build_request('one')]
+
+    with patch_http_client(handle):
+        deliver(requests, attempt)
+
+    pause_webhook_mock.assert_called_once_with(WEBHOOK_ID, expected_delay)
+    assert_delivery_rescheduled(enqueue_at_mock, requests, attempt + 1)
+
+
+@patch('byceps.announce.delivery.enqueue_at')
+@patch('byceps.announce.delivery._pause_webhook')
+@patch('byceps.announce.delivery._get_remaining_pause', return_value=None)
+def test_backoff_on_rate_limit_without_retry_after(
+    get_remaining_pause_mock, pause_webhook_mock, enqueue_at_mock
+):
+    def handle(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(HTTPStatus.TOO_MANY_REQUESTS)
+
+    with patch_http_client(handle):
+        deliver([build_request('one')], 3)
+
+    pause_webhook_mock.assert_called_once_with(WEBHOOK_ID, timedelta(seconds=8))
+
+
+@patch('byceps.announce.delivery.enqueue_at')
+@patch('byceps.announce.delivery._pause_webhook')
+@patch(
+    'byceps.announce.delivery._get_remaining_pause',
+    return_value=timedelta(seconds=5),
+)
+def test_delivery_postponed_while_webhook_is_paused(
+    get_remaining_pause_mock, pause_webhook_mock, enqueue_at_mock
+):
+    def handle(request: httpx.Request) -> httpx.Response:
+        raise AssertionError('No request must be sent while paused.')
+
+    requests = [build_request('one')]
+
+    with patch_http_client(handle):
+        deliver(requests, 2)
+
+    pause_webhook_mock.assert_not_called()
+    # The attempt is not counted as the endpoint has not been called.
+    assert_delivery_rescheduled(enqueue_at_mock, requests, 2)
+
+
+@patch('byceps.announce.delivery.enqueue_at')
+@patch('byceps.announce.delivery._pause_webhook')
+@patch('byceps.announce.delivery._get_remaining_pause', return_value=None)
+def test_delivery_resumed_after_pause(
+    get_remaining_pause_mock, pause_webhook_mock, enqueue_at_mock
+):
+    sent_texts = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        sent_texts.append(json.loads(request.content)['content'])
+        return httpx.Response(HTTPStatus.NO_CONTENT)
+
+    with patch_http_client(handle):
+        deliver([build_request('one')], 2)
+
+    assert sent_texts == ['one']
+    enqueue_at_mock.assert_not_called()
+
+
+@patch('byceps.announce.delivery.enqueue_at')
+@patch('byceps.announce.delivery._pause_webhook')
+@patch('byceps.announce.delivery._get_remaining_pause', return_value=None)
+def test_give_up_after_max_attempts(
+    get_remaining_pause_mock, pause_webhook_mock, enqueue_at_mock
+):
+    def handle(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError('Connection refused', request=request)
+
+    with patch_http_client(handle), pytest.raises(WebhookError):
+        deliver([build_request('one')], delivery.MAX_DELIVERY_ATTEMPTS)
+
+    pause_webhook_mock.assert_not_called()
+    enqueue_at_mock.assert_not_called()
+
+
+# helpers
+
+
+def build_request(text: str) -> AnnouncementRequest:
+    return AnnouncementRequest(
+        webhook_id=WEBHOOK_ID,
+        url='https://webhooks.test/',
+        data={'content': text},
+        expected_response_status_code=HTTPStatus.NO_CONTENT,
+        announce_at=None,
+    )
+
+
+def patch_http_client(handler):
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    return patch(
+        'byceps.announce.delivery._get_http_client', return_value=client
+    )
+
+
+def assert_delivery_rescheduled(
+    enqueue_at_mock, expected_requests, expected_attempt
+) -> None:
+    enqueue_at_mock.assert_called_once()
+    _, func, requests, attempt = enqueue_at_mock.call_args.args
+    assert func == deliver
+    assert requests == expected_requests
+    assert attempt == expected_attempt
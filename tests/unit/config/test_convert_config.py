@@ -15,6 +15,7 @@ from byceps.config.models import (
     MetricsConfig,
     PaymentGatewaysConfig,
     RedisConfig,
+    ShopConfig,
     SmtpConfig,
 )
 
@@ -60,6 +61,7 @@ def test_convert_config():
         ),
         metrics=MetricsConfig(
             enabled=True,
+            request_instrumentation_enabled=False,
         ),
         payment_gateways=PaymentGatewaysConfig(
             paypal=None,
@@ -68,6 +70,10 @@ def test_convert_config():
         redis=RedisConfig(
             url='redis://127.0.0.1:6379/0',
         ),
+        shop=ShopConfig(
+            order_number_block_size=1,
+            release_unused_order_numbers=False,
+        ),
         smtp=SmtpConfig(
             host='localhost',
             port=25,
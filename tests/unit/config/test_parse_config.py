@@ -19,6 +19,7 @@ from byceps.config.models import (
     PaymentGatewaysConfig,
     PaypalConfig,
     RedisConfig,
+    ShopConfig,
     SiteWebAppConfig,
     SmtpConfig,
     StripeConfig,
@@ -64,6 +65,7 @@ def test_parse_config():
                 ),
                 metrics=MetricsConfig(
                     enabled=True,
+                    request_instrumentation_enabled=False,
                 ),
                 payment_gateways=PaymentGatewaysConfig(
                     paypal=PaypalConfig(
@@ -82,6 +84,10 @@ def test_parse_config():
                 redis=RedisConfig(
                     url='redis://127.0.0.1:6379/0',
                 ),
+                shop=ShopConfig(
+                    order_number_block_size=50,
+                    release_unused_order_numbers=True,
+                ),
                 smtp=SmtpConfig(
                     host='smtp-host',
                     port=2525,
@@ -169,6 +175,10 @@ def test_parse_config():
     [redis]
     url = "redis://127.0.0.1:6379/0"
 
+    [shop]
+    order_number_block_size = 50
+    release_unused_order_numbers = true
+
     [smtp]
     host = "smtp-host"
     port = 2525
@@ -210,6 +220,7 @@ def test_parse_config_defaults():
                 ),
                 metrics=MetricsConfig(
                     enabled=False,
+                    request_instrumentation_enabled=False,
                 ),
                 payment_gateways=PaymentGatewaysConfig(
                     paypal=None,
@@ -218,6 +229,10 @@ def test_parse_config_defaults():
                 redis=RedisConfig(
                     url='redis://127.0.0.1:6379/0',
                 ),
+                shop=ShopConfig(
+                    order_number_block_size=1,
+                    release_unused_order_numbers=False,
+                ),
                 smtp=SmtpConfig(
                     host='localhost',
                     port=25,
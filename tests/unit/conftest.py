@@ -22,6 +22,7 @@ from byceps.config.models import (
     MetricsConfig,
     PaymentGatewaysConfig,
     RedisConfig,
+    ShopConfig,
     SmtpConfig,
 )
 from byceps.services.brand.models import Brand, BrandID
@@ -68,6 +69,7 @@ def make_byceps_config():
             ),
             metrics=MetricsConfig(
                 enabled=False,
+                request_instrumentation_enabled=False,
             ),
             payment_gateways=PaymentGatewaysConfig(
                 paypal=None,
@@ -76,6 +78,10 @@ def make_byceps_config():
             redis=RedisConfig(
                 url='redis://127.0.0.1:6379/0',
             ),
+            shop=ShopConfig(
+                order_number_block_size=1,
+                release_unused_order_numbers=False,
+            ),
             smtp=SmtpConfig(
                 host='127.0.0.1',
                 port=25,
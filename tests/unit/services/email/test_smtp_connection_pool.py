@@ -0,0 +1,105 @@
+"""
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from email.message import EmailMessage
+from smtplib import SMTPServerDisconnected
+
+from byceps.config.models import SmtpConfig
+from byceps.services.email.smtp_connection_pool import SmtpConnectionPool
+
+
+SMTP_CONFIG = SmtpConfig(
+    host='localhost',
+    port=2525,
+    starttls=False,
+    use_ssl=False,
+    username=None,
+    password=None,
+    suppress_send=False,
+)
+
+
+def test_connection_is_reused():
+    connections = []
+    pool = build_pool(connections)
+
+    for _ in range(3):
+        pool.send_message(EmailMessage())
+
+    assert len(connections) == 1
+    assert connections[0].sent_message_count == 3
+
+
+def test_connection_is_replaced_after_maximum_messages():
+    connections = []
+    pool = build_pool(connections, max_messages_per_connection=2)
+
+    for _ in range(5):
+        pool.send_message(EmailMessage())
+
+    assert [conn.sent_message_count for conn in connections] == [2, 2, 1]
+    assert [conn.quit_called for conn in connections] == [True, True, False]
+
+
+def test_idle_connection_is_checked_before_reuse():
+    connections = []
+    pool = build_pool(connections, max_idle_seconds=0)
+
+    pool.send_message(EmailMessage())
+    connections[0].noop_status_code = 421
+    pool.send_message(EmailMessage())
+
+    assert len(connections) == 2
+    assert connections[0].closed
+    assert connections[1].sent_message_count == 1
+
+
+def test_message_is_sent_again_after_disconnect():
+    connections = []
+    pool = build_pool(connections)
+
+    pool.send_message(EmailMessage())
+    connections[0].disconnected = True
+    pool.send_message(EmailMessage())
+
+    assert len(connections) == 2
+    assert connections[0].sent_message_count == 1
+    assert connections[1].sent_message_count == 1
+    assert pool.connections_opened == 2
+
+
+# helpers
+
+
+class FakeConnection:
+    def __init__(self):
+        self.sent_message_count = 0
+        self.noop_status_code = 250
+        self.disconnected = False
+        self.quit_called = False
+        self.closed = False
+
+    def send_message(self, message):
+        if self.disconnected:
+            raise SMTPServerDisconnected
+        self.sent_message_count += 1
+
+    def noop(self):
+        return self.noop_status_code, b''
+
+    def quit(self):
+        self.quit_called = True
+
+    def close(self):
+        self.closed = True
+
+
+def build_pool(connections, **kwargs) -> SmtpConnectionPool:
+    def connect(smtp_config):
+        connection = FakeConnection()
+        connections.append(connection)
+        return connection
+
+    return SmtpConnectionPool(SMTP_CONFIG, connect=connect, **kwargs)
@@ -0,0 +1,39 @@
+"""
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.services.metrics.histograms import Histogram
+
+
+HISTOGRAM = Histogram(
+    name='http_request_sql_statements',
+    label_name='endpoint',
+    buckets=(1, 10, 100),
+)
+
+
+def test_serialize():
+    # observations: 1, 5, 250
+    data = {
+        b'board.topic_view:1': b'1',
+        b'board.topic_view:10': b'1',
+        b'board.topic_view:sum': b'256.0',
+        b'board.topic_view:count': b'3',
+    }
+
+    assert list(HISTOGRAM.serialize(data)) == [
+        '# TYPE http_request_sql_statements histogram\n',
+        'http_request_sql_statements_bucket{endpoint="board.topic_view", le="1"} 1\n',
+        'http_request_sql_statements_bucket{endpoint="board.topic_view", le="10"} 2\n',
+        'http_request_sql_statements_bucket{endpoint="board.topic_view", le="100"} 2\n',
+        'http_request_sql_statements_bucket{endpoint="board.topic_view", le="+Inf"} 3\n',
+        'http_request_sql_statements_sum{endpoint="board.topic_view"} 256.0\n',
+        'http_request_sql_statements_count{endpoint="board.topic_view"} 3\n',
+    ]
+
+
+def test_serialize_without_observations():
+    assert list(HISTOGRAM.serialize({})) == [
+        '# TYPE http_request_sql_statements histogram\n',
+    ]
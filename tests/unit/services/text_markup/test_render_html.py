@@ -7,7 +7,10 @@ import pytest
 
 from byceps.byceps_app import BycepsApp
 from byceps.config.models import AppMode
-from byceps.services.text_markup.text_markup_service import render_html
+from byceps.services.text_markup.text_markup_service import (
+    render_html,
+    render_html_bulk,
+)
 
 
 @pytest.fixture(scope='module')
@@ -117,3 +120,12 @@ def test_quote_with_author_whose_name_contains_square_brackets(
     app: BycepsApp, text: str, expected: str
 ):
     assert render_html(text) == expected
+
+
+def test_render_html_bulk(app: BycepsApp):
+    texts = ['[b]one[/b]', 'two', '[b]one[/b]']
+
+    actual = render_html_bulk(texts)
+
+    assert actual == ['<strong>one</strong>', 'two', '<strong>one</strong>']
+    assert actual == [render_html(text) for text in texts]
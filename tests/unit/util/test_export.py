@@ -3,7 +3,12 @@
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from byceps.util.export import serialize_dicts_to_csv, serialize_tuples_to_csv
+from byceps.util.export import (
+    serialize_dicts_to_csv,
+    serialize_dicts_to_json_array,
+    serialize_dicts_to_ndjson,
+    serialize_tuples_to_csv,
+)
 
 
 def test_serialize_dicts_to_csv():
@@ -40,3 +45,50 @@ def test_serialize_tuples_to_csv():
         'Pac-Man,yellow\r\n',
         'Ultraman,white/red\r\n',
     ]
+
+
+def test_serialize_dicts_to_csv_consumes_rows_lazily():
+    def generate_rows():
+        yield {'name': 'Sonic the Hedgehog', 'color': 'blue'}
+        raise AssertionError('Only the first row should have been requested.')
+
+    actual = serialize_dicts_to_csv(['name', 'color'], generate_rows())
+
+    assert next(actual) == 'name,color\r\n'
+    assert next(actual) == 'Sonic the Hedgehog,blue\r\n'
+
+
+def test_serialize_dicts_to_json_array():
+    rows = [
+        {'name': 'Sonic the Hedgehog', 'color': 'blue'},
+        {'name': 'Pac-Man', 'color': 'yellow'},
+    ]
+
+    actual = serialize_dicts_to_json_array(rows)
+
+    assert ''.join(actual) == (
+        '['
+        '{"name": "Sonic the Hedgehog", "color": "blue"}, '
+        '{"name": "Pac-Man", "color": "yellow"}'
+        ']'
+    )
+
+
+def test_serialize_dicts_to_json_array_without_rows():
+    actual = serialize_dicts_to_json_array([])
+
+    assert ''.join(actual) == '[]'
+
+
+def test_serialize_dicts_to_ndjson():
+    rows = [
+        {'name': 'Sonic the Hedgehog', 'color': 'blue'},
+        {'name': 'Pac-Man', 'color': 'yellow'},
+    ]
+
+    actual = serialize_dicts_to_ndjson(rows)
+
+    assert list(actual) == [
+        '{"name": "Sonic the Hedgehog", "color": "blue"}\n',
+        '{"name": "Pac-Man", "color": "yellow"}\n',
+    ]
@@ -0,0 +1,43 @@
+"""
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.util.templating import load_template
+
+
+def greet(name: str) -> str:
+    return f'Hello, {name}!'
+
+
+def shout(name: str) -> str:
+    return f'HEY, {name.upper()}!'
+
+
+def test_same_source_is_compiled_only_once():
+    source = '{{ 1 + 2 }} (cached)'
+
+    template1 = load_template(source)
+    template2 = load_template(source)
+
+    assert template2 is template1
+    assert template2.render() == '3 (cached)'
+
+
+def test_cached_templates_are_separated_by_globals():
+    source = "{{ greet('Alice') }}"
+
+    template1 = load_template(source, template_globals={'greet': greet})
+    template2 = load_template(source, template_globals={'greet': shout})
+
+    assert template1.render() == 'Hello, Alice!'
+    assert template2.render() == 'HEY, ALICE!'
+
+
+def test_unhashable_globals_are_supported():
+    source = '{{ names|join(", ") }}'
+    template_globals = {'names': ['Alice', 'Bob']}
+
+    template = load_template(source, template_globals=template_globals)
+
+    assert template.render() == 'Alice, Bob'